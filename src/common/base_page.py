@@ -1,10 +1,30 @@
-from typing import List
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set
+from selenium.common import ElementNotInteractableException, NoSuchElementException, \
+    StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium import webdriver
+from src.common.command_tracer import CommandTracer
+from src.common.locators import LOCATORS, Locator
+from src.common.observer_wait import ObserverWait
+from src.managers.config_manager import ConfigManager
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Counts DOM mutations since the observer was installed, returns -1 while the document is still loading.
+MUTATION_COUNT_SCRIPT = '''
+if (document.readyState !== 'complete') return -1;
+if (!window.__mutationCounter) {
+    window.__mutationCounter = {count: 0};
+    new MutationObserver(records => window.__mutationCounter.count += records.length).observe(
+        document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return window.__mutationCounter.count;
+'''
 
 
 class BasePage:
@@ -12,20 +32,290 @@ class BasePage:
     This class contains all common elements and functionalities available to all pages.
     """
 
-    def __init__(self, driver: webdriver):
+    def __init__(self, driver: webdriver, cache_elements: Optional[bool] = None):
+        """
+        Initializes the page object.
+        :param driver: The WebDriver instance to interact with the browser.
+        :param cache_elements: Reuse located elements until invalidate_elements is called,
+                               defaults to 'settings.elements.cache' in config.yaml.
+        """
         self.driver = driver
-        self.driver.implicitly_wait(20)
+        self.driver.implicitly_wait(0)
+        # Read per page object, so configuration reloads and override variables set after import apply.
+        conf = ConfigManager()
+        self.timeouts = conf.get_config_value('settings', 'waits', 'timeouts', default={}) or {}
+        self.poll_interval = conf.get_config_value('settings', 'waits', 'poll_interval', default=0.05)
+        self.poll_backoff = conf.get_config_value('settings', 'waits', 'poll_backoff', default=1.5)
+        self.max_poll_interval = conf.get_config_value('settings', 'waits', 'max_poll_interval', default=0.5)
+        self.settle_period = conf.get_config_value('settings', 'waits', 'settle_period', default=0.2)
+        self.wait_backend = conf.get_config_value('settings', 'waits', 'backend', default='polling')
+        if cache_elements is None:
+            cache_elements = conf.get_config_value('settings', 'elements', 'cache', default=True)
+        # Located elements by locator, None while neither the page cache nor an element scope is active.
+        self.element_cache: Optional[Dict[tuple, WebElement]] = {} if cache_elements else None
+        # Locators cached within each open element scope, innermost last.
+        self.element_scopes: List[Set[tuple]] = []
+
+    @contextmanager
+    def element_scope(self):
+        """
+        Caches the elements located within the block, e.g. the fields of a dialog, and forgets them when the block
+        exits, so handles of a closed dialog are never reused. Caching is enabled within the block even when the
+        page cache is disabled.
+        :return: A context manager.
+        """
+        owner = self.element_cache is None
+        if owner:
+            self.element_cache = {}
+        self.element_scopes.append(set())
+        try:
+            yield
+        finally:
+            scoped = self.element_scopes.pop()
+            if owner:
+                self.element_cache = None
+            elif self.element_cache is not None:
+                for locator in scoped:
+                    self.element_cache.pop(locator, None)
+
+    def invalidate_elements(self, *locators) -> None:
+        """
+        Forgets cached elements, to be called when a navigation or a re-render replaces them.
+        :param locators: The locators to forget, every cached element when none is given.
+        :return: None.
+        """
+        if self.element_cache is None:
+            return
+        if not locators:
+            self.element_cache.clear()
+        for locator in locators:
+            self.element_cache.pop(locator, None)
 
-    def click(self, by_locator, wait=20) -> None:
+    def locate(self, by_locator, expected_conditions, wait: Optional[float] = None, operation: str = 'lookup',
+               backend: Optional[str] = None, refresh: bool = False) -> WebElement:
+        """
+        Returns the element of a locator, reusing the cached element while the page cache or an element scope is
+        active and waiting for the expected condition otherwise.
+        :param by_locator: ways to identify one or more specific elements in the DOM.
+        :param expected_conditions: the condition a newly located element must meet.
+        :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param operation: the operation class whose configured timeout is used when wait is None.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
+        :param refresh: locate the element again even if it is cached.
+        :return: web element.
+        """
+        if self.element_cache is None:
+            return self.wait_for(by_locator, expected_conditions, wait, operation, backend)
+        element = None if refresh else self.element_cache.get(by_locator)
+        if element is not None:
+            if isinstance(by_locator, Locator):
+                LOCATORS.record_reuse(by_locator.name)
+            return element
+        element = self.wait_for(by_locator, expected_conditions, wait, operation, backend)
+        self.element_cache[by_locator] = element
+        if self.element_scopes:
+            self.element_scopes[-1].add(by_locator)
+        return element
+
+    def with_element(self, by_locator, expected_conditions, action: Callable[[WebElement], object],
+                     wait: Optional[float] = None, operation: str = 'interaction', backend: Optional[str] = None):
+        """
+        Runs an action on the element of a locator. When the element went stale, or a cached element is not
+        interactable anymore, the element is located again and the action retried once.
+        :param by_locator: ways to identify one or more specific elements in the DOM.
+        :param expected_conditions: the condition a newly located element must meet.
+        :param action: callable receiving the web element.
+        :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param operation: the operation class whose configured timeout is used when wait is None.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
+        :return: the value returned by the action.
+        """
+        cached = self.element_cache is not None and by_locator in self.element_cache
+        element = self.locate(by_locator, expected_conditions, wait, operation, backend)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            pass
+        except ElementNotInteractableException:
+            if not cached:
+                raise
+        if isinstance(by_locator, Locator):
+            LOCATORS.record_reuse(by_locator.name, recovered=True)
+        return action(self.locate(by_locator, expected_conditions, wait, operation, backend, refresh=True))
+
+    def get_timeout(self, operation: str) -> float:
+        """
+        Returns the default timeout of an operation class from the 'settings.waits.timeouts' section of config.yaml.
+        :param operation: The operation class ('interaction', 'lookup', 'navigation', 'absence', 'settle').
+        :return: The timeout in seconds, or the default timeout if the operation class is not configured.
+        """
+        return self.timeouts.get(operation, self.timeouts.get('default', 20))
+
+    def wait_until(self, condition: Callable, wait: Optional[float] = None, operation: str = 'default',
+                   message: str = ''):
+        """
+        Polls a condition with a backoff interval until it returns a truthy value.
+        :param condition: callable receiving the driver, e.g. an expected condition.
+        :param wait: time in seconds to wait until TimeoutException is thrown, defaults to the operation timeout.
+        :param operation: the operation class whose configured timeout is used when wait is None.
+        :param message: the message of the TimeoutException.
+        :return: the truthy value returned by the condition.
+        """
+        timeout = self.get_timeout(operation) if wait is None else wait
+        end_time = time.monotonic() + timeout
+        interval = self.poll_interval
+        with CommandTracer.waiting():
+            while True:
+                try:
+                    value = condition(self.driver)
+                    if value:
+                        return value
+                except IGNORED_EXCEPTIONS:
+                    pass
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(message)
+                CommandTracer.sleep(min(interval, remaining))
+                interval = min(interval * self.poll_backoff, self.max_poll_interval)
+
+    def wait_for(self, by_locator, expected_conditions, wait: Optional[float] = None, operation: str = 'lookup',
+                 backend: Optional[str] = None):
+        """
+        Waits until the locator matches the expected condition, using the selected wait backend.
+        The 'observer' backend waits inside the browser with a MutationObserver in a single round trip,
+        the 'polling' backend polls the condition from the client. Conditions the observer backend does not
+        support, and observer waits interrupted by a navigation, fall back to polling.
+        :param by_locator: ways to identify one or more specific elements in the DOM, or the URL for ec.url_to_be.
+        :param expected_conditions: wait for a certain condition to occur.
+        :param wait: time in seconds to wait until TimeoutException is thrown, defaults to the operation timeout.
+        :param operation: the operation class whose configured timeout is used when wait is None.
+        :param backend: 'polling' or 'observer', defaults to 'settings.waits.backend' in config.yaml.
+        :return: the value returned by the expected condition.
+        """
+        timeout = self.get_timeout(operation) if wait is None else wait
+        message = f'Condition {getattr(expected_conditions, "__name__", expected_conditions)} not met for: {by_locator}'
+        if not isinstance(by_locator, Locator):
+            return self._wait(by_locator, expected_conditions, timeout, operation, backend, message)
+        start = time.perf_counter()
+        try:
+            value, index = self._wait_locator(by_locator, expected_conditions, timeout, operation, backend, message)
+        except TimeoutException:
+            LOCATORS.record(by_locator.name, None, time.perf_counter() - start)
+            raise
+        LOCATORS.record(by_locator.name, index, time.perf_counter() - start)
+        return value
+
+    def _wait_locator(self, locator: Locator, expected_conditions, timeout: float, operation: str,
+                      backend: Optional[str], message: str):
+        """
+        Waits until a registered locator, or one of its fallbacks in order, matches the expected condition.
+        An absence condition is met once the primary locator and every fallback are absent.
+        :param locator: the registered Locator.
+        :param expected_conditions: wait for a certain condition to occur.
+        :param timeout: time in seconds to wait until TimeoutException is thrown.
+        :param operation: the operation class of the wait.
+        :param backend: 'polling' or 'observer', defaults to 'settings.waits.backend' in config.yaml.
+        :param message: the message of the TimeoutException.
+        :return: the value returned by the expected condition and the index of the candidate that matched.
+        """
+        if not locator.fallbacks:
+            return self._wait(locator, expected_conditions, timeout, operation, backend, message), 0
+        conditions = [expected_conditions(candidate) for candidate in locator.candidates]
+        if expected_conditions is ec.invisibility_of_element_located:
+            return self.wait_until(lambda driver: all(c(driver) for c in conditions), timeout, operation, message), 0
+        matched = {}
+
+        def any_candidate(driver):
+            for index, condition in enumerate(conditions):
+                try:
+                    value = condition(driver)
+                except IGNORED_EXCEPTIONS:
+                    continue
+                if value:
+                    matched['index'] = index
+                    return value
+            return False
+
+        return self.wait_until(any_candidate, timeout, operation, message), matched['index']
+
+    def _wait(self, by_locator, expected_conditions, timeout: float, operation: str, backend: Optional[str],
+              message: str):
+        """
+        Waits until a single locator matches the expected condition, with the selected wait backend.
+        :param by_locator: ways to identify one or more specific elements in the DOM, or the URL for ec.url_to_be.
+        :param expected_conditions: wait for a certain condition to occur.
+        :param timeout: time in seconds to wait until TimeoutException is thrown.
+        :param operation: the operation class of the wait.
+        :param backend: 'polling' or 'observer', defaults to 'settings.waits.backend' in config.yaml.
+        :param message: the message of the TimeoutException.
+        :return: the value returned by the expected condition.
+        """
+        if (backend or self.wait_backend) == 'observer' and ObserverWait.supports(expected_conditions, by_locator):
+            start = time.monotonic()
+            try:
+                with CommandTracer.waiting():
+                    return ObserverWait.until(self.driver, by_locator, expected_conditions, timeout)
+            except TimeoutException:
+                raise
+            except WebDriverException:
+                timeout = max(timeout - (time.monotonic() - start), 0)
+        return self.wait_until(expected_conditions(by_locator), timeout, operation, message)
+
+    def wait_present(self, by_locator, expected_conditions=ec.presence_of_element_located,
+                     wait: Optional[float] = None, backend: Optional[str] = None):
+        """
+        Waits until the element whose locator is passed to it matches the expected condition.
+        :param by_locator: ways to identify one or more specific elements in the DOM.
+        :param expected_conditions: wait for a certain condition to occur.
+        :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
+        :return: the value returned by the expected condition, usually the web element.
+        """
+        return self.wait_for(by_locator, expected_conditions, wait, 'lookup', backend)
+
+    def wait_absent(self, by_locator, wait: Optional[float] = None, backend: Optional[str] = None) -> bool:
+        """
+        Waits until no displayed element matches the locator passed to it.
+        :param by_locator: ways to identify one or more specific elements in the DOM.
+        :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
+        :return: True once the element is absent.
+        """
+        return self.wait_for(by_locator, ec.invisibility_of_element_located, wait, 'absence', backend)
+
+    def wait_dom_settled(self, quiet_period: Optional[float] = None, wait: Optional[float] = None) -> None:
+        """
+        Waits until the document is loaded and no DOM mutation happened for the quiet period.
+        :param quiet_period: time in seconds without DOM mutations after which the DOM is considered settled,
+                             defaults to 'settings.waits.settle_period' in config.yaml.
+        :param wait: time in seconds to wait until TimeoutException is thrown.
+        :return: None.
+        """
+        quiet_period = self.settle_period if quiet_period is None else quiet_period
+        state = {'count': None, 'since': time.monotonic()}
+
+        def settled(driver) -> bool:
+            count = driver.execute_script(MUTATION_COUNT_SCRIPT)
+            now = time.monotonic()
+            if count < 0 or count != state['count']:
+                state['count'], state['since'] = count, now
+                return False
+            return now - state['since'] >= quiet_period
+
+        self.wait_until(settled, wait, 'settle', 'DOM did not settle')
+
+    def click(self, by_locator, wait=None, backend=None) -> None:
         """
         performs click on web element whose locator is passed to it.
         :param by_locator: by_locator: ways to identify one or more specific elements in the DOM.
-        :param wait: time in seconds to wait untilTimeoutException is thrown.
+        :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
         :return: None
         """
-        WebDriverWait(self.driver, wait).until(ec.element_to_be_clickable(by_locator)).click()
+        self.with_element(by_locator, ec.element_to_be_clickable, lambda element: element.click(), wait, 'interaction',
+                          backend)
 
-    def assert_element_text(self, by_locator, element_text, wait=20) -> None:
+    def assert_element_text(self, by_locator, element_text, wait=None) -> None:
         """
         asserts comparison of a web element's text with passed in text.
         :param by_locator: ways to identify one or more specific elements in the DOM.
@@ -33,41 +323,43 @@ class BasePage:
         :param wait: time in seconds to wait until TimeoutException is thrown.
         :return: None
         """
-        assert WebDriverWait(self.driver, wait).until(ec.visibility_of_element_located(by_locator)).text == element_text
+        assert self.wait_for(by_locator, ec.visibility_of_element_located, wait, 'lookup').text == element_text
 
-    def enter_text(self, by_locator, text, wait=20) -> None:
+    def enter_text(self, by_locator, text, wait=None, backend=None) -> None:
         """
         performs text entry of the passed in text, in a web element whose locator is passed to it.
         :param by_locator: ways to identify one or more specific elements in the DOM.
         :param text: the text that should be inserted into the element.
         :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
         :return: None
         """
-        WebDriverWait(self.driver, wait).until(ec.visibility_of_element_located(by_locator)).send_keys(text)
+        self.with_element(by_locator, ec.visibility_of_element_located, lambda element: element.send_keys(text), wait,
+                          'interaction', backend)
 
     # This function checks if the web element whose locator has been passed to it, is enabled or not
     # and returns web element if it is enabled.
-    def is_enabled(self, by_locator, wait=20) -> bool:
+    def is_enabled(self, by_locator, wait=None) -> bool:
         """
         check if element is enabled or not.
         :param by_locator: ways to identify one or more specific elements in the DOM.
         :param wait: time in seconds to wait until TimeoutException is thrown.
         :return: true is element is enabled, false otherwise.
         """
-        return WebDriverWait(self.driver, wait).until(ec.visibility_of_element_located(by_locator)).is_displayed()
+        return self.wait_for(by_locator, ec.visibility_of_element_located, wait, 'lookup').is_displayed()
 
     # This function checks if the web element whose locator has been passed to it, is visible or not and returns
     # true or false depending upon its visibility.
-    def is_displayed(self, by_locator, wait=20) -> bool:
+    def is_displayed(self, by_locator, wait=None) -> bool:
         """
         check if element it visible or not.
         :param by_locator: ways to identify one or more specific elements in the DOM.
         :param wait: time in seconds to wait until TimeoutException is thrown.
         :return: true is element is enabled, false otherwise.
         """
-        return WebDriverWait(self.driver, wait).until(ec.visibility_of_element_located(by_locator)).is_displayed()
+        return self.wait_for(by_locator, ec.visibility_of_element_located, wait, 'lookup').is_displayed()
 
-    def hover_to(self, by_locator, wait=20) -> None:
+    def hover_to(self, by_locator, wait=None) -> None:
         """
         moves the mouse pointer over a web element whose locator has been passed to it.
         :param by_locator: ways to identify one or more specific elements in the DOM.
@@ -75,45 +367,64 @@ class BasePage:
         :return: None
         """
         ActionChains(self.driver).move_to_element(
-            WebDriverWait(self.driver, wait).until(ec.visibility_of_element_located(by_locator))).perform()
+            self.wait_for(by_locator, ec.visibility_of_element_located, wait, 'interaction')).perform()
 
-    def find_element(self, by_locator, expected_conditions, wait=20) -> WebElement:
+    def find_element(self, by_locator, expected_conditions, wait=None, backend=None) -> WebElement:
         """
-        locate element in a page.
+        locate element in a page, reusing the cached element while caching is active.
         :param by_locator: ways to identify one or more specific elements in the DOM.
         :param expected_conditions: wait for a certain condition to occur.
         :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
         :return: web element.
         """
-        return WebDriverWait(self.driver, wait).until(expected_conditions(by_locator))
+        return self.locate(by_locator, expected_conditions, wait, 'lookup', backend)
 
-    def find_elements(self, by_locator, expected_conditions, wait=20) -> List[WebElement]:
+    def find_elements(self, by_locator, expected_conditions, wait=None, backend=None) -> List[WebElement]:
         """
         locate elements in a page.
         :param by_locator: ways to identify one or more specific elements in the DOM.
         :param expected_conditions: wait for a certain condition to occur.
         :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
         :return: list of webelements.
         """
-        return WebDriverWait(self.driver, wait).until(expected_conditions(by_locator))
+        return self.wait_for(by_locator, expected_conditions, wait, 'lookup', backend)
 
-    def find_element_by_text(self, text, wait=20) -> WebElement:
+    def find_element_by_text(self, text, wait=None, backend=None, tag='*') -> WebElement:
         """
         Locate element by text.
         :param text: the text that should exist in the element.
         :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
+        :param tag: tag name of the element, e.g. 'button', which spares the browser testing the text of every node.
         :return: web element
         """
-        return WebDriverWait(self.driver, wait).until(
-            ec.element_to_be_clickable((By.XPATH, f'//*[normalize-space(text()) = \'{text}\']')))
+        return self.wait_for(
+            LOCATORS.build(f'text:{tag}', By.XPATH, f'//{tag}[normalize-space(text()) = {self.xpath_literal(text)}]'),
+            ec.element_to_be_clickable, wait, 'lookup', backend)
+
+    @staticmethod
+    def xpath_literal(text: str) -> str:
+        """
+        Quotes a text for use in an XPath expression, including texts containing quotes.
+        :param text: the text to quote.
+        :return: the XPath string literal.
+        """
+        if "'" not in text:
+            return f"'{text}'"
+        if '"' not in text:
+            return f'"{text}"'
+        return "concat('" + "', \"'\", '".join(text.split("'")) + "')"
 
-    def click_element_by_text(self, text) -> None:
+    def click_element_by_text(self, text, tag='*') -> None:
         """
         click element by text value.
         :param text: the text that should exist in the element.
+        :param tag: tag name of the element, e.g. 'button'.
         :return: None
         """
-        self.find_element_by_text(text).click()
+        self.find_element_by_text(text, tag=tag).click()
 
     def click_using_javascript(self, element) -> None:
         """
@@ -139,7 +450,7 @@ class BasePage:
         """
         self.driver.execute_script('window.scrollTo(0, document.body.scrollHeight)')
 
-    def find_element_and_scroll(self, by_locator, expected_conditions, wait=20) -> None:
+    def find_element_and_scroll(self, by_locator, expected_conditions, wait=None) -> None:
         """
         scroll to the element we want to find.
         :param by_locator: ways to identify one or more specific elements in the DOM.
@@ -149,7 +460,7 @@ class BasePage:
         """
         self.driver.execute_script(
             "arguments[0].scrollIntoView();",
-            WebDriverWait(self.driver, wait).until(expected_conditions(by_locator)))
+            self.wait_for(by_locator, expected_conditions, wait, 'lookup'))
 
     def scroll_to_element(self, element) -> None:
         """
@@ -159,11 +470,12 @@ class BasePage:
         """
         self.driver.execute_script("arguments[0].scrollIntoView();", element)
 
-    def wait_for_url(self, url: str, wait: int = 20) -> None:
+    def wait_for_url(self, url: str, wait: Optional[float] = None, backend: Optional[str] = None) -> None:
         """
         Waits until the current URL matches the specified URL.
         :param url: the URL to wait for.
         :param wait: time in seconds to wait until TimeoutException is thrown.
+        :param backend: 'polling' or 'observer', defaults to the configured wait backend.
         :return: None
         """
-        WebDriverWait(self.driver, wait).until(ec.url_to_be(url))
+        self.wait_for(url, ec.url_to_be, wait, 'navigation', backend)
@@ -0,0 +1,187 @@
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Optional
+from selenium import webdriver
+
+
+class CommandRecord(NamedTuple):
+    """
+    A single traced WebDriver command, sleep or launch.
+    """
+    command: str
+    locator: Optional[str]
+    duration: float
+    wait_poll: bool
+    action: Optional[str]
+
+
+class CommandTracer:
+    """
+    Records every WebDriver command sent through the drivers it is attached to, grouped per test.
+    """
+
+    active: Optional['CommandTracer'] = None
+    wait_state = threading.local()
+
+    def __init__(self):
+        """
+        Initializes an empty tracer.
+        """
+        self.tests: Dict[str, List[CommandRecord]] = {}
+        self.current: List[CommandRecord] = self.tests.setdefault('<session>', [])
+
+    def attach(self, driver: webdriver) -> webdriver:
+        """
+        Wraps the command executor of a driver so each command is recorded.
+        :param driver: The WebDriver instance to trace.
+        :return: The same WebDriver instance.
+        """
+        execute = driver.execute
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(driver_command, time.perf_counter() - start, self._locator(params))
+
+        driver.execute = traced_execute
+        return driver
+
+    def record(self, command: str, duration: float, locator: Optional[str] = None) -> None:
+        """
+        Records a command for the running test.
+        :param command: The WebDriver command name, or a pseudo command like 'launch' or 'sleep'.
+        :param duration: The duration of the command in seconds.
+        :param locator: The locator the command used, if any.
+        :return: None.
+        """
+        self.current.append(CommandRecord(
+            command=command, locator=locator, duration=duration,
+            wait_poll=getattr(self.wait_state, 'depth', 0) > 0, action=self._current_action()))
+
+    def start_test(self, nodeid: str) -> None:
+        """
+        Starts collecting records for a test.
+        :param nodeid: The pytest node id of the test.
+        :return: None.
+        """
+        self.current = self.tests.setdefault(nodeid, [])
+
+    def finish_test(self) -> None:
+        """
+        Stops collecting records for the running test, later records are kept outside any test.
+        :return: None.
+        """
+        self.current = self.tests.setdefault('<session>', [])
+
+    @staticmethod
+    @contextmanager
+    def waiting():
+        """
+        Marks the commands sent within the context as wait polls.
+        """
+        CommandTracer.wait_state.depth = getattr(CommandTracer.wait_state, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            CommandTracer.wait_state.depth -= 1
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        """
+        Sleeps and records the sleep with the active tracer, if any.
+        :param seconds: Time in seconds to sleep.
+        :return: None.
+        """
+        time.sleep(seconds)
+        if CommandTracer.active is not None:
+            CommandTracer.active.record('sleep', seconds)
+
+    def export(self) -> Dict[str, list]:
+        """
+        Returns the records as plain lists, e.g. to send them from a pytest-xdist worker to the controller.
+        :return: Dictionary of test node id to its records, each record a list of its fields.
+        """
+        return {nodeid: [list(record) for record in records] for nodeid, records in self.tests.items() if records}
+
+    def merge(self, tests: Dict[str, list]) -> None:
+        """
+        Adds records exported by another tracer.
+        :param tests: Dictionary returned by export().
+        :return: None.
+        """
+        for nodeid, records in tests.items():
+            self.tests.setdefault(nodeid, []).extend(CommandRecord(*record) for record in records)
+
+    def report(self, top: int = 10) -> dict:
+        """
+        Aggregates the records per test and per page object action.
+        :param top: Number of costliest operations to keep per test and for the whole session.
+        :return: The report as a JSON serializable dictionary.
+        """
+        tests = {}
+        operations = defaultdict(lambda: {'count': 0, 'duration_s': 0.0})
+        for nodeid, records in self.tests.items():
+            if not records:
+                continue
+            actions = defaultdict(lambda: {'count': 0, 'duration_s': 0.0})
+            test_operations = defaultdict(lambda: {'count': 0, 'duration_s': 0.0})
+            for record in records:
+                name = f'{record.command} {record.locator}' if record.locator else record.command
+                for stats in (actions[record.action or '<test>'], test_operations[name], operations[name]):
+                    stats['count'] += 1
+                    stats['duration_s'] += record.duration
+            commands = [r for r in records if r.command not in ('sleep', 'launch')]
+            tests[nodeid] = {
+                'round_trips': len(commands),
+                'wait_polls': sum(1 for r in commands if r.wait_poll),
+                'command_time_s': sum(r.duration for r in commands),
+                'sleep_time_s': sum(r.duration for r in records if r.command == 'sleep' and not r.wait_poll),
+                'wait_sleep_time_s': sum(r.duration for r in records if r.command == 'sleep' and r.wait_poll),
+                'launch_time_s': sum(r.duration for r in records if r.command == 'launch'),
+                'actions': dict(actions),
+                'top_operations': self._top(test_operations, top),
+            }
+        return {'tests': tests, 'top_operations': self._top(operations, top)}
+
+    @staticmethod
+    def _top(operations: dict, top: int) -> List[dict]:
+        """
+        Sorts operations by total duration.
+        :param operations: Dictionary of operation name to count and duration.
+        :param top: Number of operations to keep.
+        :return: The costliest operations first.
+        """
+        ranked = sorted(operations.items(), key=lambda item: item[1]['duration_s'], reverse=True)[:top]
+        return [{'operation': name, **stats} for name, stats in ranked]
+
+    @staticmethod
+    def _locator(params: Optional[dict]) -> Optional[str]:
+        """
+        Extracts the locator of a find command.
+        :param params: The command parameters.
+        :return: The locator as '<strategy>=<value>', or None.
+        """
+        if params and 'using' in params and 'value' in params:
+            return f"{params['using']}={params['value']}"
+        return None
+
+    @staticmethod
+    def _current_action() -> Optional[str]:
+        """
+        Finds the outermost page object method in the call stack.
+        :return: The action as '<PageClass>.<method>', or None when called outside a page object.
+        """
+        from src.common.base_page import BasePage
+        action = None
+        frame = sys._getframe(2)
+        while frame is not None:
+            page = frame.f_locals.get('self')
+            if isinstance(page, BasePage):
+                action = f'{type(page).__name__}.{frame.f_code.co_name}'
+            frame = frame.f_back
+        return action
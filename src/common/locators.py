@@ -0,0 +1,237 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from selenium.webdriver.common.by import By
+
+STRATEGIES = {By.ID, By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT, By.NAME, By.TAG_NAME, By.CLASS_NAME,
+              By.CSS_SELECTOR}
+# Strategies whose value is a single token, an XPath or CSS expression here is a declaration error.
+TOKEN_STRATEGIES = {By.ID, By.NAME, By.TAG_NAME, By.CLASS_NAME}
+# One location step with an optional exact @class or @id match, e.g. "//div[@class='a b']" or "/li".
+XPATH_STEP = re.compile(r"(//?)(\*|[a-zA-Z][\w-]*)(?:\[@(class|id)='([^'\"\\]*)'\])?")
+BRACKETS = {']': '[', ')': '('}
+
+
+class Locator(tuple):
+    """
+    A (by, value) locator tuple with a registry name and ordered fallback locators.
+    It can be used wherever Selenium expects a locator tuple, which uses the primary locator only.
+    """
+
+    def __new__(cls, name: str, by: str, value: str, fallbacks: Iterable[Tuple[str, str]] = (),
+                xpath: Optional[str] = None):
+        """
+        Creates the locator.
+        :param name: The registry name, used for the statistics.
+        :param by: The primary locator strategy.
+        :param value: The primary locator value.
+        :param fallbacks: Locators tried in order when the primary one does not match.
+        :param xpath: The XPath the primary locator was compiled from, if any.
+        """
+        locator = super().__new__(cls, (by, value))
+        locator.name = name
+        locator.fallbacks = tuple(tuple(fallback) for fallback in fallbacks)
+        locator.xpath = xpath
+        return locator
+
+    @property
+    def candidates(self) -> List[Tuple[str, str]]:
+        """
+        The primary locator followed by the fallbacks, as plain tuples.
+        :return: The locators in the order they are tried.
+        """
+        return [(self[0], self[1]), *self.fallbacks]
+
+    def __repr__(self) -> str:
+        return f'Locator({self.name}: {self[0]}={self[1]})'
+
+
+class LocatorRegistry:
+    """
+    Validates locators when they are declared, compiles exact class matches from XPath to CSS selectors
+    and keeps per-locator hit and latency counters.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self.locators: Dict[str, Locator] = {}
+        self.stats: Dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def register(self, name: str, by: str, value: str, *fallbacks: Tuple[str, str]) -> Locator:
+        """
+        Declares a locator.
+        :param name: Unique name of the locator, usually the name of the constant holding it.
+        :param by: The locator strategy, one of the By constants.
+        :param value: The locator value.
+        :param fallbacks: (by, value) locators tried in order when the primary one does not match.
+        :return: The validated Locator, with an XPath compiled to CSS when it only matches exact classes.
+        """
+        if name in self.locators:
+            raise ValueError(f"Locator {name} is already registered")
+        locator = self.build(name, by, value, *fallbacks)
+        self.locators[name] = locator
+        return locator
+
+    def build(self, name: str, by: str, value: str, *fallbacks: Tuple[str, str]) -> Locator:
+        """
+        Validates and compiles a locator without registering it, e.g. for locators built at runtime.
+        Lookups are still counted under the name.
+        :param name: Name the statistics are kept under.
+        :param by: The locator strategy, one of the By constants.
+        :param value: The locator value.
+        :param fallbacks: (by, value) locators tried in order when the primary one does not match.
+        :return: The validated Locator.
+        """
+        for candidate_by, candidate_value in ((by, value), *fallbacks):
+            self.validate(name, candidate_by, candidate_value)
+        xpath = None
+        if by == By.XPATH:
+            css = self.compile_css(value)
+            if css is not None:
+                xpath, by, value = value, By.CSS_SELECTOR, css
+        return Locator(name, by, value, fallbacks, xpath)
+
+    @staticmethod
+    def validate(name: str, by: str, value: str) -> None:
+        """
+        Checks that a locator is well-formed.
+        :param name: The locator name, used in the error message.
+        :param by: The locator strategy.
+        :param value: The locator value.
+        :return: None.
+        """
+        if by not in STRATEGIES:
+            raise ValueError(f"Invalid locator {name}: unknown strategy {by!r}")
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"Invalid locator {name}: empty value")
+        if by in TOKEN_STRATEGIES and (value.startswith(('/', '(')) or re.search(r'[\s\[\]=]', value)):
+            raise ValueError(f"Invalid locator {name}: {value!r} is not a plain {by}, use By.XPATH or By.CSS_SELECTOR")
+        if by == By.XPATH and not value.startswith(('/', '(', '.')):
+            raise ValueError(f"Invalid locator {name}: XPath {value!r} must start with '/', '(' or '.'")
+        if by in (By.XPATH, By.CSS_SELECTOR) and not LocatorRegistry._is_balanced(value):
+            raise ValueError(f"Invalid locator {name}: unbalanced brackets or quotes in {value!r}")
+
+    @staticmethod
+    def _is_balanced(value: str) -> bool:
+        """
+        Checks that brackets and parentheses are balanced outside of quoted strings and that quotes are closed.
+        :param value: An XPath or CSS expression.
+        :return: True if the expression is balanced.
+        """
+        stack, quote = [], None
+        for char in value:
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in '\'"':
+                quote = char
+            elif char in '[(':
+                stack.append(char)
+            elif char in BRACKETS:
+                if not stack or stack.pop() != BRACKETS[char]:
+                    return False
+        return not stack and quote is None
+
+    @staticmethod
+    def compile_css(xpath: str) -> Optional[str]:
+        """
+        Compiles an XPath made of descendant and child steps with optional exact @class or @id matches
+        into the equivalent CSS selector.
+        :param xpath: The XPath, e.g. "//ul[@class='menu']/li".
+        :return: The CSS selector, e.g. 'ul[class="menu"] > li', or None if the XPath has no CSS equivalent.
+        """
+        if not xpath.startswith('//'):
+            return None
+        parts, position = [], 0
+        while position < len(xpath):
+            match = XPATH_STEP.match(xpath, position)
+            if match is None:
+                return None
+            axis, tag, attribute, value = match.groups()
+            if parts:
+                parts.append(' > ' if axis == '/' else ' ')
+            parts.append(f'{tag}[{attribute}="{value}"]' if attribute else tag)
+            position = match.end()
+        return ''.join(parts)
+
+    def record(self, name: str, index: Optional[int], duration: float) -> None:
+        """
+        Records a lookup.
+        :param name: The locator name.
+        :param index: Index of the candidate that matched, 0 for the primary locator, None for a timeout.
+        :param duration: Seconds the lookup took, including waiting.
+        :return: None.
+        """
+        with self.lock:
+            stats = self._stats(name)
+            stats['lookups'] += 1
+            stats['total_s'] += duration
+            stats['max_s'] = max(stats['max_s'], duration)
+            if index is None:
+                stats['timeouts'] += 1
+            else:
+                stats['hits'][index] = stats['hits'].get(index, 0) + 1
+                stats['fallback_hits'] += index > 0
+
+    def record_reuse(self, name: str, recovered: bool = False) -> None:
+        """
+        Records an element of the locator reused from a page object's element cache, or re-located after it went
+        stale.
+        :param name: The locator name.
+        :param recovered: True if a reused element went stale and was located again.
+        :return: None.
+        """
+        with self.lock:
+            self._stats(name)['stale_recoveries' if recovered else 'reuses'] += 1
+
+    def merge(self, stats: Dict[str, dict]) -> None:
+        """
+        Adds the statistics recorded by another registry, e.g. in a pytest-xdist worker.
+        :param stats: The stats attribute of the other registry.
+        :return: None.
+        """
+        with self.lock:
+            for name, values in stats.items():
+                merged = self._stats(name)
+                for key, value in values.items():
+                    if key == 'hits':
+                        for index, count in value.items():
+                            merged['hits'][int(index)] = merged['hits'].get(int(index), 0) + count
+                    elif key == 'max_s':
+                        merged['max_s'] = max(merged['max_s'], value)
+                    else:
+                        merged[key] += value
+
+    def _stats(self, name: str) -> dict:
+        """
+        Returns the counters of a locator, creating them on its first use. The lock must be held.
+        :param name: The locator name.
+        :return: The counters.
+        """
+        return self.stats.setdefault(name, {'lookups': 0, 'hits': {}, 'fallback_hits': 0, 'timeouts': 0,
+                                            'reuses': 0, 'stale_recoveries': 0, 'total_s': 0.0, 'max_s': 0.0})
+
+    def report(self) -> List[dict]:
+        """
+        Lists the statistics of every locator that was looked up, slowest on average first.
+        :return: One dictionary per locator with its selector, lookups, hits per candidate, fallback hits,
+                 timeouts, cached element reuses and stale recoveries and latencies in seconds.
+        """
+        with self.lock:
+            stats = {name: dict(values, hits=dict(values['hits'])) for name, values in self.stats.items()}
+        rows = []
+        for name, values in stats.items():
+            locator = self.locators.get(name)
+            rows.append({
+                'locator': name,
+                'selector': f'{locator[0]}={locator[1]}' if locator else None,
+                'mean_s': values['total_s'] / values['lookups'] if values['lookups'] else 0.0,
+                **values,
+            })
+        return sorted(rows, key=lambda row: row['mean_s'], reverse=True)
+
+
+LOCATORS = LocatorRegistry()
@@ -0,0 +1,133 @@
+import weakref
+from typing import Callable
+from selenium import webdriver
+from selenium.common import TimeoutException
+from selenium.webdriver.support import expected_conditions as ec
+
+# Seconds added to the wait timeout for the WebDriver script timeout, so the browser-side timer always fires first.
+SCRIPT_TIMEOUT_MARGIN = 5
+
+# Resolves as soon as the locator matches the condition: checked once, then on every DOM mutation.
+# A 50 ms interval covers changes that do not mutate the DOM, like URL changes and stylesheet-driven visibility.
+OBSERVER_WAIT_SCRIPT = '''
+const [by, value, condition, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const cssMatch = selector => Array.from(document.querySelectorAll(selector));
+const find = () => {
+    switch (by) {
+        case 'xpath': {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+        case 'css selector': return cssMatch(value);
+        case 'id': return cssMatch(`#${CSS.escape(value)}`);
+        case 'name': return cssMatch(`[name="${CSS.escape(value)}"]`);
+        case 'class name': return cssMatch(`.${CSS.escape(value)}`);
+        case 'tag name': return cssMatch(value);
+        case 'link text': return cssMatch('a').filter(e => e.innerText.trim() === value);
+        case 'partial link text': return cssMatch('a').filter(e => e.innerText.includes(value));
+    }
+    return [];
+};
+const visible = e => (e.offsetWidth > 0 || e.offsetHeight > 0 || e.getClientRects().length > 0) &&
+    getComputedStyle(e).visibility !== 'hidden';
+const check = () => {
+    if (condition === 'url') return window.location.href === value ? true : null;
+    const elements = find();
+    const first = elements[0];
+    switch (condition) {
+        case 'present': return first || null;
+        case 'visible': return first && visible(first) ? first : null;
+        case 'clickable': return first && visible(first) && !first.disabled ? first : null;
+        case 'all_present': return elements.length ? elements : null;
+        case 'all_visible': return elements.length && elements.every(visible) ? elements : null;
+        case 'any_visible': {
+            const displayed = elements.filter(visible);
+            return displayed.length ? displayed : null;
+        }
+        case 'absent': return !first || !visible(first) ? true : null;
+    }
+    return null;
+};
+let finished = false, observer = null, interval = null, timer = null;
+const finish = result => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+};
+const poll = () => {
+    const result = check();
+    if (result) finish(result);
+};
+poll();
+if (!finished) {
+    observer = new MutationObserver(poll);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    interval = setInterval(poll, 50);
+    timer = setTimeout(() => finish(null), timeoutMs);
+}
+'''
+
+
+class ObserverWait:
+    """
+    Waits for expected conditions inside the browser with a MutationObserver, in a single WebDriver round trip.
+    """
+
+    CONDITIONS = {
+        ec.presence_of_element_located: 'present',
+        ec.visibility_of_element_located: 'visible',
+        ec.element_to_be_clickable: 'clickable',
+        ec.presence_of_all_elements_located: 'all_present',
+        ec.visibility_of_all_elements_located: 'all_visible',
+        ec.visibility_of_any_elements_located: 'any_visible',
+        ec.invisibility_of_element_located: 'absent',
+        ec.url_to_be: 'url',
+    }
+    script_timeouts = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def supports(expected_conditions: Callable, by_locator) -> bool:
+        """
+        Checks if the expected condition can be evaluated in the browser.
+        :param expected_conditions: the expected_conditions factory, e.g. ec.visibility_of_element_located.
+        :param by_locator: the locator, or the URL for ec.url_to_be.
+        :return: True if the condition is supported, False otherwise.
+        """
+        if expected_conditions not in ObserverWait.CONDITIONS:
+            return False
+        return ObserverWait.CONDITIONS[expected_conditions] == 'url' or isinstance(by_locator, tuple)
+
+    @staticmethod
+    def until(driver: webdriver, by_locator, expected_conditions: Callable, timeout: float):
+        """
+        Waits in the browser until the locator matches the expected condition.
+        :param driver: The WebDriver instance to wait with.
+        :param by_locator: ways to identify one or more specific elements in the DOM, or the URL for ec.url_to_be.
+        :param expected_conditions: the expected_conditions factory, e.g. ec.visibility_of_element_located.
+        :param timeout: time in seconds to wait until TimeoutException is thrown.
+        :return: the web element, list of web elements or True, like the matching expected condition.
+        """
+        condition = ObserverWait.CONDITIONS[expected_conditions]
+        by, value = (None, by_locator) if condition == 'url' else by_locator
+        ObserverWait._ensure_script_timeout(driver, timeout)
+        result = driver.execute_async_script(OBSERVER_WAIT_SCRIPT, by, value, condition, int(timeout * 1000))
+        if not result:
+            raise TimeoutException(f'Condition {condition} not met for: {by_locator}')
+        return result
+
+    @staticmethod
+    def _ensure_script_timeout(driver: webdriver, timeout: float) -> None:
+        """
+        Raises the driver's script timeout when it is too short for the wait, once per driver and value.
+        :param driver: The WebDriver instance.
+        :param timeout: time in seconds of the upcoming wait.
+        :return: None.
+        """
+        required = timeout + SCRIPT_TIMEOUT_MARGIN
+        if ObserverWait.script_timeouts.get(driver, 0) < required:
+            driver.set_script_timeout(required)
+            ObserverWait.script_timeouts[driver] = required
@@ -0,0 +1,165 @@
+import functools
+from typing import Dict, List, Optional
+from selenium import webdriver
+from selenium.common import WebDriverException
+
+# sessionStorage key the browser-side buffers are parked under while the page reloads.
+STORAGE_KEY = '__perfMetrics'
+
+# Installs the PerformanceObserver buffers once per document. Times are absolute (timeOrigin + startTime), so entries
+# of documents replaced by a reload, which are carried over through sessionStorage, stay comparable.
+INSTALL_SCRIPT = '''
+const storageKey = arguments[arguments.length - 1];
+const absolute = t => performance.timeOrigin + t;
+const heap = () => performance.memory ? performance.memory.usedJSHeapSize : null;
+if (!window.__perfMetrics) {
+    const saved = JSON.parse(window.sessionStorage.getItem(storageKey) || 'null');
+    window.sessionStorage.removeItem(storageKey);
+    const metrics = window.__perfMetrics = saved || {marks: [], longTasks: [], events: [], documents: []};
+    const doc = {url: location.href, navigation: null, paints: {}};
+    metrics.documents.push(doc);
+    window.__perfMetricsDocument = () => {
+        const nav = performance.getEntriesByType('navigation')[0];
+        doc.navigation = nav ? {response_end_ms: nav.responseEnd, dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+            load_ms: nav.loadEventEnd, transfer_bytes: nav.transferSize} : null;
+        doc.js_heap_used_bytes = heap();
+    };
+    const observe = (type, handler, options) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(handler))
+                .observe(Object.assign({type: type, buffered: true}, options));
+        } catch (e) {
+            // Entry type not supported by this browser.
+        }
+    };
+    observe('paint', e => doc.paints[e.name] = e.startTime);
+    observe('longtask', e => metrics.longTasks.push([absolute(e.startTime), e.duration]));
+    observe('event', e => metrics.events.push([absolute(e.startTime), e.duration]), {durationThreshold: 16});
+    window.addEventListener('pagehide', () => {
+        window.__perfMetricsDocument();
+        window.sessionStorage.setItem(storageKey, JSON.stringify(metrics));
+    });
+}
+'''
+MARK_SCRIPT = INSTALL_SCRIPT + '''
+const [name, phase] = arguments;
+window.__perfMetrics.marks.push([name, phase, absolute(performance.now()), heap()]);
+'''
+COLLECT_SCRIPT = INSTALL_SCRIPT + '''
+window.__perfMetricsDocument();
+return window.__perfMetrics;
+'''
+
+
+class PerfCollector:
+    """
+    Collects browser-side performance metrics around page object actions of one driver.
+    Actions only leave a mark in the browser; the buffers are read in one batch by collect().
+    """
+
+    active: Optional['PerfCollector'] = None
+    # Metrics of every test of the session by node id, None while collection is disabled.
+    results: Optional[Dict[str, dict]] = None
+
+    def __init__(self, driver: webdriver, budgets: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Initializes the collector.
+        :param driver: The WebDriver whose page object actions are measured.
+        :param budgets: Dictionary of action name to metric name to the maximum allowed value.
+        """
+        self.driver = driver
+        self.budgets = budgets or {}
+        self.depth = 0
+
+    def mark(self, name: str, phase: str) -> None:
+        """
+        Records the start or the end of an action in the browser.
+        Errors are ignored, a dead browser already fails the action itself.
+        :param name: The action name.
+        :param phase: 'start' or 'end'.
+        :return: None.
+        """
+        try:
+            self.driver.execute_script(MARK_SCRIPT, name, phase, STORAGE_KEY)
+        except WebDriverException:
+            pass
+
+    def collect(self) -> dict:
+        """
+        Reads the buffered metrics with a single script call and aggregates them per action.
+        :return: Dictionary with the 'actions' occurrences per action name and the 'documents' loaded,
+                 or with an 'error' if the browser could not be read.
+        """
+        try:
+            raw = self.driver.execute_script(COLLECT_SCRIPT, STORAGE_KEY)
+        except WebDriverException as error:
+            return {'error': str(error).splitlines()[0] if str(error) else type(error).__name__}
+        return {'actions': self._actions(raw), 'documents': raw['documents']}
+
+    def check_budgets(self, metrics: dict) -> List[str]:
+        """
+        Compares the action metrics with the budgets.
+        :param metrics: Metrics returned by collect().
+        :return: One message per exceeded budget, empty if every budget is met.
+        """
+        violations = []
+        for action, occurrences in metrics.get('actions', {}).items():
+            for metric, budget in self.budgets.get(action, {}).items():
+                for occurrence in occurrences:
+                    value = occurrence.get(metric)
+                    if value is not None and value > budget:
+                        violations.append(f'{action}: {metric} {value:.0f} exceeds the budget of {budget}')
+        return violations
+
+    @staticmethod
+    def _actions(raw: dict) -> Dict[str, List[dict]]:
+        """
+        Pairs the start and end marks of every action and attributes long tasks and slow interactions to it.
+        :param raw: The buffers read from the browser.
+        :return: Dictionary of action name to the metrics of each of its occurrences.
+        """
+        actions: Dict[str, List[dict]] = {}
+        started: Dict[str, list] = {}
+        for name, phase, timestamp, heap in raw['marks']:
+            if phase == 'start':
+                started[name] = [timestamp, heap]
+                continue
+            if name not in started:
+                continue
+            start, start_heap = started.pop(name)
+            overlaps = [min(task_start + duration, timestamp) - max(task_start, start)
+                        for task_start, duration in raw['longTasks']
+                        if task_start < timestamp and task_start + duration > start]
+            renders = [duration for event_start, duration in raw['events'] if start <= event_start <= timestamp]
+            actions.setdefault(name, []).append({
+                'duration_ms': timestamp - start,
+                'render_ms': max(renders, default=0.0),
+                'long_task_ms': sum(overlaps),
+                'long_tasks': len(overlaps),
+                'heap_delta_bytes': heap - start_heap if heap is not None and start_heap is not None else None,
+            })
+        return actions
+
+
+def perf_action(method):
+    """
+    Decorates a page object method so it is measured as an action while a PerfCollector is active for its driver.
+    Actions called from within another measured action count towards the outer one only.
+    :param method: The page object method.
+    :return: The decorated method.
+    """
+    # The page is not bound to a local named 'self', so CommandTracer attributes commands to the method, not to this
+    # wrapper.
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        collector = PerfCollector.active
+        if collector is None or collector.driver is not args[0].driver or collector.depth:
+            return method(*args, **kwargs)
+        collector.mark(method.__name__, 'start')
+        collector.depth += 1
+        try:
+            return method(*args, **kwargs)
+        finally:
+            collector.depth -= 1
+            collector.mark(method.__name__, 'end')
+    return wrapper
@@ -0,0 +1,118 @@
+import gzip
+import json
+import os
+import re
+from typing import Dict
+from selenium import webdriver
+
+SNAPSHOT_SUFFIX = '.json.gz'
+SNAPSHOT_NAME = re.compile(r'^[\w.-]+$')
+
+# Reads every localStorage and sessionStorage entry of the current origin.
+CAPTURE_STATE_SCRIPT = '''
+const dump = storage => {
+    const items = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+'''
+# Replaces localStorage and sessionStorage of the current origin with a captured state.
+RESTORE_STATE_SCRIPT = '''
+const [state] = arguments;
+[[window.localStorage, state.local], [window.sessionStorage, state.session]].forEach(([storage, items]) => {
+    storage.clear();
+    Object.entries(items || {}).forEach(([key, value]) => storage.setItem(key, value));
+});
+'''
+
+
+class StateStore:
+    """
+    Keeps named snapshots of the persisted application state, as gzip-compressed JSON files.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initializes the store.
+        :param directory: Directory holding the snapshot files, created on the first save.
+        """
+        self.directory = directory
+        self.states: Dict[str, dict] = {}
+
+    def path(self, name: str) -> str:
+        """
+        Returns the file path of a snapshot.
+        :param name: The snapshot name: letters, digits, '_', '-' and '.'.
+        :return: The path of the snapshot file.
+        """
+        if not SNAPSHOT_NAME.match(name):
+            raise ValueError(f"Invalid snapshot name: {name}")
+        return os.path.join(self.directory, f'{name}{SNAPSHOT_SUFFIX}')
+
+    def exists(self, name: str) -> bool:
+        """
+        Checks if a snapshot was saved.
+        :param name: The snapshot name.
+        :return: True if the snapshot is in memory or on disk, False otherwise.
+        """
+        return name in self.states or os.path.isfile(self.path(name))
+
+    @staticmethod
+    def capture(driver: webdriver) -> dict:
+        """
+        Reads the persisted state of the page the driver is on with a single script call.
+        :param driver: The WebDriver instance.
+        :return: Dictionary with the 'local' and 'session' storage entries.
+        """
+        return driver.execute_script(CAPTURE_STATE_SCRIPT)
+
+    @staticmethod
+    def apply(driver: webdriver, state: dict) -> None:
+        """
+        Writes a captured state into the page the driver is on with a single script call and reloads the page.
+        :param driver: The WebDriver instance.
+        :param state: A state returned by capture().
+        :return: None.
+        """
+        driver.execute_script(RESTORE_STATE_SCRIPT, state)
+        driver.refresh()
+
+    def save(self, name: str, state: dict) -> None:
+        """
+        Stores a state under a name, in memory and on disk. The file is replaced atomically,
+        so parallel workers saving the same snapshot never leave a partial file, and a failed save keeps the
+        previous snapshot.
+        :param name: The snapshot name.
+        :param state: A state returned by capture().
+        :return: None.
+        """
+        path = self.path(name)
+        os.makedirs(self.directory, exist_ok=True)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        try:
+            with gzip.open(temporary, 'wt', encoding='utf-8') as file:
+                json.dump(state, file, separators=(',', ':'))
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self.states[name] = state
+
+    def load(self, name: str) -> dict:
+        """
+        Returns a stored state, reading the snapshot file only the first time.
+        :param name: The snapshot name.
+        :return: The state.
+        """
+        if name not in self.states:
+            path = self.path(name)
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"State snapshot not found: {name}")
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                self.states[name] = json.load(file)
+        return self.states[name]
@@ -0,0 +1,349 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+from src.local_app.server import LocalAppServer
+from src.managers.config_manager import ConfigManager
+from src.managers.driver_manager import DriverManager
+from src.pages.todo_app_page import TodoAppPage
+from src.utils.project import Project
+from src.utils.utils import Utils
+
+SCENARIOS = ['create', 'edit', 'search', 'delete']
+DEFAULT_MIX = {'create': 4, 'edit': 2, 'search': 3, 'delete': 1}
+PERCENTILES = (50, 95, 99)
+# Number of error messages kept in the report, per operation.
+MAX_ERRORS = 5
+
+
+class Sample(NamedTuple):
+    """
+    The outcome of a single timed operation.
+    """
+    operation: str
+    latency: float
+    error: Optional[str]
+
+
+class LoadSession:
+    """
+    One browser session running scenarios against the app and keeping track of the tasks it created.
+    """
+
+    def __init__(self, page: TodoAppPage, rng: random.Random):
+        """
+        Initializes the session.
+        :param page: The TodoAppPage of the session's driver.
+        :param rng: Random generator picking the tasks the scenarios use and generating the names, descriptions
+                    and categories of new tasks.
+        """
+        self.page = page
+        self.rng = rng
+        self.tasks: List[str] = []
+        self.samples: List[Sample] = []
+
+    def timed(self, operation: str, action) -> None:
+        """
+        Runs an action and records its latency, or the error it raised.
+        :param operation: The operation name reported for the action.
+        :param action: Callable performing the operation.
+        :return: None.
+        """
+        start = time.perf_counter()
+        error = None
+        try:
+            action()
+        except Exception as exception:
+            error = f'{type(exception).__name__}: {exception}'.splitlines()[0]
+        self.samples.append(Sample(operation, time.perf_counter() - start, error))
+
+    def run(self, scenario: str) -> None:
+        """
+        Runs a scenario. Scenarios that need an existing task create one first, recorded as 'create'.
+        :param scenario: One of 'create', 'edit', 'search' or 'delete'.
+        :return: None.
+        """
+        if scenario != 'create' and not self.tasks:
+            self.create()
+            if not self.tasks:
+                return
+        getattr(self, scenario)()
+
+    def create(self) -> None:
+        """
+        Creates a task through the task creation form.
+        :return: None.
+        """
+        task_name = Utils.generate_random_string(length=10, rng=self.rng)
+        self.timed('create', lambda: self.page.create_task(
+            task_name=task_name, task_description=Utils.generate_random_string(length=20, rng=self.rng),
+            category=self.rng.choice(['Home', 'Work', 'Personal'])))
+        if self.samples[-1].error is None:
+            self.tasks.append(task_name)
+
+    def edit(self) -> None:
+        """
+        Edits the description of one of the session's tasks.
+        :return: None.
+        """
+        task_name = self.rng.choice(self.tasks)
+
+        def edit():
+            self.page.open_task_options(task_name=task_name)
+            self.page.edit_task_name(task_name=Utils.generate_random_string(length=10, rng=self.rng))
+        self.timed('edit', edit)
+
+    def search(self) -> None:
+        """
+        Searches for one of the session's tasks, then clears the search, recorded as 'clear_search'.
+        :return: None.
+        """
+        task_name = self.rng.choice(self.tasks)
+
+        def search():
+            self.page.search_task(task_name=task_name)
+            # Polls the task list with read_tasks, so the sample measures the search and not a DOM settle period.
+            self.page.wait_until(lambda driver: any(task.name == task_name for task in self.page.read_tasks()),
+                                 operation='lookup', message=f'Task not found by search: {task_name}')
+        self.timed('search', search)
+        self.timed('clear_search', self.page.clear_search)
+
+    def delete(self) -> None:
+        """
+        Deletes one of the session's tasks.
+        :return: None.
+        """
+        task_name = self.tasks.pop(self.rng.randrange(len(self.tasks)))
+        self.timed('delete', lambda: self.page.delete_task(task_name=task_name))
+
+
+class LoadRunner:
+    """
+    Runs a weighted mix of TodoAppPage scenarios across concurrent browser sessions and reports
+    throughput and latency percentiles per operation.
+    """
+
+    def __init__(self, browser: str, url: str, sessions: int = 4, mix: Optional[Dict[str, float]] = None,
+                 duration: Optional[float] = 60, iterations: Optional[int] = None, profile: str = 'ci-fast',
+                 seed: Optional[int] = None):
+        """
+        Initializes the runner.
+        :param browser: The browser type to launch ('chrome', 'firefox', 'edge', 'brave').
+        :param url: The URL of the Todo app.
+        :param sessions: Number of concurrent browser sessions.
+        :param mix: Dictionary of scenario name to relative weight, defaults to DEFAULT_MIX.
+        :param duration: Seconds to run for, None to run until the iterations are done.
+        :param iterations: Total number of scenarios to run across all sessions, None to run for the duration.
+        :param profile: Browser option profile from config.yaml, headless by default.
+        :param seed: Seed of the scenario choice and of the generated tasks, for reproducible runs.
+        """
+        mix = mix or DEFAULT_MIX
+        unknown = set(mix) - set(SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unsupported scenarios: {', '.join(sorted(unknown))}")
+        if duration is None and iterations is None:
+            raise ValueError("Either a duration or an iteration count is required")
+        self.browser = browser
+        self.url = url
+        self.sessions = sessions
+        self.mix = {scenario: weight for scenario, weight in mix.items() if weight > 0}
+        self.duration = duration
+        self.iterations = iterations
+        self.profile = profile
+        self.seed = seed
+        self.started = 0
+        self.lock = threading.Lock()
+
+    def run(self) -> dict:
+        """
+        Launches the sessions, runs the scenarios until the duration or the iterations are exhausted
+        and quits the sessions.
+        :return: The report, see report().
+        """
+        DriverManager.get_executable_path(self.browser)
+        profile_root = tempfile.mkdtemp(prefix='todo-load-')
+        ready = threading.Barrier(self.sessions)
+        try:
+            with ThreadPoolExecutor(max_workers=self.sessions, thread_name_prefix='load-session') as executor:
+                futures = [executor.submit(self._session, index, ready, profile_root)
+                           for index in range(self.sessions)]
+                results = [future.result() for future in futures]
+        finally:
+            shutil.rmtree(profile_root, ignore_errors=True)
+        samples = [sample for session_samples, _ in results for sample in session_samples]
+        elapsed = max(session_elapsed for _, session_elapsed in results)
+        return self.report(samples, elapsed)
+
+    def _session(self, index: int, ready: threading.Barrier, profile_root: str):
+        """
+        Runs one session: launches its driver, waits for every session to be ready, then runs scenarios.
+        :param index: Index of the session, used to derive its random seed.
+        :param ready: Barrier every session passes once its driver is launched.
+        :param profile_root: Directory holding the browser profiles of the sessions.
+        :return: The session's samples and its running time in seconds.
+        """
+        try:
+            driver = DriverManager.init_driver(
+                browser=self.browser, profile=self.profile,
+                user_data_dir=DriverManager.create_user_data_dir(profile_root))
+        except Exception:
+            ready.abort()
+            raise
+        try:
+            driver.get(self.url)
+            ready.wait()
+            rng = random.Random(None if self.seed is None else self.seed + index)
+            session = LoadSession(TodoAppPage(driver=driver), rng)
+            scenarios, weights = list(self.mix), list(self.mix.values())
+            start = time.perf_counter()
+            deadline = None if self.duration is None else start + self.duration
+            while self._next_iteration(deadline):
+                session.run(rng.choices(scenarios, weights)[0])
+            return session.samples, time.perf_counter() - start
+        finally:
+            driver.quit()
+
+    def _next_iteration(self, deadline: Optional[float]) -> bool:
+        """
+        Claims the next iteration for a session.
+        :param deadline: perf_counter value after which no iteration starts, or None.
+        :return: True if the session should run another scenario, False otherwise.
+        """
+        if deadline is not None and time.perf_counter() >= deadline:
+            return False
+        with self.lock:
+            if self.iterations is not None and self.started >= self.iterations:
+                return False
+            self.started += 1
+            return True
+
+    def report(self, samples: List[Sample], elapsed: float) -> dict:
+        """
+        Aggregates the samples per operation.
+        :param samples: The samples of all sessions.
+        :param elapsed: Seconds the longest session ran scenarios for.
+        :return: The report as a JSON serializable dictionary.
+        """
+        operations = {}
+        for operation in sorted({sample.operation for sample in samples}):
+            operation_samples = [sample for sample in samples if sample.operation == operation]
+            operations[operation] = self._statistics(operation_samples, elapsed)
+        return {
+            'browser': self.browser,
+            'url': self.url,
+            'profile': self.profile,
+            'sessions': self.sessions,
+            'mix': self.mix,
+            'elapsed_s': elapsed,
+            'operations': operations,
+            'total': self._statistics(samples, elapsed),
+        }
+
+    @staticmethod
+    def _statistics(samples: List[Sample], elapsed: float) -> dict:
+        """
+        Computes the throughput and latency percentiles of successful samples.
+        :param samples: The samples to aggregate.
+        :param elapsed: Seconds the samples were collected over.
+        :return: Dictionary of statistics, latencies in seconds.
+        """
+        latencies = sorted(sample.latency for sample in samples if sample.error is None)
+        errors = [sample.error for sample in samples if sample.error is not None]
+        statistics = {
+            'count': len(latencies),
+            'errors': len(errors),
+            'throughput_per_s': len(latencies) / elapsed if elapsed else 0.0,
+            'mean_s': sum(latencies) / len(latencies) if latencies else None,
+            'max_s': latencies[-1] if latencies else None,
+        }
+        for percentile in PERCENTILES:
+            statistics[f'p{percentile}_s'] = LoadRunner.percentile(latencies, percentile)
+        statistics['error_samples'] = sorted(set(errors))[:MAX_ERRORS]
+        return statistics
+
+    @staticmethod
+    def percentile(latencies: List[float], percentile: float) -> Optional[float]:
+        """
+        Computes a percentile with the nearest-rank method.
+        :param latencies: Sorted latencies.
+        :param percentile: The percentile, between 0 and 100.
+        :return: The latency at the percentile, or None if there are no latencies.
+        """
+        if not latencies:
+            return None
+        rank = max(int(-(-percentile * len(latencies) // 100)), 1)
+        return latencies[rank - 1]
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parses a scenario mix given as 'create=4,edit=2,search=3,delete=1'.
+    :param value: The mix string.
+    :return: Dictionary of scenario name to weight.
+    """
+    mix = {}
+    for part in value.split(','):
+        scenario, _, weight = part.partition('=')
+        mix[scenario.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def main() -> None:
+    """
+    Runs the load generator and writes its JSON report:
+        python -m src.load.runner --local-app --sessions 8 --duration 120
+    """
+    conf = ConfigManager()
+    parser = argparse.ArgumentParser(description='Drive concurrent TodoAppPage sessions against the Todo app.')
+    parser.add_argument('--browser', default='chrome', help='Browser type: chrome, firefox, edge, brave.')
+    parser.add_argument('--profile', default=conf.get_config_value('settings', 'load', 'profile', default='ci-fast'),
+                        help='Browser option profile from config.yaml.')
+    parser.add_argument('--sessions', type=int,
+                        default=conf.get_config_value('settings', 'load', 'sessions', default=4),
+                        help='Number of concurrent browser sessions.')
+    parser.add_argument('--mix', type=parse_mix,
+                        default=conf.get_config_value('settings', 'load', 'mix', default=None),
+                        help="Scenario weights, e.g. 'create=4,edit=2,search=3,delete=1'.")
+    parser.add_argument('--duration', type=float,
+                        default=conf.get_config_value('settings', 'load', 'duration', default=60),
+                        help='Seconds to run for.')
+    parser.add_argument('--iterations', type=int, default=None,
+                        help='Total number of scenarios to run, instead of a duration.')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed of the scenario choice and of the generated tasks.')
+    parser.add_argument('--local-app', action='store_true', help='Run against the bundled local stand-in app.')
+    parser.add_argument('--report', default=os.path.join('reports', 'load.json'), help='Path of the JSON report.')
+    args = parser.parse_args()
+    server = None
+    url = conf.get_config_value('settings', 'login', 'url', default=None)
+    if args.local_app:
+        server = LocalAppServer(
+            host=conf.get_config_value('settings', 'local_app', 'host', default='127.0.0.1')).start()
+        url = server.url
+    try:
+        runner = LoadRunner(browser=args.browser, url=url, sessions=args.sessions, mix=args.mix,
+                            duration=None if args.iterations else args.duration, iterations=args.iterations,
+                            profile=args.profile, seed=args.seed)
+        report = runner.run()
+    finally:
+        if server is not None:
+            server.stop()
+    report_path = os.path.join(Project.get_rootpath(), args.report)
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, 'w') as file:
+        json.dump(report, file, indent=2)
+    for operation, statistics in report['operations'].items():
+        print(f"{operation:8s} {statistics['count']:6d} ok {statistics['errors']:4d} errors "
+              f"{statistics['throughput_per_s']:7.2f}/s  p50 {statistics['p50_s'] or 0:.3f}s  "
+              f"p95 {statistics['p95_s'] or 0:.3f}s  p99 {statistics['p99_s'] or 0:.3f}s")
+    print(f'Report written to {report_path}')
+
+
+if __name__ == '__main__':
+    main()
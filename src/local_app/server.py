@@ -0,0 +1,112 @@
+import argparse
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+INDEX_FILE = 'index.html'
+
+
+class LocalAppRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves the static files of the stand-in app, falling back to index.html for client-side routes like /add.
+    """
+
+    def send_head(self):
+        """
+        Rewrites requests for paths that are not static files to index.html before serving them.
+        """
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.path = f'/{INDEX_FILE}'
+        return super().send_head()
+
+    def end_headers(self):
+        """
+        Disables caching, so every navigation gets the current version of the app.
+        """
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def log_message(self, format, *args) -> None:
+        """
+        Silences the per-request access log.
+        """
+
+
+class LocalAppServer:
+    """
+    In-process HTTP server serving the local stand-in of the Todo app.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        """
+        Initializes the server without starting it.
+        :param host: The interface to listen on.
+        :param port: The port to listen on, 0 picks a free port.
+        """
+        self.host = host
+        self.port = port
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        The root URL of the running app.
+        :return: The URL, e.g. 'http://127.0.0.1:51234/'.
+        """
+        return f'http://{self.host}:{self.port}/'
+
+    def start(self) -> 'LocalAppServer':
+        """
+        Starts serving in a daemon thread.
+        :return: The running server.
+        """
+        handler = partial(LocalAppRequestHandler, directory=STATIC_DIR)
+        self.httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='local-app-server', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server and waits for its thread to exit.
+        :return: None.
+        """
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.thread.join()
+            self.httpd = None
+
+    def __enter__(self) -> 'LocalAppServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """
+    Serves the stand-in app until interrupted:
+        python -m src.local_app.server --port 8080
+    """
+    parser = argparse.ArgumentParser(description='Serve the local stand-in of the Todo app.')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1).')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080).')
+    args = parser.parse_args()
+    server = LocalAppServer(host=args.host, port=args.port).start()
+    print(f'Serving the Todo app at {server.url}')
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
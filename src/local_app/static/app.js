@@ -0,0 +1,269 @@
+/*
+ * Local stand-in of the React Todo app. It renders the DOM structure, class names and persisted state
+ * (localStorage key "user") that the TodoAppPage locators and scripts rely on, without any network access.
+ */
+(function () {
+    'use strict';
+
+    const STORAGE_KEY = 'user';
+    const BUTTON_CLASS = 'MuiButtonBase-root MuiButton-root MuiButton-text MuiButton-textPrimary ' +
+        'MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root MuiButton-text MuiButton-textPrimary ' +
+        'MuiButton-sizeMedium MuiButton-textSizeMedium';
+    const CLASSES = {
+        avatar: 'MuiAvatar-root MuiAvatar-circular MuiAvatar-colorDefault css-1f7m2mg',
+        counter: ' css-eh0jb8',
+        addTaskButton: `${BUTTON_CLASS}  css-13dw26a`,
+        createTaskButton: `${BUTTON_CLASS} css-vbgh04`,
+        dialogButton: `${BUTTON_CLASS} css-1yt8in3`,
+        deleteButton: 'MuiButtonBase-root MuiButton-root MuiButton-text MuiButton-textError MuiButton-sizeMedium ' +
+            'MuiButton-textSizeMedium MuiButton-root MuiButton-text MuiButton-textError MuiButton-sizeMedium ' +
+            'MuiButton-textSizeMedium css-1s4rms',
+        categorySelect: 'MuiInputBase-root MuiOutlinedInput-root MuiInputBase-colorPrimary ' +
+            'MuiInputBase-formControl css-9t65zx',
+        menuList: 'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9',
+        profileMenuList: 'MuiList-root MuiList-padding MuiMenu-list css-1ymv12a',
+        profileMenuItem: 'MuiButtonBase-root MuiMenuItem-root MuiMenuItem-gutters MuiMenuItem-root ' +
+            'MuiMenuItem-gutters css-w1k5yy',
+        menuItem: 'MuiButtonBase-root MuiMenuItem-root MuiMenuItem-gutters MuiMenuItem-root ' +
+            'MuiMenuItem-gutters css-1km1ehz',
+        search: 'MuiInputBase-input MuiOutlinedInput-input MuiInputBase-inputAdornedStart css-zhq0ju',
+        taskContainer: 'TaskContainer css-1vzn3uu',
+        taskName: 'css-18hlvm3',
+        taskDescription: 'css-1sarz7y',
+        taskOptions: 'MuiButtonBase-root MuiIconButton-root MuiIconButton-sizeMedium css-1rvh9qm',
+    };
+    const DEFAULT_CATEGORIES = [
+        {id: '1', name: 'Home', emoji: '🏠', color: '#1a8fff'},
+        {id: '2', name: 'Work', emoji: '🏢', color: '#ff9518'},
+        {id: '3', name: 'Personal', emoji: '👤', color: '#e57cd8'},
+        {id: '4', name: 'Health/Fitness', emoji: '💪', color: '#ff4e4e'},
+        {id: '5', name: 'Education', emoji: '📚', color: '#00ce8f'},
+    ];
+
+    const root = document.getElementById('root');
+    let state = load();
+    let search = '';
+    let overlay = null;
+
+    function load() {
+        const stored = JSON.parse(window.localStorage.getItem(STORAGE_KEY) || 'null') || {};
+        const loaded = {name: 'User', createdAt: new Date().toISOString(), tasks: [], categories: DEFAULT_CATEGORIES};
+        Object.assign(loaded, stored);
+        window.localStorage.setItem(STORAGE_KEY, JSON.stringify(loaded));
+        return loaded;
+    }
+
+    function save() {
+        window.localStorage.setItem(STORAGE_KEY, JSON.stringify(state));
+    }
+
+    function newId() {
+        return window.crypto.randomUUID ? window.crypto.randomUUID() : `${Date.now()}-${Math.random()}`;
+    }
+
+    function el(tag, attributes, ...children) {
+        const element = document.createElement(tag);
+        Object.entries(attributes || {}).forEach(([key, value]) => {
+            if (key.startsWith('on')) {
+                element.addEventListener(key.slice(2), value);
+            } else if (key === 'className') {
+                element.setAttribute('class', value);
+            } else {
+                element.setAttribute(key, value);
+            }
+        });
+        children.flat().forEach(child => element.append(child));
+        return element;
+    }
+
+    function navigate(path) {
+        window.history.pushState({}, '', path);
+        closeOverlay();
+        render();
+    }
+
+    function closeOverlay() {
+        if (overlay) {
+            overlay.remove();
+            overlay = null;
+        }
+    }
+
+    function openOverlay(element) {
+        closeOverlay();
+        overlay = element;
+        document.body.append(overlay);
+    }
+
+    function openMenu(listClass, items) {
+        const list = el('ul', {className: listClass, role: 'menu'}, items);
+        openOverlay(el('div', {className: 'MuiPopover-root MuiMenu-root', onclick: event => {
+            if (event.target === event.currentTarget) closeOverlay();
+        }}, el('div', {className: 'MuiPaper-root MuiMenu-paper'}, list)));
+    }
+
+    function menuItem(className, label, onclick) {
+        return el('li', {className: className, role: 'menuitem', tabindex: '0', onclick: onclick}, label);
+    }
+
+    function openProfileMenu() {
+        const labels = [['Tasks', () => navigate('/')], ['Add Task', () => navigate('/add')],
+            ['Categories', closeOverlay], ['Settings', closeOverlay]];
+        openMenu(CLASSES.profileMenuList, labels.map(([label, action]) =>
+            menuItem(CLASSES.profileMenuItem, label, action)));
+    }
+
+    function openTaskMenu(task) {
+        const update = changes => {
+            Object.assign(task, changes);
+            save();
+            closeOverlay();
+            renderList();
+        };
+        const items = [
+            ['Mark as done', () => update({done: !task.done})],
+            ['Pin', () => update({pinned: !task.pinned})],
+            ['Select', closeOverlay],
+            ['Task details', closeOverlay],
+            ['Share', closeOverlay],
+            ['Copy name', closeOverlay],
+            ['Edit', () => openEditDialog(task)],
+            ['Duplicate', () => {
+                state.tasks.push(Object.assign({}, task, {id: newId(), date: new Date().toISOString()}));
+                update({});
+            }],
+            ['Delete', () => openDeleteDialog(task)],
+        ];
+        openMenu(CLASSES.menuList, items.map(([label, action]) => menuItem(CLASSES.menuItem, label, action)));
+    }
+
+    function openDialog(...children) {
+        openOverlay(el('div', {className: 'MuiDialog-root', role: 'dialog'},
+            el('div', {className: 'MuiDialog-paper'}, children)));
+    }
+
+    function openEditDialog(task) {
+        const name = el('input', {value: task.name});
+        const description = el('textarea', {}, task.description || '');
+        openDialog(
+            el('h2', {}, 'Edit Task'), name, description,
+            el('div', {},
+                el('button', {className: CLASSES.dialogButton, onclick: closeOverlay}, 'Cancel'),
+                el('button', {className: CLASSES.dialogButton, onclick: () => {
+                    task.name = name.value;
+                    task.description = description.value;
+                    task.lastSave = new Date().toISOString();
+                    save();
+                    closeOverlay();
+                    renderList();
+                }}, 'Save')));
+    }
+
+    function openDeleteDialog(task) {
+        openDialog(
+            el('h2', {}, 'Are you sure you want to delete the task?'),
+            el('div', {},
+                el('button', {className: CLASSES.dialogButton, onclick: closeOverlay}, 'Cancel'),
+                el('button', {className: CLASSES.deleteButton, onclick: () => {
+                    state.tasks = state.tasks.filter(t => t.id !== task.id);
+                    save();
+                    closeOverlay();
+                    render();
+                }}, 'Delete')));
+    }
+
+    function header() {
+        return el('header', {},
+            el('h1', {}, 'Todo App'),
+            el('div', {className: CLASSES.avatar, onclick: openProfileMenu}, state.name.charAt(0)));
+    }
+
+    function taskElement(task) {
+        const categories = (task.category || []).map(category =>
+            el('div', {className: 'MuiChip-root'}, el('span', {className: 'MuiChip-label'}, category.name)));
+        return el('div', {className: 'TaskWrapper'},
+            el('div', {className: `${CLASSES.taskContainer}${task.done ? ' done' : ''}`,
+                style: `border-color: ${task.color}`},
+                el('div', {},
+                    el('h3', {className: CLASSES.taskName}, task.name),
+                    el('p', {className: CLASSES.taskDescription}, el('div', {}, task.description || '')),
+                    el('div', {}, categories)),
+                el('button', {className: CLASSES.taskOptions, 'aria-label': 'Task Menu',
+                    onclick: () => openTaskMenu(task)}, '⋮')));
+    }
+
+    function visibleTasks() {
+        const term = search.toLowerCase();
+        const tasks = state.tasks.filter(task => !term || task.name.toLowerCase().includes(term) ||
+            (task.description || '').toLowerCase().includes(term));
+        return tasks.filter(t => t.pinned).concat(tasks.filter(t => !t.pinned));
+    }
+
+    function renderList() {
+        const list = document.getElementById('task-list');
+        const counter = document.getElementById('task-counter');
+        if (!list) return;
+        list.replaceChildren(...visibleTasks().map(taskElement));
+        counter.textContent = String(state.tasks.filter(task => !task.done).length);
+    }
+
+    function homeView() {
+        const searchInput = el('input', {className: CLASSES.search, placeholder: 'Search for task...',
+            value: search, oninput: event => {
+                search = event.target.value;
+                renderList();
+            }});
+        return el('main', {},
+            el('p', {}, 'You have ', el('span', {id: 'task-counter', className: CLASSES.counter}, '0'),
+                ' unfinished tasks'),
+            searchInput,
+            el('div', {id: 'task-list'}),
+            el('button', {className: CLASSES.addTaskButton, onclick: () => navigate('/add')}, 'Add Task'));
+    }
+
+    function addTaskView() {
+        const selected = [];
+        const name = el('input', {placeholder: 'Task Name'});
+        const description = el('textarea', {placeholder: 'Task Description'});
+        const categoryLabel = el('div', {}, 'Category');
+        const categorySelect = el('div', {className: CLASSES.categorySelect, role: 'button', onclick: () => {
+            openMenu(CLASSES.menuList, state.categories.map(category => {
+                const item = menuItem(CLASSES.menuItem, `${category.emoji || ''} ${category.name}`.trim(), () => {
+                    const index = selected.findIndex(c => c.id === category.id);
+                    if (index >= 0) {
+                        selected.splice(index, 1);
+                    } else {
+                        selected.push(category);
+                    }
+                    item.setAttribute('aria-selected', String(index < 0));
+                    categoryLabel.textContent = selected.map(c => c.name).join(', ') || 'Category';
+                });
+                item.setAttribute('aria-selected', String(selected.some(c => c.id === category.id)));
+                return item;
+            }));
+        }}, categoryLabel);
+        const create = el('button', {className: CLASSES.createTaskButton, type: 'button', onclick: () => {
+            if (!name.value) return;
+            state.tasks.push({
+                id: newId(), done: false, pinned: false, name: name.value, description: description.value,
+                color: '#b624ff', date: new Date().toISOString(), category: selected.slice(),
+            });
+            save();
+            navigate('/');
+        }}, 'Create Task');
+        return el('main', {}, el('h2', {}, 'Add New Task'), el('form', {onsubmit: e => e.preventDefault()},
+            name, description, categorySelect, create));
+    }
+
+    function render() {
+        const view = window.location.pathname === '/add' ? addTaskView() : homeView();
+        root.replaceChildren(header(), view);
+        renderList();
+    }
+
+    document.addEventListener('keydown', event => {
+        if (event.key === 'Escape') closeOverlay();
+    });
+    window.addEventListener('popstate', render);
+    render();
+})();
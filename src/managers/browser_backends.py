@@ -0,0 +1,74 @@
+import importlib
+import threading
+from typing import Callable, Dict, List, Set, Union
+from selenium import webdriver
+
+# Launches a WebDriver from the option profile settings.
+Launcher = Callable[[dict], webdriver]
+
+
+class BackendRegistry:
+    """
+    Maps browser names to the functions launching them. A backend is registered as a 'module:function' path,
+    imported the first time the browser is launched, so a run only imports the modules of the browsers it uses.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self.entries: Dict[str, Union[str, Launcher]] = {}
+        # Names of the backends whose browser runs on another machine.
+        self.remote: Set[str] = set()
+        self.lock = threading.Lock()
+
+    def register(self, name: str, launcher: Union[str, Launcher], local: bool = True) -> None:
+        """
+        Registers a backend, replacing any backend registered under the same name.
+        :param name: The browser name, e.g. 'chrome'.
+        :param launcher: The launch function, or its 'module:function' path to import on first use.
+        :param local: False if the browser runs on another machine, which opts it out of the features working on
+                      the local browser process: profile templates and network interception.
+        :return: None.
+        """
+        with self.lock:
+            self.entries[name] = launcher
+            if local:
+                self.remote.discard(name)
+            else:
+                self.remote.add(name)
+
+    def is_local(self, name: str) -> bool:
+        """
+        Checks if a backend launches its browser on this machine.
+        :param name: The browser name.
+        :return: False for backends registered with local=False.
+        """
+        return name not in self.remote
+
+    @property
+    def names(self) -> List[str]:
+        """
+        The registered browser names.
+        :return: The names in registration order.
+        """
+        return list(self.entries)
+
+    def get(self, name: str) -> Launcher:
+        """
+        Resolves a backend, importing its module on the first call.
+        :param name: The browser name.
+        :return: The launch function.
+        """
+        with self.lock:
+            if name not in self.entries:
+                raise ValueError(f"Unsupported browser: {name}")
+            launcher = self.entries[name]
+            if isinstance(launcher, str):
+                module, _, attribute = launcher.partition(':')
+                launcher = self.entries[name] = getattr(importlib.import_module(module), attribute)
+            return launcher
+
+
+# The local browsers are registered by src.managers.driver_manager.
+BACKENDS = BackendRegistry()
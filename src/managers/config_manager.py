@@ -1,42 +1,168 @@
+import copy
+import threading
+import time
 import yaml
 import os
+from typing import Dict, List, Optional, Tuple
 
 from src.utils.project import Project
 
 FILE_NAME = 'config.yaml'
+# libyaml's parser when PyYAML was built with it, several times faster than the pure-Python one.
+LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Path of a YAML file merged over config.yaml, e.g. the settings of one CI job or worker.
+OVERRIDE_FILE_VARIABLE = 'CONFIG_OVERRIDE_FILE'
+# Variables named CONFIG__<KEY>__<KEY>... override single values, e.g. CONFIG__SETTINGS__DRIVER__POOL_SIZE=0.
+# The value is parsed as YAML, so numbers, booleans and lists keep their type. Keys match the existing keys regardless
+# of case, e.g. CONFIG__SETTINGS__REMOTE__CAPABILITIES__BROWSERNAME sets browserName; keys that do not exist yet are
+# added in lower case.
+OVERRIDE_PREFIX = 'CONFIG__'
+# Seconds between checks of the files and environment for changes.
+RELOAD_CHECK_INTERVAL = 1.0
+MISSING = object()
 
 
 class ConfigManager:
     """
     Manages the configuration settings from a YAML file.
+    The configuration is parsed once per process and shared by every instance; it is parsed again only when
+    config.yaml, the override file or the override variables change.
     """
 
+    _lock = threading.Lock()
+    # Shared state per configuration file: the signature it was loaded with, the merged configuration,
+    # the memoized lookups and the time of the last change check.
+    _cache: Dict[str, dict] = {}
+
     def __init__(self):
         """
         Initializes the ConfigManager by setting the path to the configuration file and loading its content.
         """
         self.config_file = os.path.join(Project.get_rootpath(), FILE_NAME)
-        self.config = self._load_config()
+        self._state()
+
+    @property
+    def config(self) -> dict:
+        """
+        The merged configuration, reloaded if one of its sources changed. It is shared by every instance and must
+        be treated as read-only, get_config_value returns copies.
+        :return: The configuration data.
+        """
+        return self._state()['config']
+
+    def _state(self) -> dict:
+        """
+        Returns the shared state of the configuration file, loading it on first use and when a source changed.
+        Sources are checked at most once per RELOAD_CHECK_INTERVAL.
+        :return: The shared state.
+        """
+        state = self._cache.get(self.config_file)
+        now = time.monotonic()
+        if state is not None and now - state['checked'] < RELOAD_CHECK_INTERVAL:
+            return state
+        with self._lock:
+            state = self._cache.get(self.config_file)
+            signature = self._signature()
+            if state is None or state['signature'] != signature:
+                state = {'signature': signature, 'config': self._load_config(), 'lookups': {}}
+                self._cache[self.config_file] = state
+            state['checked'] = now
+            return state
+
+    def _signature(self) -> Tuple:
+        """
+        Identifies the current version of every configuration source.
+        :return: The modification times of config.yaml and of the override file, and the override variables.
+        """
+        override_file = os.environ.get(OVERRIDE_FILE_VARIABLE)
+        return (self._mtime(self.config_file), override_file, self._mtime(override_file) if override_file else None,
+                tuple(sorted((name, value) for name, value in os.environ.items() if name.startswith(OVERRIDE_PREFIX))))
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[int]:
+        """
+        Returns the modification time of a file.
+        :param path: The file path.
+        :return: The modification time in nanoseconds, or None if the file does not exist.
+        """
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
 
     def _load_config(self) -> dict:
         """
-        Loads the configuration from the YAML file.
+        Loads the configuration from the YAML file, then applies the override file and the override variables.
         :return: The loaded configuration data
         """
         with open(self.config_file, 'r') as file:
-            return yaml.safe_load(file)
+            config = yaml.load(file, Loader=LOADER) or {}
+        override_file = os.environ.get(OVERRIDE_FILE_VARIABLE)
+        if override_file:
+            with open(override_file, 'r') as file:
+                self._merge(config, yaml.load(file, Loader=LOADER) or {})
+        for name, value in sorted(os.environ.items()):
+            if name.startswith(OVERRIDE_PREFIX) and len(name) > len(OVERRIDE_PREFIX):
+                keys = self._resolve_keys(config, name[len(OVERRIDE_PREFIX):].split('__'))
+                override = yaml.load(value, Loader=LOADER)
+                for key in reversed(keys):
+                    override = {key: override}
+                self._merge(config, override)
+        return config
+
+    @staticmethod
+    def _resolve_keys(config: dict, keys: List[str]) -> List[str]:
+        """
+        Maps the keys of an override variable to the existing keys of the configuration, ignoring case.
+        :param config: The configuration the override applies to.
+        :param keys: The keys of the variable name, e.g. ['SETTINGS', 'REMOTE', 'CAPABILITIES', 'BROWSERNAME'].
+        :return: The keys with the case of the existing ones, keys that do not exist yet in lower case.
+        """
+        resolved, level = [], config
+        for key in keys:
+            level = level if isinstance(level, dict) else {}
+            key = {str(name).lower(): name for name in level}.get(key.lower(), key.lower())
+            resolved.append(key)
+            level = level.get(key)
+        return resolved
+
+    @staticmethod
+    def _merge(config: dict, override: dict) -> None:
+        """
+        Merges a configuration into another one in place, nested dictionaries key by key.
+        :param config: The configuration to update.
+        :param override: The configuration whose values take precedence.
+        :return: None.
+        """
+        for key, value in override.items():
+            if isinstance(value, dict) and isinstance(config.get(key), dict):
+                ConfigManager._merge(config[key], value)
+            else:
+                config[key] = value
 
     def get_config_value(self, *keys, default=None):
         """
-        Retrieves a configuration value based on the provided keys.
+        Retrieves a configuration value based on the provided keys. Lookups are memoized until the configuration
+        is reloaded, dictionaries and lists are returned as copies so callers cannot change the shared configuration.
         :param keys: Sequence of keys to retrieve the configuration value
         :param default: Default value to return if the key is not found
         :return: The configuration value, or the default value if not found
         """
-        value = self.config
+        state = self._state()
+        try:
+            memo_key = (keys, type(default), default)
+            value = state['lookups'].get(memo_key, MISSING)
+        except TypeError:
+            memo_key, value = None, MISSING
+        if value is not MISSING:
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        value = state['config']
         for key in keys:
             if isinstance(value, dict):
                 value = value.get(key, default)
             else:
-                return default
-        return value
+                value = default
+                break
+        if memo_key is not None:
+            state['lookups'][memo_key] = value
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
@@ -1,83 +1,212 @@
 import os
 import platform
+import tempfile
+import time
+from typing import TYPE_CHECKING, Optional
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
+from src.common.command_tracer import CommandTracer
+from src.managers.browser_backends import BACKENDS
+from src.managers.config_manager import ConfigManager
+from src.managers.driver_pool import DriverPool
+from src.managers.driver_prewarmer import DriverPrewarmer
+from src.managers.driver_resolver import DriverResolver
+from src.managers.network_interceptor import NetworkInterceptor
+from src.managers.profile_template import ProfileTemplate
+from src.managers.soak_monitor import SoakMonitor
+
+# The browser specific modules are imported by the backend that uses them, on its first launch.
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.chromium.options import ChromiumOptions
+    from selenium.webdriver.edge.options import Options as EdgeOptions
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+DEFAULT_PROFILE = 'interactive'
 
 
 class DriverManager:
+    resolver: DriverResolver = None
+
     @staticmethod
-    def init_driver(browser: str = 'chrome') -> webdriver:
+    def init_driver(browser: str = 'chrome', profile: Optional[str] = None,
+                    user_data_dir: Optional[str] = None) -> webdriver:
         """
         Initializes and returns a WebDriver for the specified browser.
+        :param browser: The browser type to initialize, a backend registered in BACKENDS
+                        ('chrome', 'firefox', 'edge', 'brave', 'remote').
+        :param profile: Name of the option profile from config.yaml, defaults to 'settings.browser.profile'.
+        :param user_data_dir: Browser profile directory, by default the browser uses a temporary one.
+        :return: A WebDriver object initialized with specific options, its requests intercepted when network
+                 interception is enabled and the browser is a local Chromium-based one.
+        """
+        settings = dict(DriverManager.get_profile(profile))
+        if user_data_dir:
+            settings['user_data_dir'] = user_data_dir
+        start = time.perf_counter()
+        driver = BACKENDS.get(browser)(settings)
+        if CommandTracer.active is not None:
+            CommandTracer.active.record('launch', time.perf_counter() - start)
+            CommandTracer.active.attach(driver)
+        if NetworkInterceptor.active_rules is not None and BACKENDS.is_local(browser):
+            NetworkInterceptor.attach(driver, NetworkInterceptor.active_rules)
+        return driver
+
+    @staticmethod
+    def create_pool(browser: str, url: str, size: int = 1, profile: Optional[str] = None,
+                    profile_root: Optional[str] = None, monitor: Optional[SoakMonitor] = None,
+                    template: Optional[ProfileTemplate] = None) -> DriverPool:
+        """
+        Creates a pool of warm WebDrivers for the specified browser.
         :param browser: The browser type to initialize ('chrome', 'firefox', 'edge', 'brave').
-        :return: A WebDriver object initialized with specific options.
-        """
-        if browser == 'chrome':
-            return webdriver.Chrome(
-                service=ChromeService(executable_path=DriverManager.get_executable_path('chrome')),
-                options=DriverManager.get_chrome_options())
-        elif browser == 'firefox':
-            return webdriver.Firefox(
-                service=FirefoxService(executable_path=DriverManager.get_executable_path('firefox')),
-                options=DriverManager.get_firefox_options())
-        elif browser == 'edge':
-            return webdriver.Edge(
-                service=EdgeService(executable_path=DriverManager.get_executable_path('edge')),
-                options=DriverManager.get_edge_options())
-        elif browser == 'brave':
-            return webdriver.Chrome(
-                service=ChromeService(executable_path=DriverManager.get_executable_path('brave')),
-                options=DriverManager.get_brave_options())
-        else:
-            raise ValueError(f"Unsupported browser: {browser}")
+        :param url: The application URL leased drivers are navigated to and reset against.
+        :param size: Maximum number of idle drivers kept warm between tests.
+        :param profile: Name of the option profile from config.yaml.
+        :param profile_root: Directory under which every launched driver gets its own browser profile directory.
+        :param monitor: SoakMonitor sampling released drivers and recycling them past its thresholds.
+        :param template: ProfileTemplate every profile directory is cloned from, requires a profile root.
+        :return: A DriverPool launching drivers through init_driver.
+        """
+        return DriverPool(
+            factory=lambda: DriverManager.init_driver(
+                browser=browser, profile=profile,
+                user_data_dir=DriverManager.create_user_data_dir(profile_root, template)),
+            url=url, size=size, monitor=monitor)
+
+    @staticmethod
+    def create_prewarmer(browser: str, url: str, depth: int = 1, profile: Optional[str] = None,
+                         profile_root: Optional[str] = None,
+                         template: Optional[ProfileTemplate] = None) -> DriverPrewarmer:
+        """
+        Creates a prewarmer launching the next WebDrivers for the specified browser in the background.
+        :param browser: The browser type to initialize ('chrome', 'firefox', 'edge', 'brave').
+        :param url: The application URL prewarmed drivers are navigated to.
+        :param depth: Maximum number of prewarmed drivers, ready or launching, at any time.
+        :param profile: Name of the option profile from config.yaml.
+        :param profile_root: Directory under which every launched driver gets its own browser profile directory.
+        :param template: ProfileTemplate every profile directory is cloned from, requires a profile root.
+        :return: A DriverPrewarmer launching drivers through init_driver, not started yet.
+        """
+        return DriverPrewarmer(
+            factory=lambda: DriverManager.init_driver(
+                browser=browser, profile=profile,
+                user_data_dir=DriverManager.create_user_data_dir(profile_root, template)),
+            url=url, depth=depth)
+
+    @staticmethod
+    def create_user_data_dir(profile_root: Optional[str], template: Optional[ProfileTemplate] = None) -> Optional[str]:
+        """
+        Creates a new browser profile directory, empty or cloned from a warm profile template.
+        :param profile_root: Directory to create the profile directory in, or None.
+        :param template: ProfileTemplate to clone into the new directory, or None for an empty profile.
+        :return: The path of the new directory, or None if no profile root was given.
+        """
+        if profile_root is None:
+            return None
+        path = tempfile.mkdtemp(prefix='profile-', dir=profile_root)
+        return template.clone(path) if template is not None else path
+
+    @staticmethod
+    def create_profile_template(browser: str, url: str, directory: str, profile: Optional[str] = None,
+                                rebuild: bool = False, started: Optional[float] = None) -> ProfileTemplate:
+        """
+        Returns the warm profile template of a browser, building it with a warm-up run against the app when it was
+        not built for this browser and URL yet. Concurrent callers, like parallel workers, build it once.
+        :param browser: The browser type ('chrome', 'firefox', 'edge', 'brave').
+        :param url: The application URL the template is warmed up against.
+        :param directory: The template directory of the browser.
+        :param profile: Name of the option profile from config.yaml used for the warm-up run.
+        :param rebuild: Build the template even if it is up to date, unless it was built since started.
+        :param started: Start time of the session shared by the callers, defaults to now.
+        :return: The built ProfileTemplate.
+        """
+        if not BACKENDS.is_local(browser):
+            raise ValueError(f"Profile templates need a local browser, {browser} runs on another machine")
+        template = ProfileTemplate(directory)
+        template.ensure_built(
+            lambda user_data_dir: DriverManager.init_driver(browser, profile, user_data_dir), browser, url,
+            built_after=(started or time.time()) if rebuild else None)
+        return template
 
     @staticmethod
-    def get_chrome_options() -> ChromeOptions:
+    def get_profile(name: Optional[str] = None) -> dict:
+        """
+        Reads an option profile from the 'settings.browser.profiles' section of config.yaml.
+        :param name: The profile name, defaults to 'settings.browser.profile'.
+        :return: The profile settings.
+        """
+        conf = ConfigManager()
+        name = name or conf.get_config_value('settings', 'browser', 'profile', default=DEFAULT_PROFILE)
+        profiles = conf.get_config_value('settings', 'browser', 'profiles', default={}) or {}
+        if name not in profiles:
+            raise ValueError(f"Unknown browser profile: {name}")
+        return profiles[name] or {}
+
+    @staticmethod
+    def get_chrome_options(profile: Optional[dict] = None) -> 'ChromeOptions':
         """
         Creates and returns Chrome options for the WebDriver.
+        :param profile: Option profile settings, defaults to the configured profile.
         :return: A ChromeOptions object configured with arguments to enhance usability.
         """
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
         chrome_options = ChromeOptions()
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--start-maximized")
         chrome_options.add_argument("--disable-extensions")
+        DriverManager.apply_chromium_profile(chrome_options, DriverManager._profile_or_default(profile))
         return chrome_options
 
     @staticmethod
-    def get_firefox_options() -> FirefoxOptions:
+    def get_firefox_options(profile: Optional[dict] = None) -> 'FirefoxOptions':
         """
         Creates and returns Firefox options for the WebDriver.
+        :param profile: Option profile settings, defaults to the configured profile.
         :return: A FirefoxOptions object configured with arguments to enhance usability.
         """
+        profile = DriverManager._profile_or_default(profile)
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
         firefox_options = FirefoxOptions()
-        firefox_options.add_argument("--start-maximized")
+        if profile.get('user_data_dir'):
+            firefox_options.add_argument("-profile")
+            firefox_options.add_argument(profile['user_data_dir'])
+        if profile.get('maximized'):
+            firefox_options.add_argument("--start-maximized")
+        if profile.get('headless'):
+            firefox_options.add_argument("-headless")
+        if profile.get('window_size'):
+            width, height = profile['window_size']
+            firefox_options.add_argument(f"--width={width}")
+            firefox_options.add_argument(f"--height={height}")
+        if profile.get('page_load_strategy'):
+            firefox_options.page_load_strategy = profile['page_load_strategy']
+        if profile.get('disable_gpu'):
+            firefox_options.set_preference("layers.acceleration.disabled", True)
+        if profile.get('block_images'):
+            firefox_options.set_preference("permissions.default.image", 2)
+        if profile.get('block_fonts'):
+            firefox_options.set_preference("browser.display.use_document_fonts", 0)
         return firefox_options
 
     @staticmethod
-    def get_edge_options() -> EdgeOptions:
+    def get_edge_options(profile: Optional[dict] = None) -> 'EdgeOptions':
         """
         Creates and returns Edge options for the WebDriver.
+        :param profile: Option profile settings, defaults to the configured profile.
         :return: An EdgeOptions object configured with arguments to enhance usability.
         """
+        from selenium.webdriver.edge.options import Options as EdgeOptions
         edge_options = EdgeOptions()
-        edge_options.add_argument("--start-maximized")
+        DriverManager.apply_chromium_profile(edge_options, DriverManager._profile_or_default(profile))
         return edge_options
 
     @staticmethod
-    def get_brave_options() -> ChromeOptions:
+    def get_brave_options(profile: Optional[dict] = None) -> 'ChromeOptions':
         """
         Creates and returns Brave options for the WebDriver.
+        :param profile: Option profile settings, defaults to the configured profile.
         :return: A ChromeOptions object configured for Brave.
         """
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
         brave_options = ChromeOptions()
         brave_binary = DriverManager.find_brave_binary()
         if brave_binary:
@@ -87,10 +216,49 @@ class DriverManager:
 
         brave_options.add_argument("--disable-blink-features=AutomationControlled")
         brave_options.add_argument("--disable-infobars")
-        brave_options.add_argument("--start-maximized")
         brave_options.add_argument("--disable-extensions")
+        DriverManager.apply_chromium_profile(brave_options, DriverManager._profile_or_default(profile))
         return brave_options
 
+    @staticmethod
+    def apply_chromium_profile(options: 'ChromiumOptions', profile: dict) -> None:
+        """
+        Applies option profile settings to Chrome, Edge or Brave options.
+        :param options: The Chromium-based options object to configure.
+        :param profile: Option profile settings.
+        :return: None.
+        """
+        if profile.get('user_data_dir'):
+            options.add_argument(f"--user-data-dir={profile['user_data_dir']}")
+        if profile.get('maximized'):
+            options.add_argument("--start-maximized")
+        if profile.get('headless'):
+            options.add_argument("--headless=new")
+        if profile.get('window_size'):
+            width, height = profile['window_size']
+            options.add_argument(f"--window-size={width},{height}")
+        if profile.get('page_load_strategy'):
+            options.page_load_strategy = profile['page_load_strategy']
+        if profile.get('disable_gpu'):
+            options.add_argument("--disable-gpu")
+        if profile.get('no_sandbox'):
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+        prefs = {}
+        if profile.get('block_images'):
+            prefs['profile.managed_default_content_settings.images'] = 2
+        if prefs:
+            options.add_experimental_option("prefs", prefs)
+
+    @staticmethod
+    def _profile_or_default(profile: Optional[dict]) -> dict:
+        """
+        Returns the given profile settings, or the configured default profile if none were given.
+        :param profile: Option profile settings or None.
+        :return: The profile settings.
+        """
+        return DriverManager.get_profile() if profile is None else profile
+
     @staticmethod
     def find_brave_binary() -> str:
         """
@@ -118,14 +286,68 @@ class DriverManager:
     def get_executable_path(browser: str) -> str:
         """
         Retrieves the executable path for the specified WebDriver.
+        Paths are served from the driver manifest when possible, see DriverResolver.
         :param browser: The browser type to get the executable path for ('chrome', 'firefox', 'edge', 'brave').
         :return: The file path of the WebDriver executable.
         """
-        if browser in ['chrome', 'brave']:
-            return ChromeDriverManager().install()
-        elif browser == 'firefox':
-            return GeckoDriverManager().install()
-        elif browser == 'edge':
-            return EdgeChromiumDriverManager().install()
-        else:
+        if browser not in ['chrome', 'firefox', 'edge', 'brave']:
             raise ValueError(f"Unsupported browser: {browser}")
+        if DriverManager.resolver is None:
+            DriverManager.resolver = DriverResolver.from_config()
+        return DriverManager.resolver.resolve(browser)
+
+
+def launch_chrome(settings: dict) -> webdriver:
+    """
+    Launches Chrome.
+    :param settings: Option profile settings.
+    :return: The Chrome WebDriver.
+    """
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.webdriver import WebDriver
+    return WebDriver(service=Service(executable_path=DriverManager.get_executable_path('chrome')),
+                     options=DriverManager.get_chrome_options(settings))
+
+
+def launch_firefox(settings: dict) -> webdriver:
+    """
+    Launches Firefox.
+    :param settings: Option profile settings.
+    :return: The Firefox WebDriver.
+    """
+    from selenium.webdriver.firefox.service import Service
+    from selenium.webdriver.firefox.webdriver import WebDriver
+    return WebDriver(service=Service(executable_path=DriverManager.get_executable_path('firefox')),
+                     options=DriverManager.get_firefox_options(settings))
+
+
+def launch_edge(settings: dict) -> webdriver:
+    """
+    Launches Edge.
+    :param settings: Option profile settings.
+    :return: The Edge WebDriver.
+    """
+    from selenium.webdriver.edge.service import Service
+    from selenium.webdriver.edge.webdriver import WebDriver
+    return WebDriver(service=Service(executable_path=DriverManager.get_executable_path('edge')),
+                     options=DriverManager.get_edge_options(settings))
+
+
+def launch_brave(settings: dict) -> webdriver:
+    """
+    Launches Brave through chromedriver.
+    :param settings: Option profile settings.
+    :return: The Brave WebDriver.
+    """
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.webdriver import WebDriver
+    return WebDriver(service=Service(executable_path=DriverManager.get_executable_path('brave')),
+                     options=DriverManager.get_brave_options(settings))
+
+
+BACKENDS.register('chrome', launch_chrome)
+BACKENDS.register('firefox', launch_firefox)
+BACKENDS.register('edge', launch_edge)
+BACKENDS.register('brave', launch_brave)
+# Sessions on the remote end of 'settings.remote', e.g. a Selenium Grid.
+BACKENDS.register('remote', 'src.managers.remote_backend:launch', local=False)
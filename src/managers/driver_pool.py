@@ -0,0 +1,165 @@
+from typing import Callable, List, Optional
+from urllib.parse import urlparse
+from urllib3.exceptions import HTTPError
+from selenium import webdriver
+from selenium.common import WebDriverException
+from src.managers.soak_monitor import SoakMonitor
+
+CLEAR_STORAGE_SCRIPT = 'window.localStorage.clear(); window.sessionStorage.clear();'
+# Errors of a driver whose browser or driver process died: the driver's own, and urllib3's and the socket's when the
+# driver process is gone, e.g. MaxRetryError or ConnectionRefusedError.
+DRIVER_ERRORS = (WebDriverException, HTTPError, OSError)
+
+
+class DriverPool:
+    """
+    Keeps a bounded set of warm WebDriver instances that are leased to tests and reset between them.
+    """
+
+    def __init__(self, factory: Callable[[], webdriver], url: str, size: int = 1,
+                 monitor: Optional[SoakMonitor] = None):
+        """
+        Initializes the pool.
+        :param factory: Callable that launches and returns a new WebDriver.
+        :param url: The application URL each leased driver is navigated to.
+        :param size: Maximum number of idle drivers kept warm between tests.
+        :param monitor: SoakMonitor sampling every released driver and deciding when it is recycled.
+        """
+        self.factory = factory
+        self.url = url
+        self.size = size
+        self.idle: List[webdriver] = []
+        self.launches = 0
+        self.leases = 0
+        self.reuses = 0
+        self.reset_failures = 0
+        self.recycles = 0
+        self.monitor = monitor
+
+    def acquire(self) -> webdriver:
+        """
+        Leases a driver from the pool, launching a new one if no warm driver is available.
+        :return: A WebDriver navigated to the application URL.
+        """
+        if self.idle:
+            driver = self.idle.pop()
+            self.reuses += 1
+        else:
+            driver = self._launch()
+        # Counted once the lease succeeded, a failed launch is no lease.
+        self.leases += 1
+        return driver
+
+    def release(self, driver: webdriver, test: str = '') -> None:
+        """
+        Returns a driver to the pool after resetting the application state.
+        Drivers that fail to reset, that exceed the pool size or that the monitor recycles, are quit.
+        :param driver: The WebDriver previously returned by acquire().
+        :param test: Name of the test that used the driver, recorded with the monitor's sample.
+        :return: None.
+        """
+        if self.monitor is not None:
+            reason = self.monitor.sample(driver, test)['recycle']
+            if reason:
+                self.recycles += 1
+                self._retire(driver, reason)
+                return
+        if len(self.idle) >= self.size:
+            self._retire(driver)
+            return
+        try:
+            self.reset(driver)
+        except DRIVER_ERRORS:
+            self.reset_failures += 1
+            self._retire(driver)
+            return
+        self.idle.append(driver)
+
+    def reset(self, driver: webdriver) -> None:
+        """
+        Clears cookies, localStorage and sessionStorage and re-navigates to the application URL.
+        :param driver: The WebDriver to reset.
+        :return: None.
+        """
+        for handle in driver.window_handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(driver.window_handles[0])
+        if not self._is_same_origin(driver.current_url):
+            driver.get(self.url)
+        driver.delete_all_cookies()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        driver.get(self.url)
+
+    def close(self) -> None:
+        """
+        Quits every idle driver held by the pool.
+        :return: None.
+        """
+        while self.idle:
+            self._retire(self.idle.pop())
+
+    @property
+    def saved_launches(self) -> int:
+        """
+        Number of browser launches avoided by reusing warm drivers.
+        :return: Leases served with an idle driver.
+        """
+        return self.reuses
+
+    def summary(self) -> str:
+        """
+        Builds a one-line description of the pool usage.
+        :return: The summary line.
+        """
+        return (f'driver pool: {self.leases} leases, {self.launches} launches, '
+                f'{self.saved_launches} launches saved, {self.reset_failures} reset failures, {self.recycles} recycled')
+
+    def _launch(self) -> webdriver:
+        """
+        Launches a new driver and navigates it to the application URL.
+        A driver that fails to navigate is quit before the error is raised.
+        :return: The new WebDriver.
+        """
+        driver = self.factory()
+        self.launches += 1
+        if self.monitor is not None:
+            self.monitor.attach(driver)
+        try:
+            driver.get(self.url)
+        except Exception:
+            self._retire(driver)
+            raise
+        return driver
+
+    def _is_same_origin(self, current_url: str) -> bool:
+        """
+        Checks if the given URL shares the scheme and host of the application URL.
+        :param current_url: The URL the driver is currently on.
+        :return: True if both URLs share an origin, False otherwise.
+        """
+        current, app = urlparse(current_url), urlparse(self.url)
+        return (current.scheme, current.netloc) == (app.scheme, app.netloc)
+
+    def _retire(self, driver: webdriver, reason: Optional[str] = None) -> None:
+        """
+        Quits a driver leaving the pool and stops monitoring it.
+        :param driver: The WebDriver to quit.
+        :param reason: The reason the monitor recycles it, if any.
+        :return: None.
+        """
+        if self.monitor is not None:
+            self.monitor.forget(driver, reason)
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver: webdriver) -> None:
+        """
+        Quits a driver, ignoring errors from an already dead browser.
+        :param driver: The WebDriver to quit.
+        :return: None.
+        """
+        try:
+            driver.quit()
+        except DRIVER_ERRORS:
+            pass
@@ -0,0 +1,131 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+from selenium import webdriver
+from src.managers.driver_pool import DRIVER_ERRORS
+
+# Seconds between checks of the stop flag while the background thread waits for a free slot.
+STOP_CHECK_INTERVAL = 0.2
+
+
+class PrewarmedDriver(NamedTuple):
+    """
+    A driver launched and navigated in the background, or the error that prevented it.
+    """
+    driver: Optional[webdriver]
+    launch_time: float
+    error: Optional[BaseException]
+
+
+class DriverPrewarmer:
+    """
+    Launches the next drivers in a background thread while the current test runs,
+    so tests get a session that is already navigated to the application URL.
+    """
+
+    def __init__(self, factory: Callable[[], webdriver], url: str, depth: int = 1):
+        """
+        Initializes the prewarmer without starting it.
+        :param factory: Callable that launches and returns a new WebDriver.
+        :param url: The application URL each prewarmed driver is navigated to.
+        :param depth: Maximum number of prewarmed drivers, ready or launching, at any time.
+        """
+        self.factory = factory
+        self.url = url
+        self.depth = depth
+        self.ready: 'queue.Queue[PrewarmedDriver]' = queue.Queue()
+        self.slots = threading.Semaphore(depth)
+        self.stopping = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.hidden: Dict[str, float] = {}
+        self.waited: Dict[str, float] = {}
+
+    def start(self) -> 'DriverPrewarmer':
+        """
+        Starts launching drivers in a daemon thread.
+        :return: The running prewarmer.
+        """
+        self.thread = threading.Thread(target=self._run, name='driver-prewarmer', daemon=True)
+        self.thread.start()
+        return self
+
+    def acquire(self, name: str = '') -> webdriver:
+        """
+        Takes the next prewarmed driver, waiting for its launch to finish if needed.
+        :param name: Name the hidden launch latency is reported under, e.g. the test node id.
+        :return: A WebDriver navigated to the application URL.
+        """
+        start = time.perf_counter()
+        prewarmed = self.ready.get()
+        waited = time.perf_counter() - start
+        self.slots.release()
+        if prewarmed.error is not None:
+            raise prewarmed.error
+        self.waited[name] = waited
+        self.hidden[name] = max(prewarmed.launch_time - waited, 0.0)
+        return prewarmed.driver
+
+    def stop(self) -> None:
+        """
+        Stops launching drivers and quits the prewarmed drivers nobody acquired.
+        :return: None.
+        """
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        while not self.ready.empty():
+            prewarmed = self.ready.get_nowait()
+            if prewarmed.driver is not None:
+                self._quit(prewarmed.driver)
+
+    @property
+    def hidden_total(self) -> float:
+        """
+        Launch latency taken off the critical path of the tests.
+        :return: The hidden latency in seconds, summed over all acquired drivers.
+        """
+        return sum(self.hidden.values())
+
+    def summary(self) -> str:
+        """
+        Builds a one-line description of the hidden launch latency.
+        :return: The summary line.
+        """
+        count = len(self.hidden)
+        average = self.hidden_total / count if count else 0.0
+        return (f'driver prewarming: {count} drivers, {self.hidden_total:.2f}s launch latency hidden '
+                f'({average:.2f}s per test), {sum(self.waited.values()):.2f}s waited for launches')
+
+    def _run(self) -> None:
+        """
+        Keeps up to depth drivers launched and navigated until stopped.
+        :return: None.
+        """
+        while not self.stopping.is_set():
+            if not self.slots.acquire(timeout=STOP_CHECK_INTERVAL):
+                continue
+            start = time.perf_counter()
+            driver = None
+            try:
+                driver = self.factory()
+                driver.get(self.url)
+                prewarmed = PrewarmedDriver(driver, time.perf_counter() - start, None)
+            except Exception as error:
+                if driver is not None:
+                    self._quit(driver)
+                prewarmed = PrewarmedDriver(None, time.perf_counter() - start, error)
+            self.ready.put(prewarmed)
+
+    @staticmethod
+    def _quit(driver: webdriver) -> None:
+        """
+        Quits a driver, ignoring errors from an already dead browser.
+        :param driver: The WebDriver to quit.
+        :return: None.
+        """
+        try:
+            driver.quit()
+        except DRIVER_ERRORS:
+            pass
@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import time
+from typing import Dict, Optional
+from src.managers.config_manager import ConfigManager
+from src.utils.project import Project
+
+MANIFEST_FILE = os.path.join('.drivers', 'manifest.json')
+UNKNOWN_VERSION = 'unknown'
+SUPPORTED_BROWSERS = ['chrome', 'firefox', 'edge', 'brave']
+DRIVER_BINARIES = {
+    'chrome': 'chromedriver',
+    'brave': 'chromedriver',
+    'firefox': 'geckodriver',
+    'edge': 'msedgedriver',
+}
+# Browser executables asked for their version with --version, by operating system.
+BROWSER_BINARIES = {
+    'Linux': {
+        'chrome': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'],
+        'brave': ['brave-browser', 'brave'],
+        'edge': ['microsoft-edge', 'microsoft-edge-stable'],
+        'firefox': ['firefox'],
+    },
+    'Darwin': {
+        'chrome': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+        'brave': ['/Applications/Brave Browser.app/Contents/MacOS/Brave Browser'],
+        'edge': ['/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'],
+        'firefox': ['/Applications/Firefox.app/Contents/MacOS/firefox'],
+    },
+}
+# Registry keys and values holding the browser version on Windows, where the executables open a window on --version.
+BROWSER_REGISTRY_KEYS = {
+    'chrome': (r'Software\Google\Chrome\BLBeacon', 'version'),
+    'brave': (r'Software\BraveSoftware\Brave-Browser\BLBeacon', 'version'),
+    'edge': (r'Software\Microsoft\Edge\BLBeacon', 'version'),
+    'firefox': (r'SOFTWARE\Mozilla\Mozilla Firefox', 'CurrentVersion'),
+}
+VERSION_PATTERN = re.compile(r'\d+(?:\.\d+)+')
+# Seconds a browser may take to print its version.
+VERSION_TIMEOUT = 10
+# webdriver_manager raises AttributeError when it cannot detect an installed browser version. Its network errors,
+# requests' RequestException, are added where webdriver_manager is used, so requests is not imported before.
+INSTALL_ERRORS = (OSError, ValueError, AttributeError)
+
+
+class DriverResolver:
+    """
+    Resolves WebDriver executables through a local manifest keyed by browser version,
+    falling back to webdriver_manager and then to drivers found on PATH.
+    """
+
+    def __init__(self, manifest_path: Optional[str] = None, ttl_hours: float = 24, offline: bool = False):
+        """
+        Initializes the resolver.
+        :param manifest_path: Path of the JSON manifest, defaults to .drivers/manifest.json under the project root.
+        :param ttl_hours: Hours a manifest entry is trusted before webdriver_manager is consulted again.
+        :param offline: When True, webdriver_manager is never used.
+        """
+        self.manifest_path = manifest_path or os.path.join(Project.get_rootpath(), MANIFEST_FILE)
+        self.ttl_seconds = ttl_hours * 3600
+        self.offline = offline
+        self.browser_versions: Dict[str, str] = {}
+        self.manifest = self._load_manifest()
+
+    @staticmethod
+    def from_config() -> 'DriverResolver':
+        """
+        Creates a resolver using the 'settings.driver' section of config.yaml.
+        :return: The configured DriverResolver.
+        """
+        conf = ConfigManager()
+        return DriverResolver(
+            ttl_hours=conf.get_config_value('settings', 'driver', 'manifest_ttl_hours', default=24),
+            offline=conf.get_config_value('settings', 'driver', 'offline', default=False))
+
+    def resolve(self, browser: str) -> str:
+        """
+        Retrieves the executable path of the WebDriver for the specified browser.
+        :param browser: The browser type ('chrome', 'firefox', 'edge', 'brave').
+        :return: The file path of the WebDriver executable.
+        """
+        key = self.manifest_key(browser)
+        entry = self.manifest.get(key)
+        if entry and os.path.exists(entry['path']) and (
+                self.offline or time.time() - entry['resolved_at'] < self.ttl_seconds):
+            return entry['path']
+
+        if not self.offline:
+            from requests.exceptions import RequestException
+            try:
+                return self.install(browser)
+            except INSTALL_ERRORS + (RequestException,):
+                pass
+
+        if entry and os.path.exists(entry['path']):
+            return entry['path']
+        path = shutil.which(DRIVER_BINARIES[browser])
+        if path:
+            return path
+        raise FileNotFoundError(
+            f"No {DRIVER_BINARIES[browser]} found in the driver manifest or on PATH for browser: {browser}")
+
+    def install(self, browser: str) -> str:
+        """
+        Resolves the WebDriver executable with webdriver_manager and records it in the manifest.
+        :param browser: The browser type ('chrome', 'firefox', 'edge', 'brave').
+        :return: The file path of the WebDriver executable.
+        """
+        if browser in ['chrome', 'brave']:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+        elif browser == 'firefox':
+            from webdriver_manager.firefox import GeckoDriverManager
+            path = GeckoDriverManager().install()
+        elif browser == 'edge':
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
+            path = EdgeChromiumDriverManager().install()
+        else:
+            raise ValueError(f"Unsupported browser: {browser}")
+
+        self.manifest[self.manifest_key(browser)] = {'path': path, 'resolved_at': time.time()}
+        self._save_manifest()
+        return path
+
+    def get_browser_version(self, browser: str) -> str:
+        """
+        Reads the installed browser version, once per process, without webdriver_manager: from the output of
+        '<browser> --version', or from the registry on Windows.
+        :param browser: The browser type ('chrome', 'firefox', 'edge', 'brave').
+        :return: The browser version, or 'unknown' if it cannot be detected.
+        """
+        if browser not in SUPPORTED_BROWSERS:
+            raise ValueError(f"Unsupported browser: {browser}")
+        if browser not in self.browser_versions:
+            output = (self._read_registry_version(browser) if platform.system() == 'Windows'
+                      else self._run_version_command(browser))
+            match = VERSION_PATTERN.search(output or '')
+            self.browser_versions[browser] = match.group(0) if match else UNKNOWN_VERSION
+        return self.browser_versions[browser]
+
+    @staticmethod
+    def _run_version_command(browser: str) -> Optional[str]:
+        """
+        Runs '<browser> --version' with the first installed executable of the browser.
+        :param browser: The browser type.
+        :return: The command output, or None if no executable is installed or it fails.
+        """
+        for binary in BROWSER_BINARIES.get(platform.system(), {}).get(browser, []):
+            path = binary if os.path.isabs(binary) else shutil.which(binary)
+            if not path or not os.path.exists(path):
+                continue
+            try:
+                return subprocess.run([path, '--version'], capture_output=True, text=True,
+                                      timeout=VERSION_TIMEOUT).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+        return None
+
+    @staticmethod
+    def _read_registry_version(browser: str) -> Optional[str]:
+        """
+        Reads the version of a browser from the Windows registry, current user first.
+        :param browser: The browser type.
+        :return: The registry value, or None if it is not found.
+        """
+        import winreg
+        path, name = BROWSER_REGISTRY_KEYS[browser]
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(hive, path) as key:
+                    return str(winreg.QueryValueEx(key, name)[0])
+            except OSError:
+                continue
+        return None
+
+    def manifest_key(self, browser: str) -> str:
+        """
+        Builds the manifest key for the specified browser.
+        :param browser: The browser type.
+        :return: The key in the form '<browser>:<version>'.
+        """
+        return f'{browser}:{self.get_browser_version(browser)}'
+
+    def _load_manifest(self) -> dict:
+        """
+        Loads the manifest from disk.
+        :return: The manifest content, or an empty dictionary if it does not exist or is unreadable.
+        """
+        try:
+            with open(self.manifest_path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        """
+        Writes the manifest to disk atomically.
+        :return: None.
+        """
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(self.manifest, file, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+
+def main() -> None:
+    """
+    Pre-resolves WebDriver executables into the manifest, e.g. while building a CI image:
+        python -m src.managers.driver_resolver chrome firefox
+    """
+    parser = argparse.ArgumentParser(description='Pre-resolve WebDriver executables into the driver manifest.')
+    parser.add_argument('browsers', nargs='*', default=['chrome'], choices=SUPPORTED_BROWSERS,
+                        help='Browsers to resolve drivers for (default: chrome).')
+    args = parser.parse_args()
+    resolver = DriverResolver.from_config()
+    for browser in args.browsers:
+        print(f'{resolver.manifest_key(browser)} -> {resolver.install(browser)}')
+
+
+if __name__ == '__main__':
+    main()
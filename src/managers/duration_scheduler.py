@@ -0,0 +1,231 @@
+import heapq
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.managers.config_manager import ConfigManager
+from src.utils.project import Project
+
+HISTORY_FILE = '.test_durations.json'
+
+# Markers that describe how a test runs rather than what it does, never used to estimate durations.
+IGNORED_MARKERS = {'parametrize', 'skip', 'skipif', 'xfail', 'usefixtures', 'filterwarnings', 'xdist_group'}
+
+# Prefix of the xdist_group names given to the bins of a parallel run, pytest-xdist appends it to the node ids.
+GROUP_PREFIX = 'duration-bin-'
+
+
+class DurationScheduler:
+    """
+    Keeps a history of test durations and uses it to order tests longest-first and pack them into balanced bins.
+    """
+
+    active: Optional['DurationScheduler'] = None
+
+    def __init__(self, history_file: str, smoothing: float = 0.5, default_duration: float = 5.0):
+        """
+        Initializes the scheduler and loads the history file, if any.
+        :param history_file: Path of the JSON file holding the duration history.
+        :param smoothing: Weight of the latest run in the moving average of a test's duration, between 0 and 1.
+        :param default_duration: Seconds assumed for a test with no history and no known marker.
+        """
+        self.history_file = history_file
+        self.smoothing = smoothing
+        self.default_duration = default_duration
+        self.tests: Dict[str, dict] = self._load()
+        self.markers = self._marker_means()
+        self.running: Dict[str, Optional[float]] = {}
+        self.changed = False
+
+    @classmethod
+    def from_config(cls) -> 'DurationScheduler':
+        """
+        Creates a scheduler from the 'settings.scheduling' section of config.yaml.
+        :return: DurationScheduler instance.
+        """
+        config = ConfigManager()
+        history_file = config.get_config_value('settings', 'scheduling', 'history_file', default=None) or HISTORY_FILE
+        return cls(
+            history_file=os.path.join(Project.get_rootpath(), history_file),
+            smoothing=config.get_config_value('settings', 'scheduling', 'smoothing', default=0.5),
+            default_duration=config.get_config_value('settings', 'scheduling', 'default_duration', default=5.0))
+
+    def _load(self) -> Dict[str, dict]:
+        """
+        Reads the per-test history, an unreadable file is treated as an empty history.
+        :return: Dictionary of node id to its duration, number of recorded runs and markers.
+        """
+        try:
+            with open(self.history_file, 'r') as file:
+                return json.load(file).get('tests', {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _marker_means(self) -> Dict[str, float]:
+        """
+        Averages the recorded durations of the tests carrying each marker.
+        :return: Dictionary of marker name to mean duration in seconds.
+        """
+        totals: Dict[str, List[float]] = {}
+        for entry in self.tests.values():
+            for marker in entry.get('markers', []):
+                totals.setdefault(marker, []).append(entry['duration_s'])
+        return {marker: sum(durations) / len(durations) for marker, durations in totals.items()}
+
+    @property
+    def has_history(self) -> bool:
+        """
+        Whether any test duration was recorded before.
+        :return: True if the history is not empty.
+        """
+        return bool(self.tests)
+
+    def record(self, nodeid: str, duration: float, markers: Iterable[str] = ()) -> None:
+        """
+        Folds the duration of a finished test into its moving average.
+        :param nodeid: The pytest node id of the test.
+        :param duration: Seconds spent in setup, call and teardown.
+        :param markers: Names of the markers of the test.
+        :return: None.
+        """
+        entry = self.tests.get(nodeid)
+        if entry is None:
+            entry = self.tests[nodeid] = {'duration_s': duration, 'runs': 0}
+        else:
+            entry['duration_s'] = self.smoothing * duration + (1 - self.smoothing) * entry['duration_s']
+        entry['runs'] += 1
+        entry['markers'] = sorted(set(markers) - IGNORED_MARKERS)
+        self.changed = True
+
+    def record_phase(self, nodeid: str, when: str, duration: float, discard: bool,
+                     markers: Iterable[str] = ()) -> None:
+        """
+        Adds up the setup, call and teardown phases of a test and records the total after teardown.
+        Tests with a discarded phase, e.g. skipped or failed in setup, are not recorded,
+        their duration says nothing about a real run.
+        :param nodeid: The pytest node id of the test, with or without the xdist group suffix.
+        :param when: The phase: 'setup', 'call' or 'teardown'.
+        :param duration: Seconds spent in the phase.
+        :param discard: Whether the phase invalidates the duration of the test.
+        :param markers: Names of the markers of the test.
+        :return: None.
+        """
+        base, _, group = nodeid.rpartition('@')
+        if base and group.startswith(GROUP_PREFIX):
+            nodeid = base
+        total = self.running.get(nodeid, 0.0)
+        self.running[nodeid] = None if discard or total is None else total + duration
+        if when == 'teardown':
+            total = self.running.pop(nodeid)
+            if total is not None:
+                self.record(nodeid, total, markers)
+
+    def save(self) -> None:
+        """
+        Writes the history, including the per-marker means, to the history file.
+        :return: None.
+        """
+        self.markers = self._marker_means()
+        directory = os.path.dirname(self.history_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.history_file, 'w') as file:
+            json.dump({'tests': self.tests, 'markers': self.markers}, file, indent=2, sort_keys=True)
+
+    def estimate(self, nodeid: str, markers: Iterable[str] = ()) -> float:
+        """
+        Estimates the duration of a test from its own history, else from the slowest of its markers.
+        :param nodeid: The pytest node id of the test.
+        :param markers: Names of the markers of the test.
+        :return: The estimated duration in seconds.
+        """
+        if nodeid in self.tests:
+            return self.tests[nodeid]['duration_s']
+        known = [self.markers[marker] for marker in markers if marker in self.markers]
+        return max(known) if known else self.default_duration
+
+    @staticmethod
+    def order(estimates: Dict[str, float]) -> List[str]:
+        """
+        Orders tests longest-first, ties keep the order of estimates, e.g. the collection order, so a run without
+        history runs the tests as collected.
+        :param estimates: Dictionary of node id to estimated duration.
+        :return: The node ids, longest first.
+        """
+        return sorted(estimates, key=lambda nodeid: -estimates[nodeid])
+
+    @staticmethod
+    def pack(estimates: Dict[str, float], bins: int) -> List[Tuple[float, List[str]]]:
+        """
+        Packs tests into bins with the longest-processing-time rule: each test, longest first,
+        goes to the bin with the smallest estimated total so far.
+        :param estimates: Dictionary of node id to estimated duration.
+        :param bins: Number of bins, i.e. workers or shards.
+        :return: One (estimated seconds, node ids longest first) tuple per bin.
+        """
+        contents: List[List[str]] = [[] for _ in range(bins)]
+        loads = [0.0] * bins
+        heap = [(0.0, index) for index in range(bins)]
+        for nodeid in DurationScheduler.order(estimates):
+            load, index = heapq.heappop(heap)
+            contents[index].append(nodeid)
+            loads[index] = load + estimates[nodeid]
+            heapq.heappush(heap, (loads[index], index))
+        return list(zip(loads, contents))
+
+    @staticmethod
+    def shard_plan(estimates: Dict[str, float], shards: int) -> dict:
+        """
+        Builds a shard plan that separate CI jobs can run with --shard-plan and --shard-id.
+        :param estimates: Dictionary of node id to estimated duration.
+        :param shards: Number of shards.
+        :return: The plan as a JSON serializable dictionary.
+        """
+        packed = DurationScheduler.pack(estimates, shards)
+        return {
+            'num_shards': shards,
+            'estimated_total_s': sum(estimates.values()),
+            'shards': [{'shard_id': index, 'estimated_s': load, 'tests': nodeids}
+                       for index, (load, nodeids) in enumerate(packed)],
+        }
+
+    @staticmethod
+    def select_shard(plan: dict, shard_id: int, nodeids: Iterable[str]) -> List[str]:
+        """
+        Selects the tests of one shard of a plan. Tests missing from the plan, e.g. added after it was written,
+        go to the shard with the smallest estimate, so every job selects them the same way.
+        :param plan: A plan returned by shard_plan().
+        :param shard_id: Index of the shard, from 0 to num_shards - 1.
+        :param nodeids: Node ids of the collected tests.
+        :return: The node ids of the collected tests that belong to the shard.
+        """
+        if not 0 <= shard_id < plan['num_shards']:
+            raise ValueError(f"Shard id {shard_id} is out of range for {plan['num_shards']} shards")
+        planned = {nodeid: shard['shard_id'] for shard in plan['shards'] for nodeid in shard['tests']}
+        lightest = min(plan['shards'], key=lambda shard: (shard['estimated_s'], shard['shard_id']))['shard_id']
+        return [nodeid for nodeid in nodeids if planned.get(nodeid, lightest) == shard_id]
+
+    @staticmethod
+    def read_plan(path: str) -> Optional[dict]:
+        """
+        Reads a shard plan.
+        :param path: Path of the plan file.
+        :return: The plan, or None if the file does not exist.
+        """
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'r') as file:
+            return json.load(file)
+
+    @staticmethod
+    def write_plan(plan: dict, path: str) -> None:
+        """
+        Writes a shard plan.
+        :param plan: A plan returned by shard_plan().
+        :param path: Path of the plan file.
+        :return: None.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as file:
+            json.dump(plan, file, indent=2)
@@ -0,0 +1,383 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.request
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import websocket
+from selenium import webdriver
+from src.managers.config_manager import ConfigManager
+from src.utils.project import Project
+
+# Capabilities holding the DevTools address of the Chromium-based browsers.
+DEBUGGER_CAPABILITIES = ('goog:chromeOptions', 'ms:edgeOptions')
+# Seconds to wait for a DevTools command.
+COMMAND_TIMEOUT = 10
+# Response headers that describe the original transfer, not the cached body.
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+# What happened to an intercepted request: failed, answered from the cache, or fetched and stored in the cache.
+OUTCOMES = ('blocked', 'served', 'cached')
+
+
+class InterceptionRules(NamedTuple):
+    """
+    URL patterns, with '*' and '?' wildcards, deciding what happens to the requests of intercepted drivers.
+    """
+    deny: Tuple[str, ...] = ()
+    allow: Tuple[str, ...] = ()
+    cache: Tuple[str, ...] = ()
+    cache_dir: str = '.asset-cache'
+    cache_ttl_hours: float = 24
+
+    def is_denied(self, url: str) -> bool:
+        """
+        Checks if a request is blocked.
+        :param url: The request URL.
+        :return: True if the URL matches a deny pattern and no allow pattern.
+        """
+        return matches(url, self.deny) and not matches(url, self.allow)
+
+    @classmethod
+    def from_config(cls) -> 'InterceptionRules':
+        """
+        Reads the rules from the 'settings.network' section of config.yaml, the cache directory relative to the
+        project root.
+        :return: The interception rules.
+        """
+        conf = ConfigManager()
+        return cls(
+            deny=tuple(conf.get_config_value('settings', 'network', 'deny', default=[]) or []),
+            allow=tuple(conf.get_config_value('settings', 'network', 'allow', default=[]) or []),
+            cache=tuple(conf.get_config_value('settings', 'network', 'cache', default=[]) or []),
+            cache_dir=os.path.join(Project.get_rootpath(),
+                                   conf.get_config_value('settings', 'network', 'cache_dir', default='.asset-cache')),
+            cache_ttl_hours=conf.get_config_value('settings', 'network', 'cache_ttl_hours', default=24))
+
+
+def matches(url: str, patterns: Tuple[str, ...]) -> bool:
+    """
+    Checks a URL against wildcard patterns, with the semantics of the DevTools Fetch domain.
+    :param url: The URL.
+    :param patterns: Patterns with '*' and '?' wildcards.
+    :return: True if a pattern matches the whole URL.
+    """
+    return any(fnmatchcase(url, pattern) for pattern in patterns)
+
+
+class AssetCache:
+    """
+    On-disk cache of response bodies and headers by URL.
+    """
+
+    def __init__(self, directory: str, ttl_hours: float = 24):
+        """
+        Initializes the cache.
+        :param directory: Directory holding the cached responses, created on the first store.
+        :param ttl_hours: Hours a cached response is served before it is fetched again.
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_hours * 3600
+
+    def path(self, url: str) -> str:
+        """
+        Returns the path prefix of a cached response.
+        :param url: The request URL.
+        :return: The path without the '.json' and '.body' extensions.
+        """
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+
+    def load(self, url: str) -> Optional[Tuple[dict, bytes]]:
+        """
+        Reads a cached response.
+        :param url: The request URL.
+        :return: The metadata (status and headers) and the body, or None if the URL is not cached or expired.
+        """
+        path = self.path(url)
+        try:
+            if time.time() - os.path.getmtime(f'{path}.json') > self.ttl_seconds:
+                return None
+            with open(f'{path}.json', 'r') as file:
+                metadata = json.load(file)
+            with open(f'{path}.body', 'rb') as file:
+                return metadata, file.read()
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, status: int, headers: List[dict], body: bytes) -> None:
+        """
+        Writes a response. The metadata is written last, so a partially written entry is never read.
+        :param url: The request URL.
+        :param status: The HTTP status code.
+        :param headers: The response headers as DevTools {name, value} entries.
+        :param body: The decoded response body.
+        :return: None.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(url)
+        for extension, mode, content in (
+                ('body', 'wb', body),
+                ('json', 'w', json.dumps({'url': url, 'status': status, 'headers': headers}))):
+            temporary = f'{path}.{extension}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temporary, mode) as file:
+                file.write(content)
+            os.replace(temporary, f'{path}.{extension}')
+
+
+class NetworkInterceptor:
+    """
+    Intercepts the requests of a Chromium-based browser through the DevTools Fetch domain: blocks denied URLs and
+    answers cacheable assets from an AssetCache, filling it on their first fetch.
+    """
+
+    # Rules applied to every driver launched by DriverManager, None while interception is disabled.
+    active_rules: Optional[InterceptionRules] = None
+    # Counters summed over the tests of the session, None while interception is disabled.
+    totals: Optional[dict] = None
+
+    def __init__(self, websocket_url: str, rules: InterceptionRules):
+        """
+        Initializes the interceptor without connecting.
+        :param websocket_url: The DevTools WebSocket URL of the page target.
+        :param rules: The interception rules.
+        """
+        self.websocket_url = websocket_url
+        self.rules = rules
+        self.cache = AssetCache(rules.cache_dir, rules.cache_ttl_hours)
+        self.connection: Optional[websocket.WebSocket] = None
+        self.send_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.next_id = 0
+        self.pending: Dict[int, Future] = {}
+        self.handlers = ThreadPoolExecutor(max_workers=4, thread_name_prefix='network-interceptor')
+        self.reader: Optional[threading.Thread] = None
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def debugger_address(driver: webdriver) -> Optional[str]:
+        """
+        Returns the DevTools address of a driver's browser.
+        :param driver: The WebDriver.
+        :return: The 'host:port' address, or None if the browser exposes no DevTools endpoint.
+        """
+        capabilities = getattr(driver, 'capabilities', None) or {}
+        for key in DEBUGGER_CAPABILITIES:
+            address = (capabilities.get(key) or {}).get('debuggerAddress')
+            if address:
+                return address
+        return None
+
+    @staticmethod
+    def attach(driver: webdriver, rules: InterceptionRules) -> Optional['NetworkInterceptor']:
+        """
+        Starts intercepting the requests of a driver's page and keeps the interceptor as driver.network_interceptor.
+        The interceptor stops when the driver quits.
+        :param driver: The WebDriver, usually right after its launch.
+        :param rules: The interception rules.
+        :return: The running interceptor, or None if the browser has no DevTools endpoint or it cannot be reached,
+                 e.g. on a remote machine. The driver then runs without interception and a warning is issued.
+        """
+        address = NetworkInterceptor.debugger_address(driver)
+        if address is None:
+            return None
+        interceptor = None
+        try:
+            with urllib.request.urlopen(f'http://{address}/json/list', timeout=COMMAND_TIMEOUT) as response:
+                targets = json.load(response)
+            page = next((target for target in targets if target.get('type') == 'page'), None)
+            if page is None:
+                raise ConnectionError('no page target')
+            interceptor = NetworkInterceptor(page['webSocketDebuggerUrl'], rules)
+            interceptor.start()
+        except (OSError, ValueError, KeyError, RuntimeError, websocket.WebSocketException) as error:
+            if interceptor is not None:
+                interceptor.stop()
+            warnings.warn(f'Network interception disabled for a driver, DevTools at {address} failed: {error}',
+                          RuntimeWarning)
+            return None
+        driver.network_interceptor = interceptor
+        quit_driver = driver.quit
+
+        def quit_and_stop():
+            try:
+                quit_driver()
+            finally:
+                interceptor.stop()
+
+        driver.quit = quit_and_stop
+        return interceptor
+
+    def start(self) -> 'NetworkInterceptor':
+        """
+        Connects to the page and enables interception of the deny and cache patterns.
+        :return: The running interceptor.
+        """
+        # Chromium rejects DevTools connections sending an Origin header unless it was started to allow it.
+        self.connection = websocket.create_connection(self.websocket_url, timeout=None, suppress_origin=True)
+        self.reader = threading.Thread(target=self._read, name='network-interceptor-reader', daemon=True)
+        self.reader.start()
+        patterns = [{'urlPattern': pattern, 'requestStage': 'Request'}
+                    for pattern in dict.fromkeys(self.rules.deny + self.rules.cache)]
+        patterns += [{'urlPattern': pattern, 'requestStage': 'Response'} for pattern in self.rules.cache]
+        self.call('Fetch.enable', {'patterns': patterns})
+        return self
+
+    def stop(self) -> None:
+        """
+        Disconnects from the page, which disables interception, and waits for the reader and the handlers of
+        paused requests to finish.
+        :return: None.
+        """
+        if self.connection is not None:
+            self.connection.close()
+        if self.reader is not None and self.reader is not threading.current_thread():
+            # The reader dispatches paused requests until it sees the connection close, joining it first means no
+            # handler is submitted after the shutdown, the running ones fail fast on the closed connection.
+            self.reader.join(COMMAND_TIMEOUT)
+        self.handlers.shutdown(wait=True, cancel_futures=True)
+        self.connection = None
+
+    def call(self, method: str, params: Optional[dict] = None) -> dict:
+        """
+        Sends a DevTools command and waits for its result.
+        :param method: The command, e.g. 'Fetch.enable'.
+        :param params: The command parameters.
+        :return: The command result.
+        """
+        future = Future()
+        with self.send_lock:
+            if self.connection is None:
+                raise ConnectionError('DevTools connection closed')
+            self.next_id += 1
+            self.pending[self.next_id] = future
+            try:
+                self.connection.send(json.dumps({'id': self.next_id, 'method': method, 'params': params or {}}))
+            except (websocket.WebSocketException, OSError) as error:
+                self.pending.pop(self.next_id, None)
+                raise ConnectionError('DevTools connection closed') from error
+        message = future.result(timeout=COMMAND_TIMEOUT)
+        if 'error' in message:
+            raise RuntimeError(f"DevTools command {method} failed: {message['error'].get('message')}")
+        return message.get('result', {})
+
+    def take_stats(self) -> dict:
+        """
+        Returns the counters since the last call and resets them, e.g. once per test.
+        :return: Dictionary of blocked requests, and requests and bytes served from the cache or stored in it.
+        """
+        with self.stats_lock:
+            stats, self.stats = self.stats, self._empty_stats()
+        return stats
+
+    def _read(self) -> None:
+        """
+        Dispatches command results to their callers and paused requests to the handler threads until the
+        connection closes.
+        :return: None.
+        """
+        try:
+            while True:
+                message = json.loads(self.connection.recv())
+                if 'id' in message:
+                    future = self.pending.pop(message['id'], None)
+                    if future is not None:
+                        future.set_result(message)
+                elif message.get('method') == 'Fetch.requestPaused':
+                    self.handlers.submit(self._on_paused, message['params'])
+        except (websocket.WebSocketException, OSError, AttributeError, ValueError, RuntimeError):
+            for future in list(self.pending.values()):
+                if not future.done():
+                    future.set_exception(ConnectionError('DevTools connection closed'))
+
+    def _on_paused(self, params: dict) -> None:
+        """
+        Decides what happens to a paused request or response.
+        :param params: The Fetch.requestPaused event parameters.
+        :return: None.
+        """
+        request_id, url = params['requestId'], params['request']['url']
+        try:
+            if 'responseStatusCode' in params or 'responseErrorReason' in params:
+                self._store(params)
+            elif self.rules.is_denied(url):
+                self.call('Fetch.failRequest', {'requestId': request_id, 'errorReason': 'BlockedByClient'})
+                self._count('blocked')
+                return
+            elif matches(url, self.rules.cache):
+                cached = self.cache.load(url)
+                if cached is not None:
+                    metadata, body = cached
+                    self.call('Fetch.fulfillRequest', {
+                        'requestId': request_id, 'responseCode': metadata['status'],
+                        'responseHeaders': metadata['headers'], 'body': base64.b64encode(body).decode('ascii')})
+                    self._count('served', len(body))
+                    return
+            self.call('Fetch.continueRequest', {'requestId': request_id})
+        except (ConnectionError, RuntimeError, TimeoutError):
+            # The page navigated away or the browser quit, the request is gone.
+            pass
+
+    def _store(self, params: dict) -> None:
+        """
+        Stores a successful response of a cacheable asset.
+        :param params: The Fetch.requestPaused event parameters of the response stage.
+        :return: None.
+        """
+        if params.get('responseStatusCode') != 200:
+            return
+        result = self.call('Fetch.getResponseBody', {'requestId': params['requestId']})
+        body = base64.b64decode(result['body']) if result.get('base64Encoded') else result['body'].encode('utf-8')
+        headers = [header for header in params.get('responseHeaders', [])
+                   if header['name'].lower() not in DROPPED_HEADERS]
+        self.cache.store(params['request']['url'], 200, headers, body)
+        self._count('cached', len(body))
+
+    def _count(self, outcome: str, size: Optional[int] = None) -> None:
+        """
+        Counts an intercepted request.
+        :param outcome: 'blocked', 'served' or 'cached'.
+        :param size: The body size in bytes, None if it was not downloaded.
+        :return: None.
+        """
+        with self.stats_lock:
+            self.stats[f'{outcome}_requests'] += 1
+            if size is not None:
+                self.stats[f'{outcome}_bytes'] += size
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        """
+        Creates zeroed counters.
+        :return: The counters.
+        """
+        stats = {f'{outcome}_requests': 0 for outcome in OUTCOMES}
+        # A blocked request never downloads its body, so only its count is known.
+        stats.update({f'{outcome}_bytes': 0 for outcome in OUTCOMES if outcome != 'blocked'})
+        return stats
+
+    @staticmethod
+    def add_totals(stats: dict) -> None:
+        """
+        Adds the counters of a test to the session totals.
+        :param stats: Counters returned by take_stats().
+        :return: None.
+        """
+        if NetworkInterceptor.totals is not None:
+            for key, value in stats.items():
+                NetworkInterceptor.totals[key] = NetworkInterceptor.totals.get(key, 0) + value
+
+    @staticmethod
+    def summary() -> str:
+        """
+        Builds a one-line description of the session totals.
+        :return: The summary line.
+        """
+        totals = NetworkInterceptor.totals or {}
+        return (f"network interception: {totals.get('blocked_requests', 0)} requests blocked, "
+                f"{totals.get('served_requests', 0)} served from the cache "
+                f"({totals.get('served_bytes', 0) / 1024:.0f} KB), {totals.get('cached_requests', 0)} cached "
+                f"({totals.get('cached_bytes', 0) / 1024:.0f} KB)")
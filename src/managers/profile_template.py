@@ -0,0 +1,176 @@
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+from urllib.parse import urlparse
+from selenium import webdriver
+from selenium.common import WebDriverException
+from src.managers.driver_pool import CLEAR_STORAGE_SCRIPT
+
+METADATA_FILE = '.template.json'
+# Lock and socket files of a running browser, left behind in the profile directory.
+VOLATILE_FILES = {'SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile', 'DevToolsActivePort',
+                  'lock', '.parentlock', 'parent.lock'}
+# Page loads of the warm-up run. Chromium keeps compiled scripts in its code cache from the second load on.
+WARM_UP_LOADS = 3
+# Seconds a warm-up load may take to complete.
+LOAD_TIMEOUT = 30
+READY_STATE_SCRIPT = 'return document.readyState;'
+
+
+class ProfileTemplate:
+    """
+    A browser profile directory warmed up once against the app, with its HTTP cache, script code cache and
+    first-run state, that every driver gets a private clone of.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initializes the template without building it.
+        :param directory: The template directory, one per browser.
+        """
+        self.directory = directory
+
+    def metadata(self) -> Optional[dict]:
+        """
+        Reads the description of the built template.
+        :return: The browser, URL and build time of the template, or None if it was not built.
+        """
+        try:
+            with open(os.path.join(self.directory, METADATA_FILE), 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def is_built_for(self, browser: str, url: str, built_after: Optional[float] = None) -> bool:
+        """
+        Checks if the template was built for a browser and an app URL. The port is ignored, so a local app served on
+        a free port in every session and worker still matches.
+        :param browser: The browser type.
+        :param url: The application URL.
+        :param built_after: Time before which a template counts as outdated, None accepts any build time.
+        :return: True if the template can be cloned for them.
+        """
+        metadata = self.metadata()
+        return (metadata is not None and metadata.get('browser') == browser
+                and self.url_key(metadata.get('url') or '') == self.url_key(url)
+                and (built_after is None or metadata.get('built_at', 0) >= built_after))
+
+    @staticmethod
+    def url_key(url: str) -> str:
+        """
+        Reduces an app URL to what identifies the app for a template.
+        :param url: The application URL.
+        :return: The URL without port and credentials.
+        """
+        parts = urlparse(url)
+        return parts._replace(netloc=parts.hostname or '').geturl()
+
+    @contextmanager
+    def lock(self, shared: bool = False):
+        """
+        Holds the lock file of the template across processes: exclusive while it is built, shared while it is
+        cloned, so no clone sees the template half replaced. Windows only has exclusive locks.
+        :param shared: Take a shared lock.
+        """
+        path = f'{os.path.abspath(self.directory)}.lock'
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a+b') as file:
+            if platform.system() == 'Windows':
+                import msvcrt
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    def ensure_built(self, launch: Callable[[str], webdriver], browser: str, url: str,
+                     built_after: Optional[float] = None) -> bool:
+        """
+        Builds the template unless it was built for the browser and URL, holding the lock, so concurrent sessions and
+        parallel workers build it once and the others wait for that build.
+        :param launch: Callable launching a WebDriver with the given profile directory.
+        :param browser: The browser type.
+        :param url: The application URL.
+        :param built_after: Time before which a template is rebuilt, e.g. the session start to force one build.
+        :return: True if this call built the template.
+        """
+        with self.lock():
+            if self.is_built_for(browser, url, built_after):
+                return False
+            self.build(launch, browser, url)
+            return True
+
+    def build(self, launch: Callable[[str], webdriver], browser: str, url: str) -> float:
+        """
+        Warms up a new profile by loading the app, then replaces the template with it. The profile is built next to
+        the template and moved in place. Called through ensure_built(), which holds the lock.
+        :param launch: Callable launching a WebDriver with the given profile directory.
+        :param browser: The browser type, recorded in the template metadata.
+        :param url: The application URL to warm up against.
+        :return: The build time in seconds.
+        """
+        start = time.perf_counter()
+        parent = os.path.dirname(os.path.abspath(self.directory))
+        os.makedirs(parent, exist_ok=True)
+        building = tempfile.mkdtemp(prefix='building-', dir=parent)
+        try:
+            driver = launch(building)
+            try:
+                for _ in range(WARM_UP_LOADS):
+                    driver.get(url)
+                    deadline = time.monotonic() + LOAD_TIMEOUT
+                    while driver.execute_script(READY_STATE_SCRIPT) != 'complete' and time.monotonic() < deadline:
+                        time.sleep(0.05)
+                driver.delete_all_cookies()
+                driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            finally:
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+            for root, _, files in os.walk(building):
+                for name in files:
+                    if name in VOLATILE_FILES:
+                        os.remove(os.path.join(root, name))
+            with open(os.path.join(building, METADATA_FILE), 'w') as file:
+                json.dump({'browser': browser, 'url': url, 'built_at': time.time()}, file)
+            previous = f'{self.directory}.previous-{os.getpid()}'
+            if os.path.exists(self.directory):
+                os.replace(self.directory, previous)
+            os.replace(building, self.directory)
+            shutil.rmtree(previous, ignore_errors=True)
+        finally:
+            shutil.rmtree(building, ignore_errors=True)
+        return time.perf_counter() - start
+
+    def clone(self, target: str) -> str:
+        """
+        Copies the template into an empty directory. The copy shares its data blocks with the template on
+        filesystems with reflinks (btrfs, XFS, APFS) and is a plain copy elsewhere. Hard links are not used because
+        browsers write some profile files, like their SQLite databases, in place.
+        :param target: The existing, empty profile directory.
+        :return: The target directory.
+        """
+        command = {'Linux': ['cp', '-a', '--reflink=auto'], 'Darwin': ['cp', '-c', '-R', '-p']}.get(platform.system())
+        with self.lock(shared=True):
+            if command and shutil.which('cp'):
+                result = subprocess.run(command + [os.path.join(self.directory, '.'), target], capture_output=True)
+                if result.returncode == 0:
+                    return target
+            shutil.copytree(self.directory, target, dirs_exist_ok=True)
+        return target
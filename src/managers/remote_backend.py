@@ -0,0 +1,148 @@
+import threading
+from typing import Dict, NamedTuple, Optional
+import urllib3
+from selenium import webdriver
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from src.managers.config_manager import ConfigManager
+from src.managers.driver_manager import DriverManager
+
+# Option factories of DriverManager by W3C browserName, so the option profile applies to remote browsers too.
+OPTION_FACTORIES = {
+    'chrome': DriverManager.get_chrome_options,
+    'MicrosoftEdge': DriverManager.get_edge_options,
+    'firefox': DriverManager.get_firefox_options,
+}
+
+
+class PoolSettings(NamedTuple):
+    """
+    Sizing of the HTTP connection pool carrying the WebDriver commands of remote sessions.
+    """
+    # Connections kept open per remote host, shared by every session of the process.
+    maxsize: int = 10
+    # Remote hosts with a pool of their own.
+    num_pools: int = 4
+    # Make a command wait for a free connection instead of opening one past maxsize that is not kept.
+    block: bool = False
+    # Seconds a command may take, None waits forever.
+    timeout: Optional[float] = 120
+    # Retries of a command on connection errors, before any data was sent.
+    retries: int = 3
+
+    @classmethod
+    def from_config(cls) -> 'PoolSettings':
+        """
+        Reads the pool settings from the 'settings.remote.pool' section of config.yaml.
+        :return: The pool settings, defaults for missing keys.
+        """
+        pool = ConfigManager().get_config_value('settings', 'remote', 'pool', default={}) or {}
+        return cls(**{name: pool[name] for name in cls._fields if pool.get(name) is not None})
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """
+    A keep-alive RemoteConnection whose connection pool is sized by PoolSettings and shared by every connection of
+    the process with the same settings, so sessions reuse each other's open connections to the remote end.
+    """
+
+    # Connection pools by settings, proxy and certificate bundle.
+    managers: Dict[tuple, urllib3.PoolManager] = {}
+    managers_lock = threading.Lock()
+
+    def __init__(self, remote_server_addr: str, pool: Optional[PoolSettings] = None, ignore_proxy: bool = False):
+        """
+        Initializes the connection.
+        :param remote_server_addr: The command executor URL, e.g. 'http://grid:4444'.
+        :param pool: The pool settings, defaults to PoolSettings().
+        :param ignore_proxy: Ignore the proxy of the environment.
+        """
+        # Read by _get_connection_manager, which the base class calls.
+        self.pool = pool or PoolSettings()
+        super().__init__(remote_server_addr, keep_alive=True, ignore_proxy=ignore_proxy)
+
+    def _get_connection_manager(self) -> urllib3.PoolManager:
+        """
+        Returns the shared pool of these settings, creating it on first use.
+        :return: The connection pool manager.
+        """
+        key = (self.pool, self._proxy_url, self._ca_certs)
+        with PooledRemoteConnection.managers_lock:
+            manager = PooledRemoteConnection.managers.get(key)
+            if manager is None:
+                pool_kw = {'maxsize': self.pool.maxsize, 'block': self.pool.block,
+                           'timeout': urllib3.Timeout(total=self.pool.timeout),
+                           'retries': urllib3.Retry(self.pool.retries)}
+                if self._proxy_url:
+                    # All commands go through the proxy, so its single pool is sized.
+                    manager = super()._get_connection_manager()
+                    manager.connection_pool_kw.update(pool_kw)
+                else:
+                    if self._ca_certs:
+                        pool_kw.update({'cert_reqs': 'CERT_REQUIRED', 'ca_certs': self._ca_certs})
+                    manager = urllib3.PoolManager(num_pools=self.pool.num_pools, **pool_kw)
+                PooledRemoteConnection.managers[key] = manager
+            return manager
+
+    def close(self) -> None:
+        """
+        Keeps the shared pool open for the next session when a session quits.
+        :return: None.
+        """
+
+    @staticmethod
+    def open_connections() -> int:
+        """
+        Counts the connections opened by every shared pool since it was created.
+        :return: The number of connections.
+        """
+        with PooledRemoteConnection.managers_lock:
+            return sum(manager.pools[key].num_connections for manager in PooledRemoteConnection.managers.values()
+                       for key in manager.pools.keys())
+
+    @staticmethod
+    def close_all() -> None:
+        """
+        Closes the connections of every shared pool.
+        :return: None.
+        """
+        with PooledRemoteConnection.managers_lock:
+            for manager in PooledRemoteConnection.managers.values():
+                manager.clear()
+            PooledRemoteConnection.managers.clear()
+
+
+def create_driver(url: str, capabilities: Optional[dict] = None, settings: Optional[dict] = None,
+                  pool: Optional[PoolSettings] = None) -> webdriver:
+    """
+    Starts a session on a remote end.
+    :param url: The command executor URL.
+    :param capabilities: Capabilities of the session, 'browserName' defaults to 'chrome'.
+    :param settings: Option profile settings, applied through the DriverManager options of the browser.
+    :param pool: The pool settings, defaults to PoolSettings().
+    :return: The remote WebDriver.
+    """
+    from selenium.webdriver.remote.webdriver import WebDriver
+    capabilities = dict(capabilities or {})
+    browser_name = capabilities.pop('browserName', 'chrome')
+    if browser_name not in OPTION_FACTORIES:
+        raise ValueError(f"Unsupported remote browserName: {browser_name}")
+    # A profile directory of this machine means nothing to the remote end.
+    settings = {name: value for name, value in (settings or {}).items() if name != 'user_data_dir'}
+    options = OPTION_FACTORIES[browser_name](settings)
+    for name, value in capabilities.items():
+        options.set_capability(name, value)
+    return WebDriver(command_executor=PooledRemoteConnection(url, pool), options=options)
+
+
+def launch(settings: dict) -> webdriver:
+    """
+    Launches a session on the remote end of the 'settings.remote' section of config.yaml.
+    :param settings: Option profile settings.
+    :return: The remote WebDriver.
+    """
+    conf = ConfigManager()
+    url = conf.get_config_value('settings', 'remote', 'url', default=None)
+    if not url:
+        raise ValueError("The remote browser requires 'settings.remote.url'")
+    return create_driver(url, conf.get_config_value('settings', 'remote', 'capabilities', default={}),
+                         settings, PoolSettings.from_config())
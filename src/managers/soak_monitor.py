@@ -0,0 +1,202 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+from urllib3.exceptions import HTTPError
+from selenium import webdriver
+from selenium.common import WebDriverException
+
+PROC_DIR = '/proc'
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+JS_HEAP_SCRIPT = 'return performance.memory ? performance.memory.usedJSHeapSize : null;'
+
+
+class ProcessUsage(NamedTuple):
+    """
+    Resource usage of a set of processes.
+    """
+    processes: int
+    rss_bytes: int
+    cpu_s: float
+
+
+def read_process_table() -> Dict[int, tuple]:
+    """
+    Reads the parent, resident set size and CPU time of every process from /proc.
+    :return: Dictionary of pid to (ppid, rss_bytes, cpu_s), empty where /proc is not available.
+    """
+    table = {}
+    try:
+        pids = [int(name) for name in os.listdir(PROC_DIR) if name.isdigit()]
+    except OSError:
+        return table
+    for pid in pids:
+        try:
+            with open(os.path.join(PROC_DIR, str(pid), 'stat'), 'r') as file:
+                stat = file.read()
+        except OSError:
+            continue
+        # The command name in parentheses may contain spaces, the fields after it are fixed.
+        fields = stat[stat.rindex(')') + 2:].split()
+        table[pid] = (int(fields[1]), int(fields[21]) * PAGE_SIZE, (int(fields[11]) + int(fields[12])) / CLOCK_TICKS)
+    return table
+
+
+def descendants(table: Dict[int, tuple], pid: int) -> List[int]:
+    """
+    Lists the descendants of a process.
+    :param table: Process table returned by read_process_table().
+    :param pid: The root process.
+    :return: The pids of every child, grandchild and so on.
+    """
+    children: Dict[int, List[int]] = {}
+    for child, (parent, _, _) in table.items():
+        children.setdefault(parent, []).append(child)
+    found, pending = [], list(children.get(pid, []))
+    while pending:
+        child = pending.pop()
+        found.append(child)
+        pending.extend(children.get(child, []))
+    return found
+
+
+def usage(table: Dict[int, tuple], pids: List[int]) -> ProcessUsage:
+    """
+    Sums the usage of processes.
+    :param table: Process table returned by read_process_table().
+    :param pids: The processes to sum, missing ones are ignored.
+    :return: The summed usage.
+    """
+    rows = [table[pid] for pid in pids if pid in table]
+    return ProcessUsage(len(rows), sum(row[1] for row in rows), sum(row[2] for row in rows))
+
+
+class SoakMonitor:
+    """
+    Samples the memory and CPU of pooled drivers between tests, decides when a driver is recycled and appends
+    every sample to a JSON lines time series.
+    """
+
+    def __init__(self, max_rss_mb: Optional[float] = None, max_commands: Optional[int] = None,
+                 series_path: Optional[str] = None):
+        """
+        Initializes the monitor.
+        :param max_rss_mb: Resident memory of the browser process tree above which a driver is recycled.
+        :param max_commands: Number of WebDriver commands after which a driver is recycled.
+        :param series_path: JSON lines file every sample is appended to, None keeps the samples in memory only.
+        """
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.max_commands = max_commands
+        self.series_path = series_path
+        self.started = time.time()
+        self.lock = threading.Lock()
+        # Counters of every tracked driver by id(driver).
+        self.drivers: Dict[int, dict] = {}
+        self.launches = 0
+        self.samples: List[dict] = []
+        self.recycled: Dict[str, int] = {}
+        if series_path:
+            os.makedirs(os.path.dirname(series_path) or '.', exist_ok=True)
+            open(series_path, 'w').close()
+
+    def attach(self, driver: webdriver) -> webdriver:
+        """
+        Starts counting the commands sent through a driver.
+        :param driver: A newly launched WebDriver.
+        :return: The same WebDriver instance.
+        """
+        with self.lock:
+            self.launches += 1
+            state = self.drivers[id(driver)] = {'number': self.launches, 'commands': 0, 'tests': 0,
+                                                'last_time': None, 'last_cpu': None}
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            state['commands'] += 1
+            return execute(driver_command, params)
+
+        driver.execute = counted_execute
+        return driver
+
+    def sample(self, driver: webdriver, test: str = '') -> dict:
+        """
+        Samples a driver after a test and appends the sample to the time series.
+        :param driver: A WebDriver previously passed to attach().
+        :param test: Name of the test that just used the driver, e.g. its node id.
+        :return: The sample.
+        """
+        state = self.drivers.setdefault(id(driver), {'number': 0, 'commands': 0, 'tests': 0,
+                                                     'last_time': None, 'last_cpu': None})
+        state['tests'] += 1
+        service_process = getattr(getattr(driver, 'service', None), 'process', None)
+        table = read_process_table() if service_process is not None else {}
+        now = time.time()
+        sample = {'time': now, 'elapsed_s': now - self.started, 'test': test, 'driver': state['number'],
+                  'tests': state['tests'], 'commands': state['commands'], 'js_heap_bytes': self._js_heap(driver)}
+        if table:
+            driver_usage = usage(table, [service_process.pid])
+            browser_usage = usage(table, descendants(table, service_process.pid))
+            cpu = driver_usage.cpu_s + browser_usage.cpu_s
+            sample.update({
+                'browser_processes': browser_usage.processes, 'browser_rss_bytes': browser_usage.rss_bytes,
+                'driver_rss_bytes': driver_usage.rss_bytes, 'cpu_s': cpu,
+                'cpu_percent': (100 * (cpu - state['last_cpu']) / (now - state['last_time'])
+                                if state['last_time'] is not None and now > state['last_time'] else None),
+            })
+            state['last_time'], state['last_cpu'] = now, cpu
+        sample['recycle'] = self.recycle_reason(sample)
+        with self.lock:
+            self.samples.append(sample)
+            if self.series_path:
+                with open(self.series_path, 'a') as file:
+                    file.write(json.dumps(sample, separators=(',', ':')) + '\n')
+        return sample
+
+    def recycle_reason(self, sample: dict) -> Optional[str]:
+        """
+        Checks a sample against the thresholds.
+        :param sample: A sample returned by sample().
+        :return: 'rss' or 'commands' if the driver crossed that threshold, None otherwise.
+        """
+        if self.max_rss_bytes and (sample.get('browser_rss_bytes') or 0) > self.max_rss_bytes:
+            return 'rss'
+        if self.max_commands and sample['commands'] > self.max_commands:
+            return 'commands'
+        return None
+
+    def forget(self, driver: webdriver, reason: Optional[str] = None) -> None:
+        """
+        Stops tracking a driver that is being quit.
+        :param driver: The WebDriver.
+        :param reason: The reason it is recycled, None if it is quit for another reason.
+        :return: None.
+        """
+        with self.lock:
+            self.drivers.pop(id(driver), None)
+            if reason:
+                self.recycled[reason] = self.recycled.get(reason, 0) + 1
+
+    def summary(self) -> str:
+        """
+        Builds a one-line description of the soak run.
+        :return: The summary line.
+        """
+        peak = max((sample.get('browser_rss_bytes') or 0 for sample in self.samples), default=0)
+        recycled = ', '.join(f'{count} for {reason}' for reason, count in sorted(self.recycled.items())) or 'none'
+        line = f'soak: {len(self.samples)} samples, peak browser RSS {peak / 1024 / 1024:.0f} MB, recycled {recycled}'
+        return f'{line}, series in {self.series_path}' if self.series_path else line
+
+    @staticmethod
+    def _js_heap(driver: webdriver) -> Optional[int]:
+        """
+        Reads the JS heap of the current page, Chromium only.
+        :param driver: The WebDriver.
+        :return: The used JS heap in bytes, or None if it cannot be read.
+        """
+        try:
+            return driver.execute_script(JS_HEAP_SCRIPT)
+        except (WebDriverException, HTTPError, OSError):
+            # A dead driver process fails with urllib3's or the socket's error instead of a WebDriverException.
+            return None
@@ -1,61 +1,166 @@
-import time
-from typing import List, Optional
+import os
+import re
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 from selenium import webdriver
-from selenium.common import TimeoutException
+from selenium.common import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from src.common.base_page import BasePage
+from src.common.locators import LOCATORS
+from src.common.perf_metrics import perf_action
+from src.common.state_store import StateStore
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as ec
 from src.managers.config_manager import ConfigManager
+from src.utils.project import Project
 
 conf = ConfigManager()
 
 BASE_URL = conf.get_config_value('settings', 'login', 'url', default=None)
-USER_SETTINGS_BUTTON = (
-    By.XPATH, '//div[@class=\'MuiAvatar-root MuiAvatar-circular MuiAvatar-colorDefault css-1f7m2mg\']')
-NUMBER_OF_TASKS_VALUE = (By.XPATH, '//span[@class=\' css-eh0jb8\']')
-ADD_TASK_BUTTON = (By.XPATH, '//button[@class=\'MuiButtonBase-root MuiButton-root MuiButton-text '
-                             'MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root '
-                             'MuiButton-text MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium '
-                             ' css-13dw26a\']')
-TASK_NAME_TEXTBOX = (By.XPATH, '(//input)[1]')
-TASK_DESCRIPTION_TEXTBOX = (By.XPATH, '(//textarea)[1]')
-TASK_CATEGORY_DROP_DOWN_LIST = (By.XPATH, '//div[@class=\'MuiInputBase-root MuiOutlinedInput-root'
-                                          ' MuiInputBase-colorPrimary MuiInputBase-formControl css-9t65zx\']')
-TASK_CATEGORY_BUTTON = (By.XPATH, '//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']')
-TASK_CATEGORY_OPTIONS = (By.XPATH, '//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']/li')
-CREATE_TASK_BUTTON = (By.ID, '//button[@class=\'MuiButtonBase-root MuiButton-root MuiButton-text'
-                             ' MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root '
-                             'MuiButton-text MuiButton-textPrimary MuiButton-sizeMedium'
-                             ' MuiButton-textSizeMedium css-vbgh04\']')
-TASKS_ELEMENTS = (By.XPATH, '//div[@class=\'TaskContainer css-1vzn3uu\']')
-TASK_EDIT_OPTION = (By.XPATH, '(//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']//li)[7]')
-TASK_DELETE_OPTION = (By.XPATH, '(//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']//li)[9]')
-SAVE_TASK_BUTTON = (By.XPATH, '(//button[@class=\'MuiButtonBase-root MuiButton-root MuiButton-text'
-                              ' MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root '
-                              'MuiButton-text MuiButton-textPrimary MuiButton-sizeMedium'
-                              ' MuiButton-textSizeMedium css-1yt8in3\'])[2]')
-TASK_DESCRIPTION_EDIT_FIELD = (By.XPATH, '//textarea[1]')
-DELETE_TASK_BUTTON = (By.XPATH, '//button[@class=\'MuiButtonBase-root'
-                                ' MuiButton-root MuiButton-text MuiButton-textError'
-                                ' MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root'
-                                ' MuiButton-text MuiButton-textError MuiButton-sizeMedium '
-                                'MuiButton-textSizeMedium css-1s4rms\']')
-SEARCH_TASK = (By.XPATH, '//input[@class=\'MuiInputBase-input MuiOutlinedInput-input '
-                         'MuiInputBase-inputAdornedStart css-zhq0ju\']')
-ADD_TASK_TEXT = (By.XPATH, '(//li[@class=\'MuiButtonBase-root MuiMenuItem-root '
-                           'MuiMenuItem-gutters MuiMenuItem-root MuiMenuItem-gutters css-w1k5yy\'])[2]')
+STORAGE_KEY = conf.get_config_value('settings', 'app', 'storage_key', default='user')
+TASK_COLOR = conf.get_config_value('settings', 'app', 'task_color', default='#b624ff')
+STATE_STORE = StateStore(os.path.join(
+    Project.get_rootpath(), conf.get_config_value('settings', 'app', 'snapshot_dir', default='.snapshots')))
+USER_SETTINGS_BUTTON = LOCATORS.register(
+    'USER_SETTINGS_BUTTON', By.XPATH,
+    '//div[@class=\'MuiAvatar-root MuiAvatar-circular MuiAvatar-colorDefault css-1f7m2mg\']')
+NUMBER_OF_TASKS_VALUE = LOCATORS.register('NUMBER_OF_TASKS_VALUE', By.XPATH, '//span[@class=\' css-eh0jb8\']')
+ADD_TASK_BUTTON = LOCATORS.register(
+    'ADD_TASK_BUTTON', By.XPATH, '//button[@class=\'MuiButtonBase-root MuiButton-root MuiButton-text '
+                                 'MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root '
+                                 'MuiButton-text MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium '
+                                 ' css-13dw26a\']')
+TASK_NAME_TEXTBOX = LOCATORS.register('TASK_NAME_TEXTBOX', By.XPATH, '(//input)[1]')
+TASK_DESCRIPTION_TEXTBOX = LOCATORS.register('TASK_DESCRIPTION_TEXTBOX', By.XPATH, '(//textarea)[1]')
+TASK_CATEGORY_DROP_DOWN_LIST = LOCATORS.register(
+    'TASK_CATEGORY_DROP_DOWN_LIST', By.XPATH, '//div[@class=\'MuiInputBase-root MuiOutlinedInput-root'
+                                              ' MuiInputBase-colorPrimary MuiInputBase-formControl css-9t65zx\']')
+TASK_CATEGORY_BUTTON = LOCATORS.register(
+    'TASK_CATEGORY_BUTTON', By.XPATH, '//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']')
+TASK_CATEGORY_OPTIONS = LOCATORS.register(
+    'TASK_CATEGORY_OPTIONS', By.XPATH, '//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']/li')
+CREATE_TASK_LABEL = LOCATORS.register('CREATE_TASK_LABEL', By.XPATH, '//*[normalize-space(text()) = \'Create Task\']')
+CREATE_TASK_BUTTON = LOCATORS.register(
+    'CREATE_TASK_BUTTON', By.XPATH, '//button[@class=\'MuiButtonBase-root MuiButton-root MuiButton-text'
+                                    ' MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium'
+                                    ' MuiButton-root MuiButton-text MuiButton-textPrimary MuiButton-sizeMedium'
+                                    ' MuiButton-textSizeMedium css-vbgh04\']',
+    tuple(CREATE_TASK_LABEL))
+TASKS_ELEMENTS = LOCATORS.register('TASKS_ELEMENTS', By.XPATH, '//div[@class=\'TaskContainer css-1vzn3uu\']')
+TASK_EDIT_OPTION = LOCATORS.register(
+    'TASK_EDIT_OPTION', By.XPATH, '(//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']//li)[7]')
+TASK_DELETE_OPTION = LOCATORS.register(
+    'TASK_DELETE_OPTION', By.XPATH, '(//ul[@class=\'MuiList-root MuiList-padding MuiMenu-list css-r8u8y9\']//li)[9]')
+SAVE_TASK_BUTTON = LOCATORS.register(
+    'SAVE_TASK_BUTTON', By.XPATH, '(//button[@class=\'MuiButtonBase-root MuiButton-root MuiButton-text'
+                                  ' MuiButton-textPrimary MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root '
+                                  'MuiButton-text MuiButton-textPrimary MuiButton-sizeMedium'
+                                  ' MuiButton-textSizeMedium css-1yt8in3\'])[2]')
+TASK_DESCRIPTION_EDIT_FIELD = LOCATORS.register('TASK_DESCRIPTION_EDIT_FIELD', By.XPATH, '//textarea[1]')
+DELETE_TASK_BUTTON = LOCATORS.register(
+    'DELETE_TASK_BUTTON', By.XPATH, '//button[@class=\'MuiButtonBase-root'
+                                    ' MuiButton-root MuiButton-text MuiButton-textError'
+                                    ' MuiButton-sizeMedium MuiButton-textSizeMedium MuiButton-root'
+                                    ' MuiButton-text MuiButton-textError MuiButton-sizeMedium '
+                                    'MuiButton-textSizeMedium css-1s4rms\']')
+SEARCH_TASK = LOCATORS.register(
+    'SEARCH_TASK', By.XPATH, '//input[@class=\'MuiInputBase-input MuiOutlinedInput-input '
+                             'MuiInputBase-inputAdornedStart css-zhq0ju\']')
+ADD_TASK_TEXT = LOCATORS.register(
+    'ADD_TASK_TEXT', By.XPATH, '(//li[@class=\'MuiButtonBase-root MuiMenuItem-root '
+                               'MuiMenuItem-gutters MuiMenuItem-root MuiMenuItem-gutters css-w1k5yy\'])[2]')
+TASK_NAME_SELECTOR = 'h3[class="css-18hlvm3"]'
+TASK_DESCRIPTION_SELECTOR = 'p[class="css-1sarz7y"] > div'
+TASK_CATEGORY_SELECTOR = '.MuiChip-label'
+TASK_OPTIONS_BUTTON_SELECTOR = ('button[class="MuiButtonBase-root MuiIconButton-root '
+                                'MuiIconButton-sizeMedium css-1rvh9qm"]')
+
+# Finds every element matching a CSS or XPath locator, shared by the scripts taking a locator.
+FIND_ALL_SCRIPT = '''
+const findAll = (by, value) => {
+    if (by === 'css selector') return Array.from(document.querySelectorAll(value));
+    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+};
+'''
+# Reads every visible task in a single round trip, fields are looked up relative to the task container's parent.
+TASKS_SNAPSHOT_SCRIPT = FIND_ALL_SCRIPT + '''
+const [by, value, nameSelector, descriptionSelector, categorySelector] = arguments;
+const containers = findAll(by, value);
+const text = (root, selector) => {
+    const element = root.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+const tasks = [];
+for (let i = 0; i < containers.length; i++) {
+    const container = containers[i];
+    if (container.getClientRects().length === 0) continue;
+    const root = container.parentElement || container;
+    tasks.push({
+        index: i,
+        name: text(root, nameSelector),
+        description: text(root, descriptionSelector),
+        category: Array.from(root.querySelectorAll(categorySelector), e => e.innerText.trim()).join(', '),
+    });
+}
+return tasks;
+'''
+TASK_OPTIONS_BUTTON_SCRIPT = FIND_ALL_SCRIPT + '''
+const [by, value, index, buttonSelector] = arguments;
+const container = findAll(by, value)[index];
+return container ? (container.parentElement || container).querySelector(buttonSelector) : null;
+'''
+# Reads the text of the app's task counter, null while it is not rendered.
+TASK_COUNTER_SCRIPT = FIND_ALL_SCRIPT + '''
+const [by, value] = arguments;
+const counter = findAll(by, value)[0];
+return counter ? counter.textContent : null;
+'''
+# Appends tasks to the app's persisted state; categories are matched against the ones the app already stores.
+SEED_TASKS_SCRIPT = '''
+const [key, color, tasks] = arguments;
+const state = JSON.parse(window.localStorage.getItem(key) || '{}');
+state.tasks = state.tasks || [];
+const categories = state.categories || [];
+const now = new Date().toISOString();
+tasks.forEach(([name, description, category], i) => {
+    state.tasks.push({
+        id: window.crypto.randomUUID ? window.crypto.randomUUID() : `${Date.now()}-${i}`,
+        done: false,
+        pinned: false,
+        name: name,
+        description: description,
+        color: color,
+        date: now,
+        category: categories.filter(c => c.name.includes(category)).slice(0, 1),
+    });
+});
+window.localStorage.setItem(key, JSON.stringify(state));
+return tasks.length;
+'''
+
+
+class TaskSnapshot(NamedTuple):
+    """
+    Lightweight record of a task as rendered on the page.
+    """
+    index: int
+    name: str
+    description: Optional[str]
+    category: str
 
 
 class TodoAppPage(BasePage):
-    def __init__(self, driver: webdriver):
+    def __init__(self, driver: webdriver, cache_elements: Optional[bool] = None):
         """
         Initializes the TodoAppPage object with a WebDriver and the URL of the login page.
         :param driver: The WebDriver instance to interact with the browser.
+        :param cache_elements: Reuse located elements until a navigation or a closing dialog invalidates them,
+                               defaults to 'settings.elements.cache' in config.yaml.
         """
-        super().__init__(driver)
+        super().__init__(driver, cache_elements)
 
+    @perf_action
     def create_task(self, task_name: str, task_description: str, category: str) -> None:
         """
         Creates a new task with the specified name, description, and category.
@@ -64,13 +169,71 @@ class TodoAppPage(BasePage):
         :param category: The category of the task to be created.
         :return: None.
         """
-        self.click(USER_SETTINGS_BUTTON)
-        self.click(ADD_TASK_TEXT)
-        self.enter_text(TASK_NAME_TEXTBOX, task_name)
-        self.enter_text(TASK_DESCRIPTION_TEXTBOX, task_description)
-        self.open_categories_drop_down_list()
-        self.select_category(category=category)
-        self.click_element_by_text(text='Create Task')
+        with self.element_scope():
+            self.click(USER_SETTINGS_BUTTON)
+            self.click(ADD_TASK_TEXT)
+            self.fill_task_form(task_name=task_name, task_description=task_description, category=category)
+            self.wait_absent(CREATE_TASK_BUTTON)
+        # Creating the task navigates back to the task list, which replaces the elements located before.
+        self.invalidate_elements()
+
+    @perf_action
+    def create_tasks(self, tasks: Iterable[Tuple[str, str, str]], mode: str = 'ui') -> None:
+        """
+        Creates several tasks at once.
+        :param tasks: Iterable of (task_name, task_description, category) tuples.
+        :param mode: 'ui' creates every task like create_task, through the profile menu and the task creation form,
+                     measured as a single action.
+                     'storage' injects all tasks into the app's persisted state with one script call and reloads once.
+        :return: None.
+        """
+        if mode == 'ui':
+            for task_name, task_description, category in tasks:
+                self.create_task(task_name=task_name, task_description=task_description, category=category)
+        elif mode == 'storage':
+            self.driver.execute_script(SEED_TASKS_SCRIPT, STORAGE_KEY, TASK_COLOR, [list(task) for task in tasks])
+            self.driver.refresh()
+            self.invalidate_elements()
+        else:
+            raise ValueError(f"Unsupported task creation mode: {mode}")
+
+    def fill_task_form(self, task_name: str, task_description: str, category: str) -> None:
+        """
+        Fills the open task creation form and submits it.
+        :param task_name: The name of the task to be created.
+        :param task_description: The description of the task to be created.
+        :param category: The category of the task to be created.
+        :return: None.
+        """
+        # Every form render replaces the fields, so their handles are only reused within one task.
+        with self.element_scope():
+            self.enter_text(TASK_NAME_TEXTBOX, task_name)
+            self.enter_text(TASK_DESCRIPTION_TEXTBOX, task_description)
+            self.open_categories_drop_down_list()
+            self.select_category(category=category)
+            self.click(CREATE_TASK_BUTTON)
+
+    def capture_state(self, name: str, store: Optional[StateStore] = None) -> dict:
+        """
+        Captures the app's persisted state (localStorage and sessionStorage) and stores it under a name.
+        :param name: The snapshot name.
+        :param store: The StateStore to save to, defaults to the one in 'settings.app.snapshot_dir'.
+        :return: The captured state.
+        """
+        state = StateStore.capture(self.driver)
+        (store or STATE_STORE).save(name, state)
+        return state
+
+    @perf_action
+    def restore_state(self, name: str, store: Optional[StateStore] = None) -> None:
+        """
+        Replaces the app's persisted state with a named snapshot in a single script call and reloads the page once.
+        :param name: The snapshot name.
+        :param store: The StateStore to load from, defaults to the one in 'settings.app.snapshot_dir'.
+        :return: None.
+        """
+        StateStore.apply(self.driver, (store or STATE_STORE).load(name))
+        self.invalidate_elements()
 
     def open_categories_drop_down_list(self) -> None:
         """
@@ -85,26 +248,22 @@ class TodoAppPage(BasePage):
         :param category: The category to be selected.
         :return: None.
         """
-        categories = self.find_elements(
-            by_locator=TASK_CATEGORY_OPTIONS,
-            expected_conditions=ec.visibility_of_all_elements_located)
-        for element in categories:
-            if category in element.text:
-                element.click()
-                element.send_keys(Keys.ESCAPE)
-                break
+        element = self.find_element(
+            by_locator=LOCATORS.build(
+                'TASK_CATEGORY_OPTION', By.XPATH, f'{TASK_CATEGORY_OPTIONS.xpath}[contains(., {self.xpath_literal(category)})]'),
+            expected_conditions=ec.element_to_be_clickable)
+        element.click()
+        element.send_keys(Keys.ESCAPE)
 
-    def get_all_tasks(self) -> Optional[List[WebElement]]:
+    def get_all_tasks(self, settle: bool = False) -> Optional[List[WebElement]]:
         """
         Retrieves all task elements on the page.
+        :param settle: Wait for the DOM to settle first, falling back to the current page if it keeps changing.
         :return: A list of WebElement representing the tasks, or an empty list if no tasks are found.
         """
-        try:
-            return self.find_elements(
-                by_locator=TASKS_ELEMENTS,
-                expected_conditions=ec.visibility_of_all_elements_located)
-        except TimeoutException:
-            return []
+        if settle:
+            self.try_settle()
+        return [element for element in self.driver.find_elements(*TASKS_ELEMENTS) if element.is_displayed()]
 
     def get_task_name(self, element: WebElement) -> str:
         """
@@ -114,64 +273,89 @@ class TodoAppPage(BasePage):
         """
         return element.find_element(By.XPATH, '..//h3[@class=\'css-18hlvm3\']').text
 
-    def get_task_description(self, task_name: str) -> str:
+    def snapshot_tasks(self, wait=None) -> List[TaskSnapshot]:
         """
-        Retrieves the description of a task given its name.
-        :param task_name: The name of the task whose description is to be retrieved.
-        :return: The description of the task.
+        Waits for the DOM to settle, then reads every visible task with a single script call.
+        A page that keeps changing is read once the wait ran out.
+        :param wait: time in seconds to wait for the DOM to settle.
+        :return: A list of TaskSnapshot records, or an empty list if no tasks are found.
+        """
+        self.try_settle(wait=wait)
+        return self.read_tasks()
+
+    def try_settle(self, wait=None) -> bool:
+        """
+        Waits for the DOM to settle without failing on a page that keeps changing.
+        :param wait: time in seconds to wait for the DOM to settle.
+        :return: True if the DOM settled, False if the wait ran out.
         """
         try:
-            tasks = self.get_all_tasks()
-            for task in tasks:
-                name = self.get_task_name(element=task)
-                if name == task_name:
-                    return task.find_element(By.XPATH, '..//p[@class=\'css-1sarz7y\']/div').text
+            self.wait_dom_settled(wait=wait)
+            return True
         except TimeoutException:
-            raise
+            return False
+
+    def read_tasks(self) -> List[TaskSnapshot]:
+        """
+        Reads the name, description, category and index of every visible task with a single script call.
+        :return: A list of TaskSnapshot records, or an empty list if no tasks are found.
+        """
+        tasks = self.driver.execute_script(
+            TASKS_SNAPSHOT_SCRIPT, *TASKS_ELEMENTS, TASK_NAME_SELECTOR,
+            TASK_DESCRIPTION_SELECTOR, TASK_CATEGORY_SELECTOR)
+        return [TaskSnapshot(**task) for task in tasks]
+
+    def find_task(self, task_name: str, settle: bool = False) -> Optional[TaskSnapshot]:
+        """
+        Finds the first task with the given name.
+        :param task_name: The name of the task to find.
+        :param settle: Wait for the DOM to settle before reading the tasks, e.g. right after a filter or a removal.
+        :return: The TaskSnapshot of the task, or None if no task has this name.
+        """
+        tasks = self.snapshot_tasks() if settle else self.read_tasks()
+        return next((task for task in tasks if task.name == task_name), None)
 
-    def is_task_exist(self, task_name: str) -> bool:
+    def get_task_description(self, task_name: str, settle: bool = False) -> Optional[str]:
         """
-        Checks if a task with the given name exists.
+        Retrieves the description of a task given its name.
+        :param task_name: The name of the task whose description is to be retrieved.
+        :param settle: Wait for the DOM to settle before reading the tasks.
+        :return: The description of the task, or None if no task has this name.
+        """
+        task = self.find_task(task_name=task_name, settle=settle)
+        return task.description if task else None
+
+    def is_task_exist(self, task_name: str, settle: bool = False) -> bool:
+        """
+        Checks if a task with the given name exists, without raising on a page that keeps changing.
         :param task_name: The name of the task to check for existence.
+        :param settle: Wait for the DOM to settle before reading the tasks.
         :return: True if the task exists, False otherwise.
         """
-        try:
-            tasks = self.get_all_tasks()
-            for task in tasks:
-                name = self.get_task_name(element=task)
-                if name == task_name:
-                    return True
-            return False
-        except TimeoutException:
-            return False
+        return self.find_task(task_name=task_name, settle=settle) is not None
 
     def open_task_options(self, task_name: str) -> None:
         """
-        Opens the options menu for a task with the given name.
+        Opens the options menu for a task with the given name, raising NoSuchElementException if no task has it.
         :param task_name: The name of the task whose options menu is to be opened.
         :return: None.
         """
-        try:
-            tasks = self.get_all_tasks()
-            for task in tasks:
-                name = self.get_task_name(element=task)
-                if name == task_name:
-                    task.find_element(
-                        By.XPATH,
-                        '..//button[@class=\'MuiButtonBase-root MuiIconButton-root'
-                        ' MuiIconButton-sizeMedium css-1rvh9qm\']').click()
-        except TimeoutException:
-            raise
+        task = self.find_task(task_name=task_name)
+        if task is None:
+            raise NoSuchElementException(f'Task not found: {task_name}')
+        self.driver.execute_script(
+            TASK_OPTIONS_BUTTON_SCRIPT, *TASKS_ELEMENTS, task.index, TASK_OPTIONS_BUTTON_SELECTOR).click()
 
+    @perf_action
     def edit_task_name(self, task_name: str) -> None:
         """
         Edits the name of a task.
         :param task_name: The new name for the task.
         :return: None.
         """
-        self.open_edit_option()
-        self.edit_description(task_name=task_name)
-        time.sleep(5)
+        with self.element_scope():
+            self.open_edit_option()
+            self.edit_description(task_name=task_name)
 
     def open_edit_option(self) -> None:
         """
@@ -180,41 +364,54 @@ class TodoAppPage(BasePage):
         """
         self.click(TASK_EDIT_OPTION)
 
-    def edit_description(self, task_name: str) -> None:
+    def edit_description(self, task_name: str, wait=None) -> None:
         """
-        Edits the description of a task.
+        Edits the description of a task and waits until the saved description is displayed.
         :param task_name: The new description for the task.
+        :param wait: time in seconds to wait for the saved description until TimeoutException is thrown.
         :return: None.
         """
-        element = self.find_element(
-            by_locator=TASK_DESCRIPTION_EDIT_FIELD,
-            expected_conditions=ec.visibility_of_element_located)
-        self.clear_field(element=element)
-        time.sleep(2)
-        self.enter_text(TASK_DESCRIPTION_EDIT_FIELD, task_name)
-        self.click(SAVE_TASK_BUTTON)
+        with self.element_scope():
+            self.with_element(TASK_DESCRIPTION_EDIT_FIELD, ec.visibility_of_element_located, self.clear_field)
+            self.enter_text(TASK_DESCRIPTION_EDIT_FIELD, task_name)
+            self.click(SAVE_TASK_BUTTON)
+        self.wait_for_task_description(description=task_name, wait=wait)
+
+    def wait_for_task_description(self, description: str, wait=None) -> None:
+        """
+        Waits until a task with the given description is displayed.
+        :param description: The description to wait for.
+        :param wait: time in seconds to wait until TimeoutException is thrown.
+        :return: None.
+        """
+        self.wait_until(
+            lambda driver: any(task.description == description for task in self.read_tasks()), wait, 'lookup',
+            f'Task description not displayed: {description}')
 
     def clear_field(self, element: WebElement) -> None:
         """
-        Clears the text in a given WebElement.
+        Clears the text in a given WebElement with a single select-all and delete key chord.
         :param element: The WebElement to be cleared.
         :return: None.
         """
-        length = len(element.text)
-        for i in range(length):
-            element.send_keys(Keys.BACKSPACE)
-            time.sleep(0.2)
+        platform_name = str(self.driver.capabilities.get('platformName', '')).lower()
+        modifier = Keys.COMMAND if 'mac' in platform_name else Keys.CONTROL
+        element.send_keys(modifier + 'a' + Keys.NULL + Keys.DELETE)
 
+    @perf_action
     def delete_task(self, task_name: str) -> None:
         """
-        Deletes a task with the given name.
+        Deletes a task with the given name, raising NoSuchElementException if no task has it.
         :param task_name: The name of the task to be deleted.
         :return: None.
         """
-        self.open_task_options(task_name=task_name)
-        self.click(TASK_DELETE_OPTION)
-        self.click(DELETE_TASK_BUTTON)
+        with self.element_scope():
+            self.open_task_options(task_name=task_name)
+            self.click(TASK_DELETE_OPTION)
+            self.click(DELETE_TASK_BUTTON)
+            self.wait_absent(DELETE_TASK_BUTTON)
 
+    @perf_action
     def search_task(self, task_name: str) -> None:
         """
         Searches for a task with the given task name,
@@ -223,9 +420,37 @@ class TodoAppPage(BasePage):
         """
         self.enter_text(SEARCH_TASK, task_name)
 
-    def get_number_of_tasks(self) -> int:
+    def clear_search(self) -> None:
+        """
+        Clears the search field, so every task is listed again.
+        :return: None
+        """
+        self.with_element(SEARCH_TASK, ec.visibility_of_element_located, self.clear_field)
+
+    def get_number_of_tasks(self, source: str = 'elements') -> int:
         """
         Read number of tasks exist.
+        :param source: 'elements' counts the visible tasks once the DOM settled, so it honors the search filter,
+                       'counter' reads the app's own counter of unfinished tasks with a single script call,
+                       regardless of the search filter and without waiting for the list to settle.
         :return: Number of tasks.
         """
-        return len(self.get_all_tasks())
+        if source == 'elements':
+            return len(self.snapshot_tasks())
+        if source == 'counter':
+            return self.read_task_counter()
+        raise ValueError(f"Unsupported task count source: {source}")
+
+    def read_task_counter(self, wait=None) -> int:
+        """
+        Reads the number of unfinished tasks displayed by the app's counter.
+        :param wait: time in seconds to wait for the counter until TimeoutException is thrown.
+        :return: The number of unfinished tasks.
+        """
+        text = self.wait_until(
+            lambda driver: driver.execute_script(TASK_COUNTER_SCRIPT, *NUMBER_OF_TASKS_VALUE), wait, 'lookup',
+            'Task counter not displayed')
+        digits = re.search(r'\d+', text)
+        if digits is None:
+            raise ValueError(f"Unexpected task counter text: {text}")
+        return int(digits.group())
@@ -1,5 +1,6 @@
 import random
 import string
+from typing import Optional
 
 
 class Utils:
@@ -8,15 +9,16 @@ class Utils:
     """
 
     @staticmethod
-    def generate_random_string(length: int) -> str:
+    def generate_random_string(length: int, rng: Optional[random.Random] = None) -> str:
         """
         Generates a random string of the specified length containing only letters.
         Example:
             Calling generate_random_string(10) might return 'aZbCdEfGhI'
 
         :param length: The length of the random string to generate
+        :param rng: Random generator to draw the letters from, e.g. a seeded one, defaults to the random module
         :return: A random string of the specified length containing only letters
         """
         characters = string.ascii_letters
-        random_string = ''.join(random.choices(characters, k=length))
+        random_string = ''.join((rng or random).choices(characters, k=length))
         return random_string
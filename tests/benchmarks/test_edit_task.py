@@ -0,0 +1,49 @@
+import time
+import pytest
+from src.local_app.server import LocalAppServer
+from src.managers.driver_manager import DriverManager
+from src.pages.todo_app_page import TodoAppPage
+
+# Upper bound for editing a task on the local app, the edit path used to idle for about 7 seconds in fixed sleeps.
+EDIT_TASK_BUDGET_SECONDS = 0.5
+ROUNDS = 3
+
+
+@pytest.fixture(scope='module')
+def edit_task_page(pytestconfig, initiate_config, command_tracer):
+    """
+    Starts the local stand-in app and a browser on it whose commands and wait sleeps are traced.
+    :return: The TodoAppPage and the CommandTracer recording its commands.
+    """
+    server = LocalAppServer(
+        host=initiate_config.get_config_value('settings', 'local_app', 'host', default='127.0.0.1')).start()
+    driver = DriverManager.init_driver(browser=pytestconfig.getoption("browser"),
+                                       profile=pytestconfig.getoption("profile"))
+    try:
+        driver.get(server.url)
+        yield TodoAppPage(driver=driver), command_tracer
+    finally:
+        driver.quit()
+        server.stop()
+
+
+@pytest.mark.benchmark
+def test_edit_task_budget(edit_task_page, record_property):
+    """
+    Edits a task ROUNDS times and checks the fastest edit and the time it spent sleeping in waits against the budget.
+    """
+    page, tracer = edit_task_page
+    page.create_task(task_name='edited-task', task_description='description', category='Personal')
+    timings, slept = [], []
+    for i in range(ROUNDS):
+        page.open_task_options(task_name='edited-task')
+        commands = len(tracer.current)
+        start = time.perf_counter()
+        page.edit_task_name(task_name=f'description {i}')
+        timings.append(time.perf_counter() - start)
+        slept.append(sum(record.duration for record in tracer.current[commands:] if record.command == 'sleep'))
+        assert page.get_task_description(task_name='edited-task') == f'description {i}'
+    record_property('edit_task_s', min(timings))
+    record_property('edit_task_sleep_s', min(slept))
+    assert min(slept) < EDIT_TASK_BUDGET_SECONDS, f'Editing a task slept {min(slept):.2f}s'
+    assert min(timings) < EDIT_TASK_BUDGET_SECONDS, f'Editing a task took {min(timings):.2f}s'
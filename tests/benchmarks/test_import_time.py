@@ -0,0 +1,42 @@
+import re
+import subprocess
+import sys
+import pytest
+from src.utils.project import Project
+
+ROUNDS = 3
+# Milliseconds the test modules and the conftest may take to import, i.e. the import part of collection.
+IMPORT_BUDGET_MS = 1000
+# Packages only needed once a driver is resolved or launched, never at collection.
+LAZY_PACKAGES = ['webdriver_manager', 'requests']
+MODULES = ['tests.conftest', 'tests.test_case_00']
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def import_times() -> dict:
+    """
+    Imports the test modules in a fresh interpreter with -X importtime.
+    :return: Dictionary of imported module name to its cumulative import time in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {", ".join(MODULES)}'],
+        cwd=Project.get_rootpath(), capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+@pytest.mark.benchmark
+def test_collection_import_time(record_property):
+    """
+    Checks that importing the test modules stays under the budget and does not import the driver resolution stack.
+    """
+    rounds = [import_times() for _ in range(ROUNDS)]
+    best_ms = min(sum(times[module] for module in MODULES if module in times) for times in rounds) / 1000
+    record_property('collection_import_ms', best_ms)
+    eager = sorted({module for module in rounds[0] if module.split('.')[0] in LAZY_PACKAGES})
+    assert not eager, f'Imported at collection: {", ".join(eager)}'
+    assert best_ms <= IMPORT_BUDGET_MS, f'Importing {", ".join(MODULES)} took {best_ms:.0f}ms'
@@ -0,0 +1,111 @@
+import json
+import os
+import time
+import pytest
+from src.common.command_tracer import CommandTracer
+from src.local_app.server import LocalAppServer
+from src.managers.driver_manager import DriverManager
+from src.pages.todo_app_page import TodoAppPage
+from src.utils.project import Project
+
+SIZES = [100, 1000, 10000]
+ROUNDS = 3
+REPORT_FILE = os.path.join(Project.get_rootpath(), 'reports', 'large_lists.json')
+# Reads the JS heap (Chromium only) and the DOM size of the page.
+BROWSER_MEMORY_SCRIPT = '''
+return {
+    js_heap_used_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+    dom_nodes: document.getElementsByTagName('*').length,
+};
+'''
+
+
+@pytest.fixture(scope='module')
+def large_list_results():
+    """
+    Collects the query timings of every list size and writes them to reports/large_lists.json.
+    :return: Dictionary of list size to query name to measurement.
+    """
+    results = {}
+    yield results
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    for queries in results.values():
+        counter, elements = queries.get('count_counter'), queries.get('count_elements')
+        if counter and elements:
+            queries['counter_speedup'] = elements['best_s'] / counter['best_s'] if counter['best_s'] else None
+    with open(REPORT_FILE, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+@pytest.fixture(scope='module')
+def large_list_page(pytestconfig, initiate_config, command_tracer):
+    """
+    Starts the local stand-in app and a traced browser on it, shared by every list size.
+    :return: The TodoAppPage and the CommandTracer counting its round trips.
+    """
+    server = LocalAppServer(
+        host=initiate_config.get_config_value('settings', 'local_app', 'host', default='127.0.0.1')).start()
+    driver = DriverManager.init_driver(browser=pytestconfig.getoption("browser"),
+                                       profile=pytestconfig.getoption("profile"))
+    try:
+        driver.get(server.url)
+        yield TodoAppPage(driver=driver), command_tracer
+    finally:
+        driver.quit()
+        server.stop()
+
+
+def measure(page: TodoAppPage, tracer: CommandTracer, query) -> dict:
+    """
+    Runs a query ROUNDS times.
+    :param page: The page the query runs on.
+    :param tracer: The tracer attached to the page's driver.
+    :param query: Callable running the query once.
+    :return: The best and mean wall time in seconds, the WebDriver round trips of one run, the query result and
+             the browser memory after the last run.
+    """
+    timings, round_trips, result = [], 0, None
+    for _ in range(ROUNDS):
+        commands = len(tracer.current)
+        start = time.perf_counter()
+        result = query()
+        timings.append(time.perf_counter() - start)
+        round_trips = sum(record.command != 'sleep' for record in tracer.current[commands:])
+    return {'best_s': min(timings), 'mean_s': sum(timings) / len(timings), 'round_trips': round_trips,
+            'result': result, **page.driver.execute_script(BROWSER_MEMORY_SCRIPT)}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('size', SIZES)
+def test_query_scaling(large_list_page, large_list_results, record_property, size):
+    """
+    Seeds the app with size tasks and times every TodoAppPage query on the list.
+    """
+    page, tracer = large_list_page
+    page.driver.execute_script('window.localStorage.clear();')
+    page.create_tasks([(f'task-{i}', f'description {i}', 'Work') for i in range(size)], mode='storage')
+    last = f'task-{size - 1}'
+    deleted = iter(range(size - 2, 0, -1))
+
+    def search():
+        page.search_task(last)
+        page.wait_until(lambda driver: len(page.read_tasks()) == 1, operation='lookup')
+        page.clear_search()
+
+    def delete():
+        page.delete_task(f'task-{next(deleted)}')
+        return page.get_number_of_tasks(source='counter')
+
+    results = large_list_results[size] = {
+        'get_all_tasks': measure(page, tracer, lambda: len(page.get_all_tasks())),
+        'count_elements': measure(page, tracer, lambda: page.get_number_of_tasks(source='elements')),
+        'count_counter': measure(page, tracer, lambda: page.get_number_of_tasks(source='counter')),
+        'is_task_exist': measure(page, tracer, lambda: page.is_task_exist(last)),
+        'search_task': measure(page, tracer, search),
+    }
+    results['delete_task'] = measure(page, tracer, delete)
+    for query, measurement in results.items():
+        record_property(f'{query}_s', measurement['best_s'])
+    assert results['count_elements']['result'] == results['count_counter']['result'] == size
+    assert results['is_task_exist']['result']
+    assert results['delete_task']['result'] == size - ROUNDS
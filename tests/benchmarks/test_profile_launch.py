@@ -0,0 +1,50 @@
+import json
+import os
+import time
+import pytest
+from selenium.webdriver.support import expected_conditions as ec
+from selenium.webdriver.support.ui import WebDriverWait
+from src.managers.driver_manager import DriverManager
+from src.pages.todo_app_page import USER_SETTINGS_BUTTON
+from src.utils.project import Project
+
+PROFILES = ['interactive', 'ci-fast', 'minimal']
+ROUNDS = 3
+REPORT_FILE = os.path.join(Project.get_rootpath(), 'reports', 'profile_launch.json')
+
+
+@pytest.fixture(scope='module')
+def launch_results():
+    """
+    Collects the launch timings of every profile and writes them to reports/profile_launch.json.
+    :return: Dictionary of profile name to list of timings.
+    """
+    results = {}
+    yield results
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    baseline = min(results.get('interactive', [0]) or [0])
+    summary = {
+        profile: {'best_s': min(timings), 'mean_s': sum(timings) / len(timings),
+                  'vs_interactive': min(timings) / baseline if baseline else None}
+        for profile, timings in results.items()}
+    with open(REPORT_FILE, 'w') as file:
+        json.dump(summary, file, indent=2)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('profile', PROFILES)
+def test_launch_to_first_interaction(pytestconfig, app_url, launch_results, record_property, profile):
+    """
+    Measures the time from driver launch until the avatar menu of the app is clickable.
+    """
+    timings = launch_results.setdefault(profile, [])
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        driver = DriverManager.init_driver(browser=pytestconfig.getoption("browser"), profile=profile)
+        try:
+            driver.get(app_url)
+            WebDriverWait(driver, 20).until(ec.element_to_be_clickable(USER_SETTINGS_BUTTON)).click()
+            timings.append(time.perf_counter() - start)
+        finally:
+            driver.quit()
+    record_property('launch_to_first_interaction_s', min(timings))
@@ -0,0 +1,79 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import pytest
+from selenium.webdriver.support import expected_conditions as ec
+from selenium.webdriver.support.ui import WebDriverWait
+from src.managers.driver_manager import DriverManager
+from src.managers.profile_template import ProfileTemplate
+from src.pages.todo_app_page import USER_SETTINGS_BUTTON
+from src.utils.project import Project
+
+ROUNDS = 3
+REPORT_FILE = os.path.join(Project.get_rootpath(), 'reports', 'profile_template.json')
+
+
+@pytest.fixture(scope='module')
+def template_results():
+    """
+    Collects the timings of cold and warm profiles and writes them to reports/profile_template.json.
+    :return: Dictionary of profile kind to list of timings.
+    """
+    results = {}
+    yield results
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    summary = {kind: {key: {'best_s': min(values), 'mean_s': sum(values) / len(values)}
+                      for key, values in timings.items()}
+               for kind, timings in results.items() if isinstance(timings, dict)}
+    cold, warm = summary.get('cold'), summary.get('warm')
+    if cold and warm:
+        summary['warm_vs_cold'] = warm['first_get_s']['best_s'] / cold['first_get_s']['best_s']
+    summary['build_s'] = results.get('build_s')
+    with open(REPORT_FILE, 'w') as file:
+        json.dump(summary, file, indent=2)
+
+
+@pytest.fixture(scope='module')
+def template_workspace(pytestconfig, app_url, template_results):
+    """
+    Builds a fresh profile template in a temporary directory.
+    :return: The temporary directory, holding the template in 'template' and the measured profiles.
+    """
+    workspace = tempfile.mkdtemp(prefix='todo-template-')
+    start = time.perf_counter()
+    DriverManager.create_profile_template(
+        browser=pytestconfig.getoption("browser"), url=app_url, directory=os.path.join(workspace, 'template'),
+        profile=pytestconfig.getoption("profile"))
+    template_results['build_s'] = time.perf_counter() - start
+    yield workspace
+    shutil.rmtree(workspace, ignore_errors=True)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('kind', ['cold', 'warm'])
+def test_first_get_time_to_interactive(pytestconfig, app_url, template_workspace, template_results,
+                                       record_property, kind):
+    """
+    Measures the first driver.get of a new driver until the avatar menu of the app is clickable,
+    with an empty profile and with a clone of the warm profile template.
+    """
+    template = ProfileTemplate(os.path.join(template_workspace, 'template')) if kind == 'warm' else None
+    timings = template_results.setdefault(kind, {'prepare_s': [], 'first_get_s': []})
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        user_data_dir = DriverManager.create_user_data_dir(template_workspace, template)
+        timings['prepare_s'].append(time.perf_counter() - start)
+        driver = DriverManager.init_driver(
+            browser=pytestconfig.getoption("browser"), profile=pytestconfig.getoption("profile"),
+            user_data_dir=user_data_dir)
+        try:
+            start = time.perf_counter()
+            driver.get(app_url)
+            WebDriverWait(driver, 20).until(ec.element_to_be_clickable(USER_SETTINGS_BUTTON))
+            timings['first_get_s'].append(time.perf_counter() - start)
+        finally:
+            driver.quit()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+    record_property('first_get_s', min(timings['first_get_s']))
@@ -0,0 +1,142 @@
+import json
+import os
+import threading
+import time
+import pytest
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from src.managers.driver_manager import DriverManager
+from src.managers.driver_pool import DriverPool
+from src.managers.remote_backend import PooledRemoteConnection, PoolSettings, create_driver
+from src.utils.project import Project
+
+COMMANDS = 200
+SESSIONS = 4
+POOL = PoolSettings(maxsize=SESSIONS)
+REPORT_FILE = os.path.join(Project.get_rootpath(), 'reports', 'remote_backend.json')
+
+
+@pytest.fixture(scope='module')
+def remote_results():
+    """
+    Collects the command timings of every connection kind and writes them to reports/remote_backend.json.
+    :return: Dictionary of measurement name to results.
+    """
+    results = {}
+    yield results
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    with open(REPORT_FILE, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+@pytest.fixture(scope='module')
+def remote_url():
+    """
+    Starts a local chromedriver standing in for the remote end, e.g. a Selenium Grid.
+    :return: The command executor URL of the chromedriver.
+    """
+    from selenium.webdriver.chrome.service import Service
+    service = Service(executable_path=DriverManager.get_executable_path('chrome'))
+    service.start()
+    yield service.service_url
+    service.stop()
+    PooledRemoteConnection.close_all()
+
+
+@pytest.fixture(scope='module')
+def remote_settings(pytestconfig):
+    """
+    Provides the option profile settings of the remote sessions.
+    :return: The settings of the --profile option profile.
+    """
+    return DriverManager.get_profile(pytestconfig.getoption("profile"))
+
+
+def run_commands(driver, count: int = COMMANDS) -> float:
+    """
+    Sends cheap WebDriver commands, so the timing is dominated by the connection.
+    :param driver: The WebDriver.
+    :param count: Number of commands.
+    :return: The mean seconds per command.
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        driver.execute_script('return 1;')
+    return (time.perf_counter() - start) / count
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('connection', ['pooled', 'per_command'])
+def test_command_latency(remote_url, remote_settings, remote_results, record_property, connection):
+    """
+    Times the commands of one remote session over the pooled keep-alive connection and over a new connection
+    per command, the default of a RemoteConnection without keep-alive.
+    """
+    from selenium.webdriver.remote.webdriver import WebDriver
+    opened = PooledRemoteConnection.open_connections()
+    if connection == 'pooled':
+        driver = create_driver(remote_url, {'browserName': 'chrome'}, remote_settings, POOL)
+    else:
+        driver = WebDriver(command_executor=RemoteConnection(remote_url, keep_alive=False),
+                           options=DriverManager.get_chrome_options(remote_settings))
+    try:
+        mean_s = run_commands(driver)
+    finally:
+        driver.quit()
+    remote_results[f'{connection}_command_s'] = mean_s
+    record_property('command_s', mean_s)
+    if connection == 'pooled':
+        # Every command of the session, including the new session and quit commands, shared one connection.
+        assert PooledRemoteConnection.open_connections() - opened <= 1
+
+
+@pytest.mark.benchmark
+def test_concurrent_sessions(remote_url, remote_settings, remote_results, record_property):
+    """
+    Runs SESSIONS remote sessions in parallel threads over the shared pool and checks that they never open more
+    connections than the pool keeps.
+    """
+    drivers = [create_driver(remote_url, {'browserName': 'chrome'}, remote_settings, POOL) for _ in range(SESSIONS)]
+    opened = PooledRemoteConnection.open_connections()
+    means = []
+    try:
+        start = time.perf_counter()
+        threads = [threading.Thread(target=lambda driver=driver: means.append(run_commands(driver)))
+                   for driver in drivers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        for driver in drivers:
+            driver.quit()
+    remote_results['concurrent'] = {'sessions': SESSIONS, 'commands_per_s': SESSIONS * COMMANDS / elapsed,
+                                    'mean_command_s': sum(means) / len(means),
+                                    'connections': PooledRemoteConnection.open_connections()}
+    record_property('commands_per_s', remote_results['concurrent']['commands_per_s'])
+    assert len(means) == SESSIONS
+    assert PooledRemoteConnection.open_connections() - opened <= POOL.maxsize
+
+
+@pytest.mark.benchmark
+def test_session_reuse(remote_url, remote_settings, app_url, remote_results):
+    """
+    Leases a pooled remote session for two consecutive tests and checks that the second test gets the same
+    session, reset, without starting a new one.
+    """
+    pool = DriverPool(factory=lambda: create_driver(remote_url, {'browserName': 'chrome'}, remote_settings, POOL),
+                      url=app_url, size=1)
+    try:
+        start = time.perf_counter()
+        driver = pool.acquire()
+        first_lease_s = time.perf_counter() - start
+        session_id = driver.session_id
+        pool.release(driver)
+        start = time.perf_counter()
+        driver = pool.acquire()
+        second_lease_s = time.perf_counter() - start
+        assert driver.session_id == session_id
+        pool.release(driver)
+    finally:
+        pool.close()
+    remote_results['session_reuse'] = {'first_lease_s': first_lease_s, 'reused_lease_s': second_lease_s}
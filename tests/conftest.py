@@ -1,6 +1,30 @@
+import json
+import os
+import shutil
+import tempfile
+import time
 import pytest
+from src.common.command_tracer import CommandTracer
+from src.common.locators import LOCATORS
+from src.common.perf_metrics import PerfCollector
+from src.local_app.server import LocalAppServer
+from src.managers.browser_backends import BACKENDS
 from src.managers.config_manager import ConfigManager
 from src.managers.driver_manager import DriverManager
+from src.managers.driver_pool import DriverPool
+from src.managers.driver_prewarmer import DriverPrewarmer
+from src.managers.duration_scheduler import GROUP_PREFIX, DurationScheduler
+from src.managers.network_interceptor import InterceptionRules, NetworkInterceptor
+from src.managers.soak_monitor import SoakMonitor
+from src.pages.todo_app_page import STATE_STORE, TodoAppPage
+from src.utils.project import Project
+
+DRIVER_POOL_KEY = pytest.StashKey[DriverPool]()
+DRIVER_PREWARMER_KEY = pytest.StashKey[DriverPrewarmer]()
+# Driver summary lines of the pytest-xdist workers, collected by the controller.
+WORKER_SUMMARIES_KEY = pytest.StashKey[list]()
+# Start time of the run, the controller's under pytest-xdist.
+SESSION_STARTED_KEY = pytest.StashKey[float]()
 
 
 def pytest_addoption(parser):
@@ -9,8 +33,422 @@ def pytest_addoption(parser):
     """
     parser.addoption(
         "--browser", action="store", default="chrome",
-        help="Browser type to use for tests: chrome, firefox, edge, brave"
+        help="Browser type to use for tests: chrome, firefox, edge, brave, remote"
+    )
+    parser.addoption(
+        "--profile", action="store", default=None,
+        help="Browser option profile from config.yaml: interactive, ci-fast, minimal"
+    )
+    parser.addoption(
+        "--workers", action="store", type=int, default=0,
+        help="Number of worker processes running tests in parallel, each with its own browser"
+    )
+    parser.addoption(
+        "--local-app", action="store_true", default=False,
+        help="Run against the bundled local stand-in of the Todo app instead of the configured URL"
+    )
+    parser.addoption(
+        "--run-benchmarks", action="store_true", default=False,
+        help="Run the tests marked as benchmark"
+    )
+    parser.addoption(
+        "--trace-commands", action="store_true", default=False,
+        help="Record every WebDriver command and report the costliest operations per test"
     )
+    parser.addoption(
+        "--trace-report", action="store", default=os.path.join('reports', 'command_trace.json'),
+        help="Path of the JSON report written by --trace-commands"
+    )
+    parser.addoption(
+        "--trace-top", action="store", type=int, default=10,
+        help="Number of costliest operations shown by --trace-commands"
+    )
+    parser.addoption(
+        "--locator-stats", action="store", default=None, const=os.path.join('reports', 'locator_stats.json'),
+        nargs='?', help="Report the lookups, fallback hits, timeouts and latency of every registered locator, "
+                        "optionally to the given JSON path (default: reports/locator_stats.json)"
+    )
+    parser.addoption(
+        "--perf-metrics", action="store_true", default=False,
+        help="Collect browser-side performance metrics per page object action and enforce their budgets"
+    )
+    parser.addoption(
+        "--perf-report", action="store", default=os.path.join('reports', 'perf_metrics.json'),
+        help="Path of the JSON report written by --perf-metrics"
+    )
+    parser.addoption(
+        "--reuse-snapshots", action="store_true", default=False,
+        help="Restore app state snapshots saved by earlier sessions instead of building them once per session"
+    )
+    parser.addoption(
+        "--profile-template", action="store_true", default=False,
+        help="Clone every browser profile from a template warmed up against the app, building it if needed"
+    )
+    parser.addoption(
+        "--rebuild-profile-template", action="store_true", default=False,
+        help="Build the browser profile template again before the session, implies --profile-template"
+    )
+    parser.addoption(
+        "--intercept-network", action="store_true", default=False,
+        help="Block the denied URLs and serve the cacheable assets of 'settings.network' from a local cache, "
+             "Chromium-based browsers only"
+    )
+    parser.addoption(
+        "--soak", action="store_true", default=False,
+        help="Sample the memory and CPU of the pooled browsers between tests and recycle them past the thresholds "
+             "of 'settings.soak'"
+    )
+    parser.addoption(
+        "--soak-series", action="store", default=os.path.join('reports', 'soak.jsonl'),
+        help="Path of the JSON lines time series written by --soak"
+    )
+    parser.addoption(
+        "--num-shards", action="store", type=int, default=0,
+        help="Split the tests into this many shards balanced by their recorded durations"
+    )
+    parser.addoption(
+        "--shard-id", action="store", type=int, default=None,
+        help="Run only this shard, from 0 to --num-shards - 1"
+    )
+    parser.addoption(
+        "--shard-plan", action="store", default=None,
+        help="Path of a shard plan: written with --num-shards without running the tests, read with --shard-id"
+    )
+
+
+def worker_id(config):
+    """
+    Returns the name of the pytest-xdist worker process running the session.
+    :param config: The pytest config.
+    :return: The worker name, e.g. 'gw0', or None on the main process.
+    """
+    return getattr(config, 'workerinput', {}).get('workerid')
+
+
+def is_worker(config) -> bool:
+    """
+    Checks if the session runs in a pytest-xdist worker process, whose reports the main process receives.
+    :param config: The pytest config.
+    :return: True on a pytest-xdist worker, False on the main process.
+    """
+    return worker_id(config) is not None
+
+
+def worker_path(config, path):
+    """
+    Makes a report path relative to the project root unique per xdist worker.
+    :param config: The pytest config.
+    :param path: The report path, e.g. 'reports/soak.jsonl'.
+    :return: The absolute path, with a '-gwN' suffix before the extension on xdist workers.
+    """
+    root, extension = os.path.splitext(path)
+    worker = worker_id(config)
+    return os.path.join(Project.get_rootpath(), f'{root}-{worker}{extension}' if worker else f'{root}{extension}')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """
+    Maps --workers to the worker processes of pytest-xdist, which merges the results into one report.
+    With duration scheduling enabled the workers get balanced groups of tests instead of one test at a time.
+    Writing a shard plan, --num-shards and --shard-plan without --shard-id, only collects the tests.
+    """
+    workers = config.getoption("workers")
+    if is_worker(config):
+        return
+    if config.getoption("num_shards") and config.getoption("shard_plan") and config.getoption("shard_id") is None:
+        config.option.collectonly = True
+        return
+    if workers > 1 and not config.getoption("numprocesses", default=None):
+        if not config.pluginmanager.hasplugin("xdist"):
+            raise pytest.UsageError("--workers requires pytest-xdist, see requirements.txt")
+        config.option.numprocesses = workers
+        if config.option.dist == "no" and ConfigManager().get_config_value(
+                'settings', 'scheduling', 'enabled', default=False):
+            config.option.dist = "loadgroup"
+
+
+def pytest_configure(config):
+    """
+    Registers the custom markers used by the test suite.
+    """
+    config.addinivalue_line("markers", "benchmark: performance benchmark, only runs with --run-benchmarks")
+    for name, description in [('create_a_task', 'creates a single task'), ('edit_task', 'edits a task'),
+                              ('delete_task', 'deletes a task'), ('search_task', 'searches for a task'),
+                              ('same_task_name_twice', 'creates two tasks with the same name'),
+                              ('multiple_tasts_creation', 'creates a random number of tasks')]:
+        config.addinivalue_line("markers", f"{name}: {description}")
+    if not is_worker(config):
+        config.pluginmanager.register(ControllerReports(), 'controller_reports')
+    config.stash[SESSION_STARTED_KEY] = getattr(config, 'workerinput', {}).get('session_started', time.time())
+    if config.getoption("trace_commands") or ConfigManager().get_config_value(
+            'settings', 'tracing', 'enabled', default=False):
+        CommandTracer.active = CommandTracer()
+    if config.getoption("perf_metrics") or ConfigManager().get_config_value(
+            'settings', 'perf', 'enabled', default=False):
+        PerfCollector.results = {}
+    if config.getoption("intercept_network") or ConfigManager().get_config_value(
+            'settings', 'network', 'enabled', default=False):
+        NetworkInterceptor.active_rules = InterceptionRules.from_config()
+        NetworkInterceptor.totals = {}
+    if config.getoption("shard_id") is not None and not (config.getoption("num_shards") or
+                                                         config.getoption("shard_plan")):
+        raise pytest.UsageError("--shard-id requires --num-shards or --shard-plan")
+    if ConfigManager().get_config_value('settings', 'scheduling', 'enabled', default=False) or \
+            config.getoption("num_shards") or config.getoption("shard_plan"):
+        DurationScheduler.active = DurationScheduler.from_config()
+
+
+def pytest_unconfigure(config):
+    """
+    Writes the locator statistics and the performance metrics report, saves the duration history,
+    writes the command trace report and disables network interception and tracing.
+    Under pytest-xdist the reports are written once by the controller, which merged the data of the workers.
+    """
+    NetworkInterceptor.active_rules = None
+    NetworkInterceptor.totals = None
+    worker = is_worker(config)
+    if config.getoption("locator_stats") and not worker:
+        report_path = os.path.join(Project.get_rootpath(), config.getoption("locator_stats"))
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, 'w') as file:
+            json.dump(LOCATORS.report(), file, indent=2)
+    perf_metrics = PerfCollector.results
+    PerfCollector.results = None
+    if perf_metrics and not worker:
+        report_path = os.path.join(Project.get_rootpath(), config.getoption("perf_report"))
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, 'w') as file:
+            json.dump(perf_metrics, file, indent=2)
+    scheduler = DurationScheduler.active
+    DurationScheduler.active = None
+    if scheduler is not None and scheduler.changed and not worker:
+        scheduler.save()
+    tracer = CommandTracer.active
+    if tracer is None:
+        return
+    CommandTracer.active = None
+    if worker:
+        return
+    report_path = os.path.join(Project.get_rootpath(), config.getoption("trace_report"))
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, 'w') as file:
+        json.dump(tracer.report(top=config.getoption("trace_top")), file, indent=2)
+
+
+def pytest_sessionfinish(session):
+    """
+    Hands the command trace, the locator statistics and the driver summaries of a pytest-xdist worker to the
+    controller, see pytest_testnodedown.
+    """
+    workeroutput = getattr(session.config, 'workeroutput', None)
+    if workeroutput is None:
+        return
+    if CommandTracer.active is not None:
+        workeroutput['command_trace'] = CommandTracer.active.export()
+    if session.config.getoption("locator_stats"):
+        workeroutput['locator_stats'] = LOCATORS.stats
+    workeroutput['driver_summaries'] = driver_summaries(session.config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Hands the start time of the run to a pytest-xdist worker, so a requested profile template rebuild happens once
+    for all workers.
+    """
+    node.workerinput['session_started'] = node.config.stash[SESSION_STARTED_KEY]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Merges the command trace and the locator statistics of a finished pytest-xdist worker into the controller's
+    and keeps its driver summaries for the terminal summary.
+    """
+    output = getattr(node, 'workeroutput', None) or {}
+    if CommandTracer.active is not None:
+        CommandTracer.active.merge(output.get('command_trace', {}))
+    LOCATORS.merge(output.get('locator_stats', {}))
+    worker = node.gateway.id
+    node.config.stash.setdefault(WORKER_SUMMARIES_KEY, []).extend(
+        f"[{worker}] {line}" for line in output.get('driver_summaries', []))
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Attributes the traced WebDriver commands, including fixture setup and teardown, to the running test.
+    """
+    if CommandTracer.active is not None:
+        CommandTracer.active.start_test(item.nodeid)
+    try:
+        return (yield)
+    finally:
+        if CommandTracer.active is not None:
+            CommandTracer.active.finish_test()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Reads the browser-side performance metrics of the test in one batch once its body ran,
+    attaches them to the report and fails the test when an action exceeds its budget.
+    """
+    collector = PerfCollector.active
+    if collector is None:
+        return (yield)
+    try:
+        result = yield
+    finally:
+        metrics = collector.collect()
+        item.user_properties.append(('perf_metrics', metrics))
+    violations = collector.check_budgets(metrics)
+    if violations:
+        pytest.fail('Performance budgets exceeded:\n' + '\n'.join(violations))
+    return result
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Adds the marker names of the test to its reports, so the duration history can be kept per marker.
+    """
+    report = yield
+    report.marker_names = sorted({marker.name for marker in item.iter_markers()})
+    return report
+
+
+class ControllerReports:
+    """
+    Plugin registered on the main process only, under pytest-xdist it receives the reports of all workers.
+    """
+
+    @staticmethod
+    def pytest_runtest_logreport(report):
+        """
+        Records the duration of every test phase in the duration history, except for skipped tests and setup
+        errors, and keeps the performance metrics and the network interception counters of every test for the report.
+        """
+        if PerfCollector.results is not None and report.when == 'call':
+            for name, value in report.user_properties:
+                if name == 'perf_metrics':
+                    PerfCollector.results[report.nodeid] = value
+        if NetworkInterceptor.totals is not None and report.when == 'teardown':
+            for name, value in report.user_properties:
+                if name == 'network_interception':
+                    NetworkInterceptor.add_totals(value)
+        if DurationScheduler.active is None:
+            return
+        DurationScheduler.active.record_phase(
+            report.nodeid, report.when, report.duration, report.skipped or (report.when == 'setup' and report.failed),
+            getattr(report, 'marker_names', ()))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips benchmark tests unless --run-benchmarks is given, then schedules the tests by their recorded durations.
+    """
+    if not config.getoption("run_benchmarks"):
+        skip_benchmark = pytest.mark.skip(reason="benchmarks only run with --run-benchmarks")
+        for item in items:
+            if item.get_closest_marker("benchmark"):
+                item.add_marker(skip_benchmark)
+    if DurationScheduler.active is not None:
+        schedule_items(config, items, DurationScheduler.active)
+
+
+def schedule_items(config, items, scheduler):
+    """
+    Orders the tests longest-first, writes the shard plan or selects the requested shard and, in a parallel run,
+    packs the tests of every worker into its own xdist group.
+    :param config: Pytest configuration object.
+    :param items: The collected test items, modified in place.
+    :param scheduler: The DurationScheduler holding the duration history.
+    :return: None.
+    """
+    estimates = {item.nodeid: 0.0 if item.get_closest_marker("skip") else
+                 scheduler.estimate(item.nodeid, [marker.name for marker in item.iter_markers()])
+                 for item in items}
+    position = {nodeid: index for index, nodeid in enumerate(scheduler.order(estimates))}
+    items.sort(key=lambda item: position[item.nodeid])
+    num_shards = config.getoption("num_shards")
+    shard_id = config.getoption("shard_id")
+    plan_path = config.getoption("shard_plan")
+    if shard_id is None and num_shards and plan_path:
+        DurationScheduler.write_plan(DurationScheduler.shard_plan(estimates, num_shards), plan_path)
+    elif shard_id is not None:
+        plan = DurationScheduler.read_plan(plan_path) if plan_path else DurationScheduler.shard_plan(
+            estimates, num_shards)
+        if plan is None:
+            raise pytest.UsageError(f"Shard plan {plan_path} not found, write it with --num-shards first")
+        try:
+            selected = set(DurationScheduler.select_shard(plan, shard_id, estimates))
+        except ValueError as error:
+            raise pytest.UsageError(str(error))
+        deselected = [item for item in items if item.nodeid not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item.nodeid in selected]
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput and config.getvalue("loadgroup") and workerinput['workercount'] > 1:
+        by_nodeid = {item.nodeid: item for item in items}
+        bins = DurationScheduler.pack({nodeid: estimates[nodeid] for nodeid in by_nodeid}, workerinput['workercount'])
+        for index, (_, nodeids) in enumerate(bins):
+            group = pytest.mark.xdist_group(f'{GROUP_PREFIX}{index}')
+            for nodeid in nodeids:
+                by_nodeid[nodeid].add_marker(group)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Reports how many browser launches the driver pool saved and what network interception blocked and served.
+    """
+    if NetworkInterceptor.totals is not None:
+        terminalreporter.write_line(NetworkInterceptor.summary())
+    for line in driver_summaries(config) + config.stash.get(WORKER_SUMMARIES_KEY, []):
+        terminalreporter.write_line(line)
+    if config.getoption("locator_stats"):
+        terminalreporter.section("Locator statistics")
+        for row in LOCATORS.report():
+            terminalreporter.write_line(
+                f"{row['mean_s']:7.3f}s mean {row['max_s']:7.3f}s max {row['lookups']:5d} lookups "
+                f"{row['reuses']:5d} reused {row['stale_recoveries']:4d} stale "
+                f"{row['fallback_hits']:4d} fallback hits {row['timeouts']:4d} timeouts  {row['locator']}")
+    if CommandTracer.active is not None:
+        report = CommandTracer.active.report(top=config.getoption("trace_top"))
+        terminalreporter.section("WebDriver command trace")
+        for nodeid, test in report['tests'].items():
+            terminalreporter.write_line(
+                f"{nodeid}: {test['round_trips']} round trips ({test['wait_polls']} wait polls), "
+                f"{test['command_time_s']:.2f}s in commands, {test['sleep_time_s']:.2f}s sleeping, "
+                f"{test['launch_time_s']:.2f}s launching")
+        terminalreporter.write_line("costliest operations:")
+        for operation in report['top_operations']:
+            terminalreporter.write_line(
+                f"  {operation['duration_s']:8.2f}s {operation['count']:6d}x  {operation['operation']}")
+
+
+def driver_summaries(config):
+    """
+    Describes what the driver pool, its soak monitor and the prewarmer of this process did.
+    :param config: Pytest configuration object.
+    :return: The summary lines, with the hidden and waited launch time per test when verbose.
+    """
+    lines = []
+    pool = config.stash.get(DRIVER_POOL_KEY, None)
+    if pool is not None:
+        lines.append(pool.summary())
+        if pool.monitor is not None:
+            lines.append(pool.monitor.summary())
+    prewarmer = config.stash.get(DRIVER_PREWARMER_KEY, None)
+    if prewarmer is not None:
+        lines.append(prewarmer.summary())
+        if config.getoption("verbose") > 0:
+            lines.extend(f"  {hidden:6.2f}s hidden, {prewarmer.waited[nodeid]:6.2f}s waited  {nodeid}"
+                         for nodeid, hidden in prewarmer.hidden.items())
+    return lines
 
 
 @pytest.fixture(scope='session')
@@ -22,16 +460,257 @@ def initiate_config():
     yield ConfigManager()
 
 
+@pytest.fixture(scope='session')
+def profile_root(pytestconfig, initiate_config):
+    """
+    Fixture to create the directory holding the browser profiles of this worker process.
+    Every driver gets its own profile directory below it, so parallel workers never share a profile.
+    :param pytestconfig: Pytest configuration object for accessing command-line options.
+    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :return: The path of the worker's profile directory.
+    """
+    base_dir = initiate_config.get_config_value('settings', 'parallel', 'profile_root', default=None)
+    if base_dir:
+        os.makedirs(base_dir, exist_ok=True)
+    path = tempfile.mkdtemp(prefix=f'todo-profiles-{worker_id(pytestconfig) or "main"}-', dir=base_dir)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def app_url(pytestconfig, initiate_config):
+    """
+    Fixture to provide the URL of the Todo app under test.
+    Starts the local stand-in app when --local-app is given or 'settings.login.use_local_app' is enabled.
+    :param pytestconfig: Pytest configuration object for accessing command-line options.
+    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :return: The URL of the app.
+    """
+    if not (pytestconfig.getoption("local_app") or
+            initiate_config.get_config_value('settings', 'login', 'use_local_app', default=False)):
+        yield initiate_config.get_config_value('settings', 'login', 'url', default=None)
+        return
+    server = LocalAppServer(
+        host=initiate_config.get_config_value('settings', 'local_app', 'host', default='127.0.0.1'),
+        port=initiate_config.get_config_value('settings', 'local_app', 'port', default=0))
+    server.start()
+    yield server.url
+    server.stop()
+
+
+@pytest.fixture(scope='session')
+def profile_template(pytestconfig, initiate_config, app_url):
+    """
+    Fixture to provide the warm browser profile template every profile directory is cloned from.
+    The template is built with a warm-up run against the app the first time, or when it was built for another
+    browser or app. Parallel workers wait for the first of them to build it and reuse that build.
+    :param pytestconfig: Pytest configuration object for accessing command-line options.
+    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :param app_url: The URL of the Todo app under test.
+    :return: ProfileTemplate instance, or None when profile templates are disabled or the browser runs on another
+             machine.
+    """
+    rebuild = pytestconfig.getoption("rebuild_profile_template")
+    browser = pytestconfig.getoption("browser")
+    if not BACKENDS.is_local(browser) or not (
+            rebuild or pytestconfig.getoption("profile_template") or initiate_config.get_config_value(
+                'settings', 'browser', 'profile_template', 'enabled', default=False)):
+        return None
+    directory = initiate_config.get_config_value(
+        'settings', 'browser', 'profile_template', 'directory', default='.profile-templates')
+    return DriverManager.create_profile_template(
+        browser=browser, url=app_url, directory=os.path.join(Project.get_rootpath(), directory, browser),
+        profile=pytestconfig.getoption("profile"), rebuild=rebuild, started=pytestconfig.stash[SESSION_STARTED_KEY])
+
+
+@pytest.fixture(scope='session')
+def driver_pool(pytestconfig, initiate_config, app_url, profile_root, profile_template):
+    """
+    Fixture to create the session-wide pool of warm WebDriver instances.
+    In soak mode the pool keeps at least one driver and a SoakMonitor samples and recycles its drivers.
+    Remote sessions are kept in the pool too, unless 'settings.remote.reuse_sessions' is disabled.
+    :param pytestconfig: Pytest configuration object for accessing command-line options.
+    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :param app_url: The URL of the Todo app under test.
+    :param profile_root: Directory holding the browser profiles of this worker process.
+    :param profile_template: ProfileTemplate the profiles are cloned from, or None.
+    :return: DriverPool instance, or None when pooling is disabled in the configuration.
+    """
+    size = initiate_config.get_config_value('settings', 'driver', 'pool_size', default=0)
+    if pytestconfig.getoption("browser") == 'remote' and initiate_config.get_config_value(
+            'settings', 'remote', 'reuse_sessions', default=True):
+        # Starting a remote session costs a browser launch plus the network round trips to the remote end.
+        size = max(size or 0, 1)
+    monitor = None
+    if pytestconfig.getoption("soak") or initiate_config.get_config_value('settings', 'soak', 'enabled', default=False):
+        # Soak mode watches reused browsers, so it keeps at least one of them.
+        size = max(size or 0, 1)
+        monitor = SoakMonitor(
+            max_rss_mb=initiate_config.get_config_value('settings', 'soak', 'max_rss_mb', default=None),
+            max_commands=initiate_config.get_config_value('settings', 'soak', 'max_commands', default=None),
+            series_path=worker_path(pytestconfig, pytestconfig.getoption("soak_series")))
+    if not size:
+        yield None
+        return
+    pool = DriverManager.create_pool(
+        browser=pytestconfig.getoption("browser"),
+        url=app_url,
+        size=size,
+        profile=pytestconfig.getoption("profile"),
+        profile_root=profile_root,
+        monitor=monitor,
+        template=profile_template)
+    pytestconfig.stash[DRIVER_POOL_KEY] = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope='session')
+def driver_prewarmer(pytestconfig, initiate_config, app_url, profile_root, profile_template, driver_pool):
+    """
+    Fixture to create the session-wide prewarmer launching the next WebDriver while the current test runs.
+    :param pytestconfig: Pytest configuration object for accessing command-line options.
+    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :param app_url: The URL of the Todo app under test.
+    :param profile_root: Directory holding the browser profiles of this worker process.
+    :param profile_template: ProfileTemplate the profiles are cloned from, or None.
+    :param driver_pool: Session-wide DriverPool, the pool takes precedence over prewarming.
+    :return: DriverPrewarmer instance, or None when prewarming is disabled or a pool is used.
+    """
+    depth = initiate_config.get_config_value('settings', 'driver', 'prewarm_depth', default=0)
+    if not depth or driver_pool is not None:
+        yield None
+        return
+    prewarmer = DriverManager.create_prewarmer(
+        browser=pytestconfig.getoption("browser"),
+        url=app_url,
+        depth=depth,
+        profile=pytestconfig.getoption("profile"),
+        profile_root=profile_root,
+        template=profile_template).start()
+    pytestconfig.stash[DRIVER_PREWARMER_KEY] = prewarmer
+    yield prewarmer
+    prewarmer.stop()
+
+
 @pytest.fixture(scope='function')
-def initiate_driver(pytestconfig, initiate_config):
+def initiate_driver(request, pytestconfig, app_url, profile_root, profile_template, driver_pool, driver_prewarmer):
     """
     Fixture to initialize the WebDriver instance for each test function.
+    Leases a warm driver from the pool when pooling is enabled, takes a prewarmed one when prewarming is enabled,
+    otherwise launches a fresh one.
+    :param request: Pytest request object of the test.
     :param pytestconfig: Pytest configuration object for accessing command-line options.
-    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :param app_url: The URL of the Todo app under test.
+    :param profile_root: Directory holding the browser profiles of this worker process.
+    :param profile_template: ProfileTemplate the profiles are cloned from, or None.
+    :param driver_pool: Session-wide DriverPool, or None when pooling is disabled.
+    :param driver_prewarmer: Session-wide DriverPrewarmer, or None when prewarming is disabled.
     :return: WebDriver instance configured with browser URL from config.
     """
+    if driver_pool is not None:
+        driver = driver_pool.acquire()
+        yield driver
+        record_network_stats(request, driver)
+        driver_pool.release(driver, request.node.nodeid)
+        return
+    if driver_prewarmer is not None:
+        driver = driver_prewarmer.acquire(request.node.nodeid)
+        request.node.user_properties.append(
+            ('prewarm_hidden_launch_s', driver_prewarmer.hidden[request.node.nodeid]))
+        yield driver
+        record_network_stats(request, driver)
+        driver.quit()
+        return
     browser = pytestconfig.getoption("browser")
-    driver = DriverManager.init_driver(browser=browser)
-    driver.get(initiate_config.get_config_value('settings', 'login', 'url', default=None))
+    driver = DriverManager.init_driver(
+        browser=browser, profile=pytestconfig.getoption("profile"),
+        user_data_dir=DriverManager.create_user_data_dir(profile_root, profile_template))
+    driver.get(app_url)
     yield driver
+    record_network_stats(request, driver)
     driver.quit()
+
+
+def record_network_stats(request, driver):
+    """
+    Attaches the requests blocked and served by the network interceptor of a driver since its last test to the
+    report of the current test.
+    :param request: Pytest request object of the test.
+    :param driver: The WebDriver of the test.
+    :return: None.
+    """
+    interceptor = getattr(driver, 'network_interceptor', None)
+    if interceptor is not None:
+        request.node.user_properties.append(('network_interception', interceptor.take_stats()))
+
+
+@pytest.fixture(scope='module')
+def command_tracer():
+    """
+    Fixture to provide the CommandTracer recording the WebDriver commands and wait sleeps of a module's tests.
+    Reuses the session's tracer with --trace-commands, otherwise activates one for the module. Request it before
+    launching drivers, DriverManager attaches the active tracer to every driver it launches.
+    :return: The active CommandTracer.
+    """
+    if CommandTracer.active is not None:
+        yield CommandTracer.active
+        return
+    CommandTracer.active = CommandTracer()
+    try:
+        yield CommandTracer.active
+    finally:
+        CommandTracer.active = None
+
+
+@pytest.fixture(scope='session')
+def state_store():
+    """
+    Fixture to provide the store of named app state snapshots.
+    Snapshots are built once per session, or reused from earlier sessions with --reuse-snapshots.
+    :return: The StateStore of TodoAppPage.
+    """
+    yield STATE_STORE
+
+
+@pytest.fixture(scope='function')
+def app_state(pytestconfig, initiate_driver, state_store):
+    """
+    Fixture to start a test from a named app state.
+    The first test asking for a state builds it through the page object and captures it,
+    later tests restore it with a single script call and one reload.
+    Usage: todo_app = app_state('forty_tasks', lambda page: page.create_tasks(tasks))
+    :param pytestconfig: Pytest configuration object for accessing command-line options.
+    :param initiate_driver: The WebDriver of the test.
+    :param state_store: The StateStore holding the snapshots.
+    :return: Function taking the snapshot name and a builder called with a TodoAppPage,
+             returning the TodoAppPage in the requested state.
+    """
+    def restore(name, build):
+        page = TodoAppPage(driver=initiate_driver)
+        if name in state_store.states or (pytestconfig.getoption("reuse_snapshots") and state_store.exists(name)):
+            page.restore_state(name, store=state_store)
+        else:
+            build(page)
+            page.capture_state(name, store=state_store)
+        return page
+    return restore
+
+
+@pytest.fixture(scope='function', autouse=True)
+def perf_metrics(request, initiate_config):
+    """
+    Fixture to collect browser-side performance metrics around the TodoAppPage actions of tests using a driver.
+    Enabled with --perf-metrics or 'settings.perf.enabled', budgets are read from 'settings.perf.budgets'.
+    :param request: Pytest request object of the test.
+    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :return: The active PerfCollector, or None when collection is disabled or the test uses no driver.
+    """
+    if PerfCollector.results is None or 'initiate_driver' not in request.fixturenames:
+        yield None
+        return
+    PerfCollector.active = PerfCollector(
+        driver=request.getfixturevalue('initiate_driver'),
+        budgets=initiate_config.get_config_value('settings', 'perf', 'budgets', default={}) or {})
+    yield PerfCollector.active
+    PerfCollector.active = None
@@ -0,0 +1,37 @@
+import pytest
+from src.local_app.server import LocalAppServer
+from src.managers.driver_manager import DriverManager
+from src.pages.todo_app_page import TodoAppPage
+
+
+@pytest.fixture(scope='module')
+def local_app_driver(pytestconfig, initiate_config):
+    """
+    Starts the local stand-in app and a browser on it, shared by the tests of a module.
+    :param pytestconfig: Pytest configuration object for accessing command-line options.
+    :param initiate_config: Instance of ConfigManager for fetching configuration values.
+    :return: The WebDriver and the URL of the local app.
+    """
+    server = LocalAppServer(
+        host=initiate_config.get_config_value('settings', 'local_app', 'host', default='127.0.0.1')).start()
+    driver = DriverManager.init_driver(browser=pytestconfig.getoption("browser"),
+                                       profile=pytestconfig.getoption("profile"))
+    try:
+        yield driver, server.url
+    finally:
+        driver.quit()
+        server.stop()
+
+
+@pytest.fixture
+def local_app_page(local_app_driver):
+    """
+    Provides a TodoAppPage on the local app, starting from an empty app state.
+    :param local_app_driver: The module's WebDriver and local app URL.
+    :return: The TodoAppPage.
+    """
+    driver, url = local_app_driver
+    driver.get(url)
+    driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+    driver.get(url)
+    return TodoAppPage(driver=driver)
@@ -0,0 +1,11 @@
+import pytest
+
+TASKS = [(f'task-{i}', f'description {i}', category) for i, category in enumerate(['Home', 'Work', 'Personal'] * 2)]
+
+
+@pytest.mark.parametrize('mode', ['ui', 'storage'])
+def test_create_tasks_lists_every_task(local_app_page, mode):
+    local_app_page.create_tasks(TASKS, mode=mode)
+    tasks = local_app_page.snapshot_tasks()
+    assert sorted(task.name for task in tasks) == sorted(name for name, _, _ in TASKS)
+    assert {task.name: task.description for task in tasks} == {name: description for name, description, _ in TASKS}
@@ -0,0 +1,51 @@
+import pytest
+from selenium.common import WebDriverException
+from src.common.observer_wait import ObserverWait
+
+TASK = ('backend-task', 'backend task description', 'Work')
+
+
+def run_task_flow(page) -> None:
+    """
+    Creates, searches and deletes a task, going through click, text entry, presence and absence waits.
+    :param page: The TodoAppPage on the local app.
+    :return: None.
+    """
+    page.create_task(*TASK)
+    assert page.is_task_exist(TASK[0])
+    page.search_task(TASK[0])
+    assert [task.name for task in page.snapshot_tasks()] == [TASK[0]]
+    page.clear_search()
+    page.delete_task(TASK[0])
+    assert not page.is_task_exist(TASK[0], settle=True)
+
+
+@pytest.fixture
+def observer_calls(monkeypatch):
+    """
+    Counts the waits run in the browser by ObserverWait.
+    :return: A list receiving one entry per observer wait.
+    """
+    calls = []
+    until = ObserverWait.until
+
+    def counted(*args, **kwargs):
+        calls.append(args[2])
+        return until(*args, **kwargs)
+    monkeypatch.setattr(ObserverWait, 'until', staticmethod(counted))
+    return calls
+
+
+@pytest.mark.parametrize('backend', ['polling', 'observer'])
+def test_task_flow_with_wait_backend(local_app_page, observer_calls, backend):
+    local_app_page.wait_backend = backend
+    run_task_flow(local_app_page)
+    assert bool(observer_calls) == (backend == 'observer')
+
+
+def test_observer_backend_falls_back_to_polling(local_app_page, monkeypatch):
+    def unsupported(*args, **kwargs):
+        raise WebDriverException('execute_async_script is not supported')
+    local_app_page.wait_backend = 'observer'
+    monkeypatch.setattr(ObserverWait, 'until', staticmethod(unsupported))
+    run_task_flow(local_app_page)
@@ -6,6 +6,9 @@ from src.utils.utils import Utils
 
 conf = ConfigManager()
 
+# Setup of the tests starting from the 'one_work_task' app state, built by the first of them and restored after.
+ONE_WORK_TASK = [('SeededWorkTask', 'Seeded work task description', 'Work')]
+
 
 class TestTodoApp:
     @pytest.mark.create_a_task
@@ -39,28 +42,20 @@ class TestTodoApp:
             task_name=task_name) == new_task_description, 'Failed to verify task description'
 
     @pytest.mark.delete_task
-    def test_delete_task(self, initiate_driver):
-        task_name = Utils.generate_random_string(length=10)
-        todo_app = TodoAppPage(driver=initiate_driver)
-        todo_app.create_task(
-            task_name=task_name,
-            task_description=Utils.generate_random_string(length=20),
-            category='Work')
+    def test_delete_task(self, app_state):
+        task_name = ONE_WORK_TASK[0][0]
+        todo_app = app_state('one_work_task', lambda page: page.create_tasks(ONE_WORK_TASK))
 
         assert todo_app.is_task_exist(
             task_name=task_name), 'Failed to verify task created'
 
         todo_app.delete_task(task_name=task_name)
-        assert not todo_app.is_task_exist(task_name=task_name)
+        assert not todo_app.is_task_exist(task_name=task_name, settle=True)
 
     @pytest.mark.search_task
-    def test_search_task(self, initiate_driver):
-        task_name = Utils.generate_random_string(length=10)
-        todo_app = TodoAppPage(driver=initiate_driver)
-        todo_app.create_task(
-            task_name=task_name,
-            task_description=Utils.generate_random_string(length=20),
-            category='Work')
+    def test_search_task(self, app_state):
+        task_name = ONE_WORK_TASK[0][0]
+        todo_app = app_state('one_work_task', lambda page: page.create_tasks(ONE_WORK_TASK))
 
         assert todo_app.is_task_exist(
             task_name=task_name), 'Failed to verify task created'
@@ -68,7 +63,7 @@ class TestTodoApp:
         todo_app.search_task(task_name=task_name)
 
         assert todo_app.is_task_exist(
-            task_name=task_name), 'Failed to verify task created'
+            task_name=task_name, settle=True), 'Failed to verify task created'
 
     @pytest.mark.same_task_name_twice
     def test_same_task_name_twice(self, initiate_driver):
@@ -0,0 +1,61 @@
+import pytest
+from selenium.common import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from src.common.base_page import BasePage
+from src.common.observer_wait import ObserverWait
+from src.managers import config_manager
+
+LOCATOR = (By.ID, 'task')
+
+
+class FakeDriver:
+    """
+    Finds one element for every locator and counts the lookups.
+    """
+
+    def __init__(self):
+        self.lookups = 0
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        self.lookups += 1
+        return f'element {value}'
+
+
+def test_observer_backend_falls_back_to_polling_on_webdriver_exception(monkeypatch):
+    def unsupported(*args, **kwargs):
+        raise WebDriverException('execute_async_script is not supported')
+    monkeypatch.setattr(ObserverWait, 'until', staticmethod(unsupported))
+    driver = FakeDriver()
+    assert BasePage(driver).wait_present(LOCATOR, backend='observer', wait=1) == 'element task'
+    assert driver.lookups == 1
+
+
+def test_observer_backend_timeout_is_not_retried_by_polling(monkeypatch):
+    def timed_out(*args, **kwargs):
+        raise TimeoutException('Condition present not met')
+    monkeypatch.setattr(ObserverWait, 'until', staticmethod(timed_out))
+    driver = FakeDriver()
+    with pytest.raises(TimeoutException):
+        BasePage(driver).wait_present(LOCATOR, backend='observer', wait=1)
+    assert driver.lookups == 0
+
+
+def test_polling_backend_never_uses_the_observer(monkeypatch):
+    def unexpected(*args, **kwargs):
+        raise AssertionError('ObserverWait used by the polling backend')
+    monkeypatch.setattr(ObserverWait, 'until', staticmethod(unexpected))
+    assert BasePage(FakeDriver()).wait_present(LOCATOR, backend='polling', wait=1) == 'element task'
+
+
+def test_wait_settings_are_read_per_page_object(monkeypatch):
+    monkeypatch.setattr(config_manager, 'RELOAD_CHECK_INTERVAL', 0)
+    monkeypatch.setenv('CONFIG__SETTINGS__WAITS__BACKEND', 'observer')
+    monkeypatch.setenv('CONFIG__SETTINGS__WAITS__TIMEOUTS__LOOKUP', '3')
+    monkeypatch.setenv('CONFIG__SETTINGS__ELEMENTS__CACHE', 'false')
+    page = BasePage(FakeDriver())
+    assert page.wait_backend == 'observer'
+    assert page.get_timeout('lookup') == 3
+    assert page.element_cache is None
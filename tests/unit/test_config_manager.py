@@ -0,0 +1,84 @@
+import os
+import pytest
+from src.managers.config_manager import OVERRIDE_FILE_VARIABLE, OVERRIDE_PREFIX, ConfigManager
+
+BASE_CONFIG = '''
+settings:
+  driver:
+    pool_size: 1
+    offline: false
+  waits:
+    timeouts:
+      default: 20
+      lookup: 20
+  network:
+    deny: ['*://ads/*']
+  remote:
+    capabilities:
+      browserName: chrome
+'''
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    """
+    Provides a ConfigManager reading BASE_CONFIG from a temporary file, without override variables of the
+    environment.
+    :return: A function writing an optional override file and returning the ConfigManager.
+    """
+    for name in [name for name in os.environ if name.startswith(OVERRIDE_PREFIX)]:
+        monkeypatch.delenv(name)
+    monkeypatch.delenv(OVERRIDE_FILE_VARIABLE, raising=False)
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(BASE_CONFIG)
+
+    def create(override: str = None) -> ConfigManager:
+        if override is not None:
+            override_file = tmp_path / 'override.yaml'
+            override_file.write_text(override)
+            monkeypatch.setenv(OVERRIDE_FILE_VARIABLE, str(override_file))
+        manager = ConfigManager()
+        manager.config_file = str(config_file)
+        return manager
+
+    return create
+
+
+@pytest.mark.parametrize('name, value, keys, expected', [
+    ('CONFIG__SETTINGS__DRIVER__POOL_SIZE', '0', ('driver', 'pool_size'), 0),
+    ('CONFIG__SETTINGS__DRIVER__OFFLINE', 'true', ('driver', 'offline'), True),
+    ('CONFIG__SETTINGS__WAITS__TIMEOUTS__LOOKUP', '2.5', ('waits', 'timeouts', 'lookup'), 2.5),
+    ('CONFIG__SETTINGS__NETWORK__DENY', "['*://a/*', '*://b/*']", ('network', 'deny'), ['*://a/*', '*://b/*']),
+    ('CONFIG__SETTINGS__REMOTE__URL', 'http://grid:4444', ('remote', 'url'), 'http://grid:4444'),
+    ('CONFIG__SETTINGS__REMOTE__CAPABILITIES__BROWSERNAME', 'firefox', ('remote', 'capabilities'),
+     {'browserName': 'firefox'}),
+    ('CONFIG__SETTINGS__REMOTE__CAPABILITIES__PLATFORMNAME', 'linux', ('remote', 'capabilities'),
+     {'browserName': 'chrome', 'platformname': 'linux'}),
+])
+def test_override_variables_are_parsed_as_yaml(config_manager, monkeypatch, name, value, keys, expected):
+    monkeypatch.setenv(name, value)
+    assert config_manager().get_config_value('settings', *keys) == expected
+
+
+def test_override_variables_keep_sibling_keys(config_manager, monkeypatch):
+    monkeypatch.setenv('CONFIG__SETTINGS__WAITS__TIMEOUTS__LOOKUP', '5')
+    assert config_manager().get_config_value('settings', 'waits', 'timeouts') == {'default': 20, 'lookup': 5}
+
+
+def test_override_file_is_merged_over_config_file(config_manager):
+    conf = config_manager('settings:\n  driver:\n    pool_size: 3\n')
+    assert conf.get_config_value('settings', 'driver') == {'pool_size': 3, 'offline': False}
+
+
+def test_override_variables_take_precedence_over_override_file(config_manager, monkeypatch):
+    monkeypatch.setenv('CONFIG__SETTINGS__DRIVER__POOL_SIZE', '4')
+    conf = config_manager('settings:\n  driver:\n    pool_size: 3\n    offline: true\n')
+    assert conf.get_config_value('settings', 'driver') == {'pool_size': 4, 'offline': True}
+
+
+def test_returned_values_are_copies(config_manager):
+    conf = config_manager()
+    conf.get_config_value('settings', 'waits', 'timeouts')['default'] = 0
+    conf.get_config_value('settings', 'network', 'deny').append('*://mutated/*')
+    assert conf.get_config_value('settings', 'waits', 'timeouts')['default'] == 20
+    assert conf.get_config_value('settings', 'network', 'deny') == ['*://ads/*']
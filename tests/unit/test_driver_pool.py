@@ -0,0 +1,131 @@
+import pytest
+from selenium.common import WebDriverException
+from urllib3.exceptions import MaxRetryError
+from src.managers.driver_pool import CLEAR_STORAGE_SCRIPT, DriverPool
+
+URL = 'http://app.test/'
+
+
+class FakeDriver:
+    """
+    Records the commands of a pool's driver, failing the commands named in fail with the given error.
+    """
+
+    def __init__(self, fail=None, error=None):
+        self.fail = fail or set()
+        self.error = error
+        self.commands = []
+        self.current_url = URL
+        self.window_handles = ['main']
+        self.switch_to = self
+        self.quit_calls = 0
+
+    def _run(self, command, *args):
+        self.commands.append((command, *args))
+        if command in self.fail:
+            raise self.error
+
+    def get(self, url):
+        self._run('get', url)
+        self.current_url = url
+
+    def window(self, handle):
+        self._run('switch_to_window', handle)
+
+    def close(self):
+        self._run('close')
+
+    def delete_all_cookies(self):
+        self._run('delete_all_cookies')
+
+    def execute_script(self, script):
+        self._run('execute_script', script)
+
+    def quit(self):
+        self.quit_calls += 1
+        self._run('quit')
+
+
+class FakeFactory:
+    """
+    Launches FakeDrivers built by make, keeping every launched driver.
+    """
+
+    def __init__(self, make=FakeDriver):
+        self.make = make
+        self.drivers = []
+
+    def __call__(self):
+        self.drivers.append(self.make())
+        return self.drivers[-1]
+
+
+def test_acquire_launches_a_driver_on_the_app_url():
+    factory = FakeFactory()
+    pool = DriverPool(factory, URL)
+    driver = pool.acquire()
+    assert driver.commands == [('get', URL)]
+    assert (pool.launches, pool.leases, pool.saved_launches) == (1, 1, 0)
+
+
+def test_release_resets_and_reuses_the_driver():
+    factory = FakeFactory()
+    pool = DriverPool(factory, URL)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert driver.commands[1:] == [('switch_to_window', 'main'), ('delete_all_cookies',),
+                                   ('execute_script', CLEAR_STORAGE_SCRIPT), ('get', URL)]
+    assert pool.acquire() is driver
+    assert (pool.launches, pool.leases, pool.saved_launches) == (1, 2, 1)
+
+
+def test_reset_closes_extra_windows_and_returns_to_the_app_origin():
+    driver = FakeDriver()
+    driver.window_handles = ['main', 'popup']
+    driver.current_url = 'http://elsewhere.test/page'
+    DriverPool(FakeFactory(), URL).reset(driver)
+    assert driver.commands[:4] == [('switch_to_window', 'popup'), ('close',), ('switch_to_window', 'main'),
+                                   ('get', URL)]
+
+
+def test_release_beyond_the_pool_size_quits_the_driver():
+    pool = DriverPool(FakeFactory(), URL, size=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert pool.idle == [first]
+    assert second.quit_calls == 1
+
+
+@pytest.mark.parametrize('error', [
+    WebDriverException('browser crashed'),
+    MaxRetryError(None, URL, 'connection refused'),
+    ConnectionRefusedError('driver process is gone'),
+])
+def test_release_retires_a_driver_that_fails_to_reset(error):
+    factory = FakeFactory(lambda: FakeDriver(fail={'delete_all_cookies', 'quit'}, error=error))
+    pool = DriverPool(factory, URL)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.idle == []
+    assert pool.reset_failures == 1
+    assert driver.quit_calls == 1
+
+
+def test_acquire_quits_a_driver_that_fails_to_load_the_app():
+    factory = FakeFactory(lambda: FakeDriver(fail={'get'}, error=WebDriverException('net::ERR')))
+    pool = DriverPool(factory, URL)
+    with pytest.raises(WebDriverException):
+        pool.acquire()
+    assert factory.drivers[0].quit_calls == 1
+    assert (pool.launches, pool.leases) == (1, 0)
+
+
+def test_close_quits_every_idle_driver():
+    pool = DriverPool(FakeFactory(), URL, size=2)
+    drivers = [pool.acquire(), pool.acquire()]
+    for driver in drivers:
+        pool.release(driver)
+    pool.close()
+    assert pool.idle == []
+    assert [driver.quit_calls for driver in drivers] == [1, 1]
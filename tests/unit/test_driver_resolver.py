@@ -0,0 +1,122 @@
+import json
+import os
+import time
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from src.managers import driver_resolver
+from src.managers.driver_resolver import UNKNOWN_VERSION, DriverResolver
+
+VERSION = '126.0.6478.126'
+
+
+@pytest.fixture
+def driver_file(tmp_path):
+    """
+    Provides an existing file standing in for a resolved chromedriver.
+    :return: The path of the file.
+    """
+    path = tmp_path / 'chromedriver'
+    path.write_text('')
+    return str(path)
+
+
+@pytest.fixture
+def make_resolver(tmp_path, monkeypatch):
+    """
+    Provides resolvers on a temporary manifest, with the browser version probe and webdriver_manager stubbed.
+    :return: A function taking the manifest entries, the DriverResolver arguments and the result of install(),
+             an exception to raise or a path to return, and returning the resolver.
+    """
+    monkeypatch.setattr(DriverResolver, '_run_version_command', staticmethod(lambda browser: f'Chrome {VERSION}'))
+    monkeypatch.setattr(driver_resolver.platform, 'system', lambda: 'Linux')
+    monkeypatch.setattr(driver_resolver.shutil, 'which', lambda name: None)
+
+    def create(manifest=None, installed=None, **kwargs):
+        path = tmp_path / 'manifest.json'
+        if manifest is not None:
+            path.write_text(json.dumps(manifest))
+        resolver = DriverResolver(manifest_path=str(path), **kwargs)
+        resolver.installs = []
+
+        def install(browser):
+            resolver.installs.append(browser)
+            if isinstance(installed, Exception):
+                raise installed
+            return installed
+        resolver.install = install
+        return resolver
+
+    return create
+
+
+def entry(path, age_hours):
+    """
+    Builds a manifest with one chromedriver entry.
+    :param path: The recorded driver path.
+    :param age_hours: Hours since the entry was resolved.
+    :return: The manifest content.
+    """
+    return {f'chrome:{VERSION}': {'path': path, 'resolved_at': time.time() - age_hours * 3600}}
+
+
+def test_browser_version_is_read_from_the_version_command(make_resolver):
+    resolver = make_resolver()
+    assert resolver.manifest_key('chrome') == f'chrome:{VERSION}'
+
+
+def test_browser_version_is_unknown_without_output(make_resolver, monkeypatch):
+    monkeypatch.setattr(DriverResolver, '_run_version_command', staticmethod(lambda browser: None))
+    assert make_resolver().get_browser_version('firefox') == UNKNOWN_VERSION
+
+
+def test_fresh_manifest_entry_is_used_without_install(make_resolver, driver_file):
+    resolver = make_resolver(entry(driver_file, age_hours=1), installed='/new/chromedriver', ttl_hours=24)
+    assert resolver.resolve('chrome') == driver_file
+    assert resolver.installs == []
+
+
+def test_expired_manifest_entry_is_resolved_again(make_resolver, driver_file):
+    resolver = make_resolver(entry(driver_file, age_hours=25), installed='/new/chromedriver', ttl_hours=24)
+    assert resolver.resolve('chrome') == '/new/chromedriver'
+    assert resolver.installs == ['chrome']
+
+
+def test_expired_manifest_entry_is_used_when_install_fails(make_resolver, driver_file):
+    resolver = make_resolver(entry(driver_file, age_hours=25), installed=RequestsConnectionError('offline'))
+    assert resolver.resolve('chrome') == driver_file
+
+
+def test_manifest_entry_of_a_removed_file_is_ignored(make_resolver, tmp_path):
+    resolver = make_resolver(entry(str(tmp_path / 'removed'), age_hours=1), installed='/new/chromedriver')
+    assert resolver.resolve('chrome') == '/new/chromedriver'
+
+
+def test_offline_mode_uses_expired_entries_and_never_installs(make_resolver, driver_file):
+    resolver = make_resolver(entry(driver_file, age_hours=1000), installed='/new/chromedriver', offline=True)
+    assert resolver.resolve('chrome') == driver_file
+    assert resolver.installs == []
+
+
+def test_path_is_the_last_fallback(make_resolver, monkeypatch):
+    monkeypatch.setattr(driver_resolver.shutil, 'which', lambda name: f'/usr/bin/{name}')
+    resolver = make_resolver(installed=OSError('no network'))
+    assert resolver.resolve('chrome') == '/usr/bin/chromedriver'
+    assert resolver.installs == ['chrome']
+
+
+def test_offline_mode_without_a_driver_raises(make_resolver):
+    with pytest.raises(FileNotFoundError):
+        make_resolver(offline=True).resolve('chrome')
+
+
+def test_unreadable_manifest_is_treated_as_empty(make_resolver, tmp_path):
+    (tmp_path / 'manifest.json').write_text('{not json')
+    assert make_resolver().manifest == {}
+
+
+def test_manifest_is_saved_atomically(tmp_path):
+    resolver = DriverResolver(manifest_path=str(tmp_path / 'drivers' / 'manifest.json'))
+    resolver.manifest = {'chrome:1': {'path': '/bin/chromedriver', 'resolved_at': 0}}
+    resolver._save_manifest()
+    assert os.listdir(tmp_path / 'drivers') == ['manifest.json']
+    assert DriverResolver(manifest_path=str(tmp_path / 'drivers' / 'manifest.json')).manifest == resolver.manifest
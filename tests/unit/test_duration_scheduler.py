@@ -0,0 +1,136 @@
+import json
+import pytest
+from src.managers.duration_scheduler import GROUP_PREFIX, DurationScheduler
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    """
+    Provides a DurationScheduler with an empty history kept in a temporary directory.
+    :return: DurationScheduler instance.
+    """
+    return DurationScheduler(str(tmp_path / 'history' / 'durations.json'), smoothing=0.5, default_duration=3.0)
+
+
+def run_test(scheduler, nodeid, durations, markers=(), discard=None):
+    """
+    Records the setup, call and teardown phases of a test run.
+    :param scheduler: The DurationScheduler.
+    :param nodeid: The node id reported for the test.
+    :param durations: Seconds of the setup, call and teardown phases.
+    :param markers: Names of the markers of the test.
+    :param discard: The phase that invalidates the run, None for a valid run.
+    :return: None.
+    """
+    for when, duration in zip(('setup', 'call', 'teardown'), durations):
+        scheduler.record_phase(nodeid, when, duration, when == discard, markers)
+
+
+def test_record_phase_records_the_total_after_teardown(scheduler):
+    scheduler.record_phase('test_a', 'setup', 1.0, False)
+    scheduler.record_phase('test_a', 'call', 2.0, False)
+    assert not scheduler.has_history
+    scheduler.record_phase('test_a', 'teardown', 0.5, False, ['slow', 'parametrize'])
+    assert scheduler.tests == {'test_a': {'duration_s': 3.5, 'runs': 1, 'markers': ['slow']}}
+    assert scheduler.running == {}
+    assert scheduler.changed
+
+
+def test_record_phase_strips_the_xdist_group_suffix(scheduler):
+    run_test(scheduler, f'test_a@{GROUP_PREFIX}0', (1.0, 2.0, 0.5))
+    run_test(scheduler, f'test_a@{GROUP_PREFIX}1', (0.5, 1.0, 0.0))
+    run_test(scheduler, 'test_b[x@y]', (1.0, 1.0, 1.0))
+    assert scheduler.tests['test_a'] == {'duration_s': 2.5, 'runs': 2, 'markers': []}
+    assert 'test_b[x@y]' in scheduler.tests
+
+
+@pytest.mark.parametrize('discard', ['setup', 'call', 'teardown'])
+def test_record_phase_skips_runs_with_a_discarded_phase(scheduler, discard):
+    run_test(scheduler, 'test_a', (1.0, 2.0, 0.5), discard=discard)
+    assert not scheduler.has_history
+    assert scheduler.running == {}
+    assert not scheduler.changed
+
+
+def test_save_and_load_round_trip(scheduler):
+    run_test(scheduler, 'test_a', (1.0, 2.0, 1.0), ['slow'])
+    run_test(scheduler, 'test_b', (0.0, 2.0, 0.0), ['slow', 'fast'])
+    scheduler.save()
+    with open(scheduler.history_file) as file:
+        assert json.load(file)['markers'] == {'fast': 2.0, 'slow': 3.0}
+    loaded = DurationScheduler(scheduler.history_file)
+    assert loaded.tests == scheduler.tests
+    assert loaded.markers == {'fast': 2.0, 'slow': 3.0}
+    assert not loaded.changed
+
+
+@pytest.mark.parametrize('content', ['', '{"tests": ', '[]', '{"markers": {}}'])
+def test_load_treats_unreadable_history_as_empty(tmp_path, content):
+    history_file = tmp_path / 'durations.json'
+    history_file.write_text(content)
+    assert not DurationScheduler(str(history_file)).has_history
+
+
+def test_load_without_history_file(scheduler):
+    assert scheduler.tests == {}
+    assert scheduler.markers == {}
+
+
+def test_estimate_prefers_the_test_history(tmp_path):
+    history_file = tmp_path / 'durations.json'
+    history_file.write_text(json.dumps({'tests': {
+        'test_a': {'duration_s': 1.0, 'runs': 1, 'markers': ['slow']},
+        'test_b': {'duration_s': 7.0, 'runs': 1, 'markers': ['slow', 'search']},
+        'test_c': {'duration_s': 2.0, 'runs': 1, 'markers': ['fast']},
+    }}))
+    scheduler = DurationScheduler(str(history_file), default_duration=3.0)
+    assert scheduler.estimate('test_a', ['slow']) == 1.0
+    assert scheduler.estimate('test_new', ['fast', 'slow']) == 4.0
+    assert scheduler.estimate('test_new', ['search', 'unknown']) == 7.0
+    assert scheduler.estimate('test_new', ['unknown']) == 3.0
+    assert scheduler.estimate('test_new') == 3.0
+
+
+def test_order_keeps_collection_order_on_ties():
+    estimates = {'test_b': 5.0, 'test_c': 9.0, 'test_a': 5.0}
+    assert DurationScheduler.order(estimates) == ['test_c', 'test_b', 'test_a']
+
+
+def test_order_without_history_keeps_collection_order():
+    estimates = {f'test_{name}': 5.0 for name in 'zyx'}
+    assert DurationScheduler.order(estimates) == ['test_z', 'test_y', 'test_x']
+
+
+def test_pack_balances_longest_first():
+    estimates = {'a': 7.0, 'b': 5.0, 'c': 4.0, 'd': 3.0, 'e': 1.0}
+    assert DurationScheduler.pack(estimates, 2) == [(10.0, ['a', 'd']), (10.0, ['b', 'c', 'e'])]
+
+
+def test_pack_leaves_extra_bins_empty():
+    assert DurationScheduler.pack({'a': 2.0}, 3) == [(2.0, ['a']), (0.0, []), (0.0, [])]
+
+
+def test_shard_plan():
+    plan = DurationScheduler.shard_plan({'a': 3.0, 'b': 2.0, 'c': 2.0}, 2)
+    assert plan == {
+        'num_shards': 2,
+        'estimated_total_s': 7.0,
+        'shards': [{'shard_id': 0, 'estimated_s': 3.0, 'tests': ['a']},
+                   {'shard_id': 1, 'estimated_s': 4.0, 'tests': ['b', 'c']}],
+    }
+
+
+@pytest.mark.parametrize('shard_id, expected', [
+    (0, ['a', 'new']),
+    (1, ['b', 'c']),
+])
+def test_select_shard_sends_unplanned_tests_to_the_lightest_shard(shard_id, expected):
+    plan = DurationScheduler.shard_plan({'a': 3.0, 'b': 2.0, 'c': 2.0}, 2)
+    assert DurationScheduler.select_shard(plan, shard_id, ['a', 'b', 'new', 'c']) == expected
+
+
+@pytest.mark.parametrize('shard_id', [-1, 2])
+def test_select_shard_rejects_out_of_range_ids(shard_id):
+    plan = DurationScheduler.shard_plan({'a': 1.0}, 2)
+    with pytest.raises(ValueError):
+        DurationScheduler.select_shard(plan, shard_id, ['a'])
@@ -0,0 +1,60 @@
+import random
+from selenium.common import TimeoutException
+from src.load.runner import LoadSession
+from src.pages.todo_app_page import TaskSnapshot
+
+
+class FakePage:
+    """
+    Stands in for TodoAppPage, keeping created tasks in a list and filtering them by the search term.
+    """
+
+    def __init__(self):
+        self.tasks = []
+        self.term = ''
+
+    def create_task(self, task_name, task_description, category):
+        self.tasks.append(TaskSnapshot(len(self.tasks), task_name, task_description, category))
+
+    def search_task(self, task_name):
+        self.term = task_name
+
+    def clear_search(self):
+        self.term = ''
+
+    def read_tasks(self):
+        return [task for task in self.tasks if self.term in task.name]
+
+    def is_task_exist(self, task_name, settle=False):
+        raise AssertionError('The search scenario must not settle the DOM')
+
+    def wait_until(self, condition, wait=None, operation='default', message=''):
+        value = condition(None)
+        if not value:
+            raise TimeoutException(message)
+        return value
+
+
+def test_search_reads_the_task_list_without_settling():
+    session = LoadSession(FakePage(), random.Random(1))
+    session.create()
+    session.search()
+    assert [(sample.operation, sample.error) for sample in session.samples] == [
+        ('create', None), ('search', None), ('clear_search', None)]
+
+
+def test_search_of_a_missing_task_is_recorded_as_error():
+    page = FakePage()
+    session = LoadSession(page, random.Random(1))
+    session.create()
+    page.tasks.clear()
+    session.search()
+    assert session.samples[1].error.startswith('TimeoutException: Message: Task not found by search')
+
+
+def test_seeded_sessions_create_the_same_tasks():
+    sessions = [LoadSession(FakePage(), random.Random(7)) for _ in range(2)]
+    for session in sessions:
+        for _ in range(3):
+            session.create()
+    assert sessions[0].page.tasks == sessions[1].page.tasks
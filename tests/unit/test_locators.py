@@ -0,0 +1,37 @@
+import pytest
+from src.common.locators import LocatorRegistry
+
+
+@pytest.mark.parametrize('xpath, css', [
+    ('//input', 'input'),
+    ('//ul/li', 'ul > li'),
+    ('//div//span', 'div span'),
+    ('//*', '*'),
+    ("//ul[@class='menu']/li", 'ul[class="menu"] > li'),
+    ("//div//span[@id='a-b']", 'div span[id="a-b"]'),
+    ("//*[@class='MuiChip-label css-1 ']", '*[class="MuiChip-label css-1 "]'),
+    ("//div[@class='a']//*", 'div[class="a"] *'),
+    ("//div[@class='']", 'div[class=""]'),
+])
+def test_compile_css(xpath, css):
+    assert LocatorRegistry.compile_css(xpath) == css
+
+
+@pytest.mark.parametrize('xpath', [
+    '',
+    '/html/body',
+    ' //div',
+    '(//input)[1]',
+    '//textarea[1]',
+    "//div[@class='a'][2]",
+    "//li[contains(., 'Work')]",
+    "//*[normalize-space(text()) = 'Create Task']",
+    "//h3[@name='title']",
+    '//div[@class="double-quoted"]',
+    '//button[@class=\'a"b\']',
+    '//ul/li/..',
+    '//ul/li/text()',
+    '//div|//span',
+])
+def test_compile_css_rejects_xpaths_without_css_equivalent(xpath):
+    assert LocatorRegistry.compile_css(xpath) is None
@@ -0,0 +1,188 @@
+import base64
+import os
+import threading
+import time
+import pytest
+import websocket
+from src.managers.network_interceptor import AssetCache, InterceptionRules, NetworkInterceptor, matches
+
+URL = 'https://cdn.example.com/app.js'
+
+
+class FakeConnection:
+    """
+    Stands in for the DevTools WebSocket: recv() blocks until the connection is closed.
+    """
+
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def recv(self):
+        self.closed.wait()
+        raise websocket.WebSocketConnectionClosedException('closed')
+
+    def send(self, payload):
+        if self.closed.is_set():
+            raise websocket.WebSocketConnectionClosedException('closed')
+
+    def close(self):
+        self.closed.set()
+
+
+@pytest.fixture
+def interceptor(tmp_path):
+    """
+    Provides an unconnected NetworkInterceptor caching into a temporary directory, whose DevTools commands are
+    recorded and answered by a fake call().
+    :return: The interceptor, with the sent (method, params) pairs in interceptor.calls.
+    """
+    rules = InterceptionRules(deny=('*://ads.example.com/*',), allow=('*://ads.example.com/keep/*',),
+                              cache=('*://cdn.example.com/*',), cache_dir=str(tmp_path / 'cache'))
+    interceptor = NetworkInterceptor('ws://devtools', rules)
+    interceptor.calls = []
+
+    def call(method, params=None):
+        interceptor.calls.append((method, params))
+        if method == 'Fetch.getResponseBody':
+            return {'body': base64.b64encode(b'fetched').decode('ascii'), 'base64Encoded': True}
+        return {}
+
+    interceptor.call = call
+    yield interceptor
+    interceptor.handlers.shutdown()
+
+
+def paused(url, **params):
+    """
+    Builds the parameters of a Fetch.requestPaused event.
+    :param url: The request URL.
+    :param params: Response stage parameters, e.g. responseStatusCode.
+    :return: The event parameters.
+    """
+    return {'requestId': 'r1', 'request': {'url': url}, **params}
+
+
+@pytest.mark.parametrize('url, patterns, expected', [
+    ('https://ads.example.com/banner.js', ('*://ads.example.com/*',), True),
+    ('http://ads.example.com/', ('*://ads.example.com/*',), True),
+    ('https://example.com/ads.example.com/', ('*://ads.example.com/*',), False),
+    ('https://cdn.example.com/a.js', ('*.css', '*.js'), True),
+    ('https://cdn.example.com/a.js?v=1', ('*.js',), False),
+    ('https://cdn.example.com/a1.js', ('*/a?.js',), True),
+    ('https://cdn.example.com/A.JS', ('*.js',), False),
+    ('https://cdn.example.com/a.js', (), False),
+])
+def test_matches(url, patterns, expected):
+    assert matches(url, patterns) is expected
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://ads.example.com/banner.js', True),
+    ('https://ads.example.com/keep/consent.js', False),
+    ('https://cdn.example.com/app.js', False),
+])
+def test_is_denied_unless_allowed(url, expected):
+    rules = InterceptionRules(deny=('*://ads.example.com/*',), allow=('*://ads.example.com/keep/*',))
+    assert rules.is_denied(url) is expected
+
+
+def test_asset_cache_round_trip(tmp_path):
+    cache = AssetCache(str(tmp_path / 'cache'))
+    assert cache.load(URL) is None
+    cache.store(URL, 200, [{'name': 'Content-Type', 'value': 'text/javascript'}], b'body')
+    assert cache.load(URL) == ({'url': URL, 'status': 200,
+                                'headers': [{'name': 'Content-Type', 'value': 'text/javascript'}]}, b'body')
+    assert sorted(os.listdir(tmp_path / 'cache')) == sorted(os.path.basename(cache.path(URL)) + extension
+                                                             for extension in ('.body', '.json'))
+
+
+def test_asset_cache_expires_entries(tmp_path):
+    cache = AssetCache(str(tmp_path), ttl_hours=1)
+    cache.store(URL, 200, [], b'body')
+    stale = time.time() - 3601
+    os.utime(f'{cache.path(URL)}.json', (stale, stale))
+    assert cache.load(URL) is None
+
+
+def test_asset_cache_ignores_unreadable_entries(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.store(URL, 200, [], b'body')
+    with open(f'{cache.path(URL)}.json', 'w') as file:
+        file.write('{')
+    assert cache.load(URL) is None
+    cache.store(URL, 200, [], b'body')
+    os.remove(f'{cache.path(URL)}.body')
+    assert cache.load(URL) is None
+
+
+def test_on_paused_blocks_denied_requests(interceptor):
+    interceptor._on_paused(paused('https://ads.example.com/banner.js'))
+    assert interceptor.calls == [('Fetch.failRequest', {'requestId': 'r1', 'errorReason': 'BlockedByClient'})]
+    assert interceptor.take_stats()['blocked_requests'] == 1
+
+
+def test_on_paused_continues_allowed_and_uncached_requests(interceptor):
+    interceptor._on_paused(paused('https://ads.example.com/keep/consent.js'))
+    interceptor._on_paused(paused(URL))
+    assert interceptor.calls == [('Fetch.continueRequest', {'requestId': 'r1'})] * 2
+    assert not any(interceptor.take_stats().values())
+
+
+def test_on_paused_serves_cached_assets(interceptor):
+    headers = [{'name': 'Content-Type', 'value': 'text/javascript'}]
+    interceptor.cache.store(URL, 200, headers, b'cached')
+    interceptor._on_paused(paused(URL))
+    assert interceptor.calls == [('Fetch.fulfillRequest', {
+        'requestId': 'r1', 'responseCode': 200, 'responseHeaders': headers,
+        'body': base64.b64encode(b'cached').decode('ascii')})]
+    stats = interceptor.take_stats()
+    assert (stats['served_requests'], stats['served_bytes']) == (1, 6)
+
+
+def test_on_paused_stores_fetched_assets(interceptor):
+    interceptor._on_paused(paused(URL, responseStatusCode=200, responseHeaders=[
+        {'name': 'Content-Type', 'value': 'text/javascript'}, {'name': 'Content-Length', 'value': '7'}]))
+    assert [method for method, _ in interceptor.calls] == ['Fetch.getResponseBody', 'Fetch.continueRequest']
+    assert interceptor.cache.load(URL) == ({'url': URL, 'status': 200,
+                                            'headers': [{'name': 'Content-Type', 'value': 'text/javascript'}]},
+                                           b'fetched')
+    stats = interceptor.take_stats()
+    assert (stats['cached_requests'], stats['cached_bytes']) == (1, 7)
+
+
+def test_on_paused_does_not_store_failed_responses(interceptor):
+    interceptor._on_paused(paused(URL, responseStatusCode=404))
+    assert interceptor.calls == [('Fetch.continueRequest', {'requestId': 'r1'})]
+    assert interceptor.cache.load(URL) is None
+
+
+def test_on_paused_ignores_requests_gone_with_the_page(interceptor):
+    def closed(method, params=None):
+        raise ConnectionError('DevTools connection closed')
+
+    interceptor.call = closed
+    interceptor._on_paused(paused('https://ads.example.com/banner.js'))
+    assert interceptor.take_stats()['blocked_requests'] == 0
+
+
+def test_stop_joins_the_reader_before_the_handlers(tmp_path):
+    interceptor = NetworkInterceptor('ws://devtools', InterceptionRules(cache_dir=str(tmp_path)))
+    interceptor.connection = FakeConnection()
+    interceptor.reader = threading.Thread(target=interceptor._read, daemon=True)
+    interceptor.reader.start()
+    interceptor.stop()
+    assert not interceptor.reader.is_alive()
+    with pytest.raises(RuntimeError):
+        interceptor.handlers.submit(print)
+    with pytest.raises(ConnectionError):
+        interceptor.call('Fetch.continueRequest', {'requestId': 'r1'})
+
+
+def test_call_on_a_closed_connection_fails_fast(tmp_path):
+    interceptor = NetworkInterceptor('ws://devtools', InterceptionRules(cache_dir=str(tmp_path)))
+    interceptor.connection = FakeConnection()
+    interceptor.connection.close()
+    with pytest.raises(ConnectionError):
+        interceptor.call('Fetch.continueRequest', {'requestId': 'r1'})
+    assert interceptor.pending == {}
+    interceptor.handlers.shutdown()
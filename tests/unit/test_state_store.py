@@ -0,0 +1,65 @@
+import gzip
+import json
+import os
+import pytest
+from src.common.state_store import RESTORE_STATE_SCRIPT, StateStore
+
+STATE = {'local': {'user': json.dumps({'tasks': [{'name': 'task-0'}]})}, 'session': {'tab': '1'}}
+
+
+class FakeDriver:
+    """
+    Records the scripts and reloads sent to it.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(('execute_script', script, args))
+        return STATE
+
+    def refresh(self):
+        self.calls.append(('refresh',))
+
+
+def test_save_writes_gzip_compressed_json(tmp_path):
+    StateStore(str(tmp_path)).save('tasks', STATE)
+    with gzip.open(tmp_path / 'tasks.json.gz', 'rt', encoding='utf-8') as file:
+        assert json.load(file) == STATE
+    assert os.listdir(tmp_path) == ['tasks.json.gz']
+
+
+def test_load_reads_snapshots_saved_by_another_store(tmp_path):
+    StateStore(str(tmp_path)).save('tasks', STATE)
+    store = StateStore(str(tmp_path))
+    assert store.exists('tasks')
+    assert store.load('tasks') == STATE
+
+
+def test_failed_save_keeps_the_previous_snapshot(tmp_path):
+    StateStore(str(tmp_path)).save('tasks', STATE)
+    with pytest.raises(TypeError):
+        StateStore(str(tmp_path)).save('tasks', {'local': {'user': object()}})
+    assert StateStore(str(tmp_path)).load('tasks') == STATE
+    assert os.listdir(tmp_path) == ['tasks.json.gz']
+
+
+def test_load_of_a_missing_snapshot_raises(tmp_path):
+    store = StateStore(str(tmp_path))
+    assert not store.exists('missing')
+    with pytest.raises(FileNotFoundError):
+        store.load('missing')
+
+
+@pytest.mark.parametrize('name', ['', '../escape', 'a/b', 'with space'])
+def test_invalid_snapshot_names_are_rejected(tmp_path, name):
+    with pytest.raises(ValueError):
+        StateStore(str(tmp_path)).path(name)
+
+
+def test_capture_and_apply_use_one_script_call():
+    driver = FakeDriver()
+    assert StateStore.capture(driver) == STATE
+    StateStore.apply(driver, STATE)
+    assert driver.calls[1:] == [('execute_script', RESTORE_STATE_SCRIPT, (STATE,)), ('refresh',)]
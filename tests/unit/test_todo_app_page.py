@@ -0,0 +1,52 @@
+import pytest
+from selenium.common import NoSuchElementException
+from src.pages.todo_app_page import TASK_OPTIONS_BUTTON_SCRIPT, TASKS_SNAPSHOT_SCRIPT, TodoAppPage
+
+
+class FakeButton:
+    """
+    Counts the clicks it receives.
+    """
+
+    def __init__(self):
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class FakeDriver:
+    """
+    Answers the task scripts of TodoAppPage with a fixed task list.
+    """
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.button = FakeButton()
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def execute_script(self, script, *args):
+        if script == TASKS_SNAPSHOT_SCRIPT:
+            return self.tasks
+        if script == TASK_OPTIONS_BUTTON_SCRIPT:
+            return self.button
+        raise AssertionError('Unexpected script')
+
+
+TASK = {'index': 0, 'name': 'task-0', 'description': 'description', 'category': 'Work'}
+
+
+def test_open_task_options_clicks_the_options_button_of_the_task():
+    driver = FakeDriver([TASK])
+    TodoAppPage(driver=driver).open_task_options(task_name='task-0')
+    assert driver.button.clicks == 1
+
+
+@pytest.mark.parametrize('method', ['open_task_options', 'delete_task'])
+def test_missing_task_raises_no_such_element(method):
+    driver = FakeDriver([TASK])
+    with pytest.raises(NoSuchElementException, match='Task not found: missing'):
+        getattr(TodoAppPage(driver=driver), method)(task_name='missing')
+    assert driver.button.clicks == 0